@@ -0,0 +1,141 @@
+"""
+Compare page weight and load time of the documentation UIs served by DocShield.
+
+Page weight is the HTML page plus every locally bundled asset it loads, raw and
+gzip-compressed. Server time is the mean time to render the HTML page through
+the protected route. Time-to-interactive needs a real browser: when Playwright
+is installed (``pip install playwright && playwright install chromium``) the
+script serves the app with uvicorn and reports DOMContentLoaded and load times
+from the Navigation Timing API.
+
+How to run:
+-----------
+   pip install -e .
+   python benchmarks/bench_renderers.py
+
+Author: George Khananaev
+"""
+
+import base64
+import gzip
+import re
+import statistics
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_docshield import DocShield, RapiDocRenderer
+
+CREDENTIALS = {"admin": "password123"}
+PAGES = {"Swagger UI": "/docs", "ReDoc": "/redoc", "RapiDoc": "/rapidoc"}
+PORT = 8766
+
+
+def create_app() -> FastAPI:
+    """Create a protected app serving every UI from local files."""
+    app = FastAPI(title="Renderer Benchmark")
+
+    for index in range(50):
+        @app.get(f"/items/{index}", tags=[f"group-{index % 5}"])
+        def read_item(item_id: int = 0, q: str = ""):
+            return {"item_id": item_id, "q": q}
+
+    DocShield(
+        app=app,
+        credentials=CREDENTIALS,
+        prefer_local=True,
+        renderers={"/rapidoc": RapiDocRenderer()},
+    )
+    return app
+
+
+def auth_headers():
+    """Create the HTTP Basic Auth header for the benchmark user."""
+    token = base64.b64encode(b"admin:password123").decode()
+    return {"Authorization": f"Basic {token}"}
+
+
+def page_weight(client: TestClient, path: str):
+    """Return (raw bytes, gzip bytes) of a page and its local assets."""
+    html = client.get(path, headers=auth_headers()).content
+    raw, compressed = len(html), len(gzip.compress(html))
+    for asset in re.findall(rb'(?:src|href)="(/docshield/static/[^"]+)"', html):
+        body = client.get(asset.decode()).content
+        raw += len(body)
+        compressed += len(gzip.compress(body))
+    return raw, compressed
+
+
+def server_time(client: TestClient, path: str, rounds: int = 200) -> float:
+    """Return the mean time in milliseconds to serve a page."""
+    headers = auth_headers()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        client.get(path, headers=headers)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(samples)
+
+
+def browser_timings(app: FastAPI):
+    """Return {name: (dom_content_loaded_ms, load_ms)} measured in Chromium, or None."""
+    try:
+        from playwright.sync_api import sync_playwright
+        import uvicorn
+    except ImportError:
+        return None
+
+    server = uvicorn.Server(uvicorn.Config(app, port=PORT, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    timings = {}
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch()
+            for name, path in PAGES.items():
+                context = browser.new_context(
+                    http_credentials={"username": "admin", "password": "password123"}
+                )
+                page = context.new_page()
+                page.goto(f"http://127.0.0.1:{PORT}{path}", wait_until="networkidle")
+                timing = page.evaluate(
+                    "() => { const t = performance.getEntriesByType('navigation')[0];"
+                    " return [t.domContentLoadedEventEnd, t.loadEventEnd]; }"
+                )
+                timings[name] = tuple(timing)
+                context.close()
+            browser.close()
+    finally:
+        server.should_exit = True
+        thread.join()
+    return timings
+
+
+def main():
+    app = create_app()
+    client = TestClient(app)
+
+    print(f"{'UI':<12}{'page weight':>14}{'gzipped':>12}{'server ms':>12}")
+    for name, path in PAGES.items():
+        raw, compressed = page_weight(client, path)
+        print(
+            f"{name:<12}{raw / 1024:>11.0f} KB{compressed / 1024:>9.0f} KB"
+            f"{server_time(client, path):>12.3f}"
+        )
+
+    timings = browser_timings(app)
+    if timings is None:
+        print("\nInstall playwright to measure time-to-interactive in a browser.")
+        return
+    print(f"\n{'UI':<12}{'DOMContentLoaded':>18}{'load':>10}")
+    for name, (dom_ready, loaded) in timings.items():
+        print(f"{name:<12}{dom_ready:>15.0f} ms{loaded:>7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
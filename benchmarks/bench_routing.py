@@ -0,0 +1,103 @@
+"""
+Measure the API routing overhead DocShield adds to a large application.
+
+Builds a FastAPI app with 1,000 API routes, protects it with DocShield in
+each serving mode, and times requests to the first, middle and last API
+route by calling the ASGI app directly (no network, no test client), so the
+numbers reflect routing and handler dispatch only. DocShield is installed
+before the API routes are registered, the worst case for the "routes" mode,
+whose documentation and asset routes then sit in front of every API route.
+
+How to run:
+-----------
+   pip install -e .
+   python benchmarks/bench_routing.py
+
+Author: George Khananaev
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Optional
+
+from fastapi import FastAPI
+
+from fastapi_docshield import DocShield
+
+ROUTE_COUNT = 1000
+ROUNDS = 2000
+TARGETS = {"first": "/items/0/1", "middle": f"/items/{ROUTE_COUNT // 2}/1", "last": f"/items/{ROUTE_COUNT - 1}/1"}
+
+
+def create_app(mode: Optional[str]) -> FastAPI:
+    """Create an app with ROUTE_COUNT routes, protected in the given mode (None for unprotected)."""
+    app = FastAPI(title="Routing Benchmark")
+    if mode is not None:
+        DocShield(app=app, credentials={"admin": "password123"}, mode=mode)
+
+    for index in range(ROUTE_COUNT):
+        @app.get(f"/items/{index}/{{item_id}}")
+        def read_item(item_id: int):
+            return {"item_id": item_id}
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> int:
+    """Send one GET request through the ASGI interface and return the status code."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app: FastAPI, path: str) -> float:
+    """Return the median request latency in microseconds."""
+    assert await call(app, path) == 200
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await call(app, path)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    print(f"API routing latency, {ROUTE_COUNT} routes, median of {ROUNDS} requests (microseconds)")
+    print(f"{'configuration':<24}" + "".join(f"{name:>10}" for name in TARGETS))
+    for label, mode in (
+        ("no DocShield", None),
+        ("mode='routes'", "routes"),
+        ("mode='mount'", "mount"),
+        ("mode='middleware'", "middleware"),
+    ):
+        app = create_app(mode)
+        results = [await measure(app, path) for path in TARGETS.values()]
+        print(f"{label:<24}" + "".join(f"{value:>10.1f}" for value in results))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
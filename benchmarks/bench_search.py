@@ -0,0 +1,71 @@
+"""
+Measure operation search over a large OpenAPI schema.
+
+Builds a FastAPI app with 1,400 operations spread over 70 tags, then reports
+the time to build the SearchIndex once and the median lookup time for a few
+typical queries, calling SearchIndex directly so the numbers exclude HTTP.
+
+How to run:
+-----------
+   pip install -e .
+   python benchmarks/bench_search.py
+
+Author: George Khananaev
+"""
+
+import statistics
+import time
+
+from fastapi import FastAPI
+
+from fastapi_docshield.search import SearchIndex
+
+OPERATION_COUNT = 1400
+TAG_COUNT = 70
+ROUNDS = 2000
+QUERIES = ["invoice", "get customer", "cust", "list orders by region", "nothing matches this"]
+
+
+def create_app() -> FastAPI:
+    """Create an app with OPERATION_COUNT documented operations."""
+    app = FastAPI(title="Search Benchmark")
+    resources = ["customer", "invoice", "order", "shipment", "product", "region", "payment"]
+
+    for index in range(OPERATION_COUNT):
+        resource = resources[index % len(resources)]
+        tag = f"area{index % TAG_COUNT}"
+
+        @app.get(
+            f"/{tag}/{resource}s/{index}/{{{resource}_id}}",
+            tags=[tag],
+            summary=f"Get {resource} {index}",
+            description=f"Returns one {resource} of {tag}, optionally filtered by region.",
+            operation_id=f"get{resource.title()}{index}",
+        )
+        def endpoint(region: str = ""):
+            return {}
+
+    return app
+
+
+def main() -> None:
+    schema = create_app().openapi()
+
+    start = time.perf_counter()
+    index = SearchIndex(schema)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Indexed {len(index.operations)} operations in {build_ms:.1f} ms")
+
+    print(f"{'query':<26}{'results':>10}{'median (us)':>14}")
+    for query in QUERIES:
+        results = index.search(query)
+        samples = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            index.search(query)
+            samples.append((time.perf_counter() - start) * 1_000_000)
+        print(f"{query!r:<26}{len(results):>10}{statistics.median(samples):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,44 @@ License: MIT License
 Copyright (c) 2025 George Khananaev
 """
 
-from .docshield import DocShield, __version__
+from .docshield import (
+    DocShield,
+    REDOC_PERFORMANCE_OPTIONS,
+    SWAGGER_UI_PERFORMANCE_PARAMETERS,
+    __version__,
+)
+from .authenticators import Authenticator, CachingAuthenticator, HTTPAuthenticator
+from .bearer import JWKSCache, JWTError, JWTVerifier
+from .credentials import HashedCredentials, hash_password, verify_password
+from .htpasswd import HtpasswdCredentials
+from .ipfilter import IPFilter
+from .ratelimit import RateLimiter
+from .renderers import DocRenderer, ElementsRenderer, RapiDocRenderer, ScalarRenderer
+from .views import SchemaView
 
 __version__ = __version__
 __author__ = "George Khananaev"
 __license__ = "MIT"
 __copyright__ = "Copyright (c) 2025 George Khananaev"
-__all__ = ["DocShield"]
\ No newline at end of file
+__all__ = [
+    "Authenticator",
+    "CachingAuthenticator",
+    "DocRenderer",
+    "DocShield",
+    "ElementsRenderer",
+    "HTTPAuthenticator",
+    "HashedCredentials",
+    "HtpasswdCredentials",
+    "IPFilter",
+    "JWKSCache",
+    "JWTError",
+    "JWTVerifier",
+    "RapiDocRenderer",
+    "RateLimiter",
+    "REDOC_PERFORMANCE_OPTIONS",
+    "SWAGGER_UI_PERFORMANCE_PARAMETERS",
+    "ScalarRenderer",
+    "SchemaView",
+    "hash_password",
+    "verify_password",
+]
\ No newline at end of file
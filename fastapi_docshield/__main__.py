@@ -0,0 +1,63 @@
+"""
+Command line interface for DocShield.
+
+Usage:
+    python -m fastapi_docshield export app:app out/
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import argparse
+import importlib
+import sys
+from typing import List, Optional
+
+from .docshield import DocShield
+
+
+def load_docshield(target: str) -> DocShield:
+    """
+    Import "module:attribute" and return the DocShield it refers to.
+
+    The attribute may be a DocShield instance or a FastAPI app protected by one.
+    """
+    module_name, _, attribute = target.partition(":")
+    if not module_name or not attribute:
+        raise SystemExit(f'Invalid target "{target}", expected "module:attribute"')
+
+    # Like uvicorn, import relative to the current directory
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+    obj = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+
+    if isinstance(obj, DocShield):
+        return obj
+    shield = getattr(getattr(obj, "state", None), "docshield", None)
+    if isinstance(shield, DocShield):
+        return shield
+    raise SystemExit(f'"{target}" is neither a DocShield nor an app protected by DocShield')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the DocShield command line interface."""
+    parser = argparse.ArgumentParser(prog="python -m fastapi_docshield")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export the documentation as a static site"
+    )
+    export_parser.add_argument("target", help='App or DocShield to export, as "module:attribute"')
+    export_parser.add_argument("output", help="Output directory")
+
+    args = parser.parse_args(argv)
+    if args.command == "export":
+        output = load_docshield(args.target).export(args.output)
+        print(f"Documentation exported to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+ASGI serving modes for DocShield.
+
+Instead of adding one route per documentation URL to the application,
+DocShield can serve everything from a small internal ASGI app: either from a
+middleware placed ahead of the router, or from a single route that matches
+the documentation and asset paths with one dictionary lookup. Authentication
+runs inline and cached bodies are written to ``send`` with precomputed
+headers, so neither FastAPI's dependency injection nor per-URL route matching
+is involved and the API routes are left untouched.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse
+from starlette.routing import BaseRoute, Match, NoMatchFound, Router
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .responses import DOCS_CACHE_CONTROL, CachedContent
+from .static_handler import STATIC_URL_PREFIX
+
+if TYPE_CHECKING:
+    from .docshield import DocShield
+
+
+def route_path(scope: Scope) -> str:
+    """Return the request path relative to the application's root path."""
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):] or "/"
+    return path
+
+
+async def send_http_exception(exc: HTTPException, scope: Scope, receive: Receive, send: Send) -> None:
+    """Answer with the same JSON error response FastAPI's default handler produces."""
+    response = JSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+    await response(scope, receive, send)
+
+
+class DocShieldApp:
+    """Serves DocShield's documentation pages, schema and assets as an ASGI app."""
+
+    def __init__(self, shield: "DocShield"):
+        """
+        Initialize the app.
+
+        Args:
+            shield: The DocShield instance whose endpoints and assets are served
+        """
+        self.shield = shield
+        # Endpoint content functions by path, with the shield (document) owning them
+        self.endpoints: Dict[str, Tuple["DocShield", Callable[[Request, str], CachedContent]]] = {}
+        # Functions serving every path below a prefix
+        self.prefix_endpoints: Dict[str, Tuple["DocShield", Callable[[Request, str], CachedContent]]] = {}
+        # Cleared by DocShield.uninstall; an installed middleware then passes everything through
+        self.active = True
+
+    def add(self, shield: "DocShield") -> None:
+        """Serve the endpoints of a DocShield instance or one of its documents."""
+        for path, get_content in shield.endpoints.items():
+            self.endpoints[path] = (shield, get_content)
+        for prefix, get_content in shield.prefix_endpoints.items():
+            self.prefix_endpoints[prefix] = (shield, get_content)
+
+    def remove(self, shield: "DocShield") -> None:
+        """Stop serving the endpoints of a DocShield instance or document."""
+        self.endpoints = {path: entry for path, entry in self.endpoints.items() if entry[0] is not shield}
+        self.prefix_endpoints = {
+            prefix: entry for prefix, entry in self.prefix_endpoints.items() if entry[0] is not shield
+        }
+
+    def find_endpoint(self, path: str) -> Optional[Tuple["DocShield", Callable[[Request, str], CachedContent]]]:
+        """Return the endpoint serving a path and its owner, if any."""
+        endpoint = self.endpoints.get(path)
+        if endpoint is None and self.prefix_endpoints:
+            for prefix, entry in self.prefix_endpoints.items():
+                if path.startswith(prefix):
+                    return entry
+        return endpoint
+
+    def handles(self, scope: Scope) -> bool:
+        """Return True if the request is for a documentation endpoint or asset."""
+        if not self.active or scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            return False
+        path = route_path(scope)
+        if self.find_endpoint(path) is not None:
+            return True
+        static_handler = self.shield.static_handler
+        return (
+            static_handler is not None
+            and path.startswith(STATIC_URL_PREFIX)
+            and static_handler.get_asset(path) is not None
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = route_path(scope)
+        request = Request(scope, receive)
+
+        endpoint = self.find_endpoint(path)
+        if endpoint is not None:
+            shield, get_content = endpoint
+            try:
+                username = await shield._authenticate(request)
+                content = await shield._get_endpoint_content(get_content, request, username)
+            except HTTPException as exc:
+                await send_http_exception(exc, scope, receive, send)
+                return
+            await content.send(
+                scope, send, DOCS_CACHE_CONTROL, shield._session_headers(request, username)
+            )
+            return
+
+        static_handler = self.shield.static_handler
+        asset = static_handler.get_asset(path) if static_handler else None
+        if asset is None:
+            await send_http_exception(HTTPException(status_code=404, detail="Not Found"), scope, receive, send)
+            return
+        try:
+            await static_handler.check_access(request)
+        except HTTPException as exc:
+            await send_http_exception(exc, scope, receive, send)
+            return
+        content, cache_control = asset
+        await content.send(scope, send, cache_control)
+
+
+class DocShieldMiddleware:
+    """Serves the documentation ahead of the router (``mode="middleware"``)."""
+
+    def __init__(self, app: ASGIApp, docs_app: DocShieldApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            docs_app: The app serving the documentation
+        """
+        self.app = app
+        self.docs_app = docs_app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.docs_app.handles(scope):
+            await self.docs_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+class DocShieldRoute(BaseRoute):
+    """
+    A single router entry dispatching every documentation URL (``mode="mount"``).
+
+    Matching is one dictionary lookup however many documentation URLs and
+    assets there are. The route is appended last and yields to any route
+    added after it that also fully matches, so API routes always take
+    precedence over the documentation, whenever they were added.
+    """
+
+    def __init__(self, docs_app: DocShieldApp, router: Router):
+        """
+        Initialize the route.
+
+        Args:
+            docs_app: The app serving the documentation
+            router: The router this route is appended to
+        """
+        self.app = docs_app
+        self.router = router
+        self.path = ""
+        self.name = "docshield"
+        self.include_in_schema = False
+
+    def matches(self, scope: Scope) -> Tuple[Match, Dict[str, Any]]:
+        if not self.app.handles(scope):
+            return Match.NONE, {}
+        # Act as the last route: nothing to check while it still is
+        for route in reversed(self.router.routes):
+            if route is self:
+                break
+            if route.matches(scope)[0] == Match.FULL:
+                return Match.NONE, {}
+        return Match.FULL, {}
+
+    def url_path_for(self, name: str, **path_params: Any):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
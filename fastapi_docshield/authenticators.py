@@ -0,0 +1,198 @@
+"""
+Pluggable asynchronous authenticators for DocShield.
+
+Any object with an ``async authenticate(username, password) -> bool`` method
+can be passed as DocShield's ``credentials``. This module defines that
+protocol, a caching wrapper that remembers results and coalesces identical
+concurrent checks, and an authenticator that asks an HTTP user directory
+through a pooled client.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+from typing import Dict, Optional, Protocol, runtime_checkable
+
+from .cache import TTLCache
+
+
+@runtime_checkable
+class Authenticator(Protocol):
+    """Checks a username and password, e.g. against a user directory."""
+
+    async def authenticate(self, username: str, password: str) -> bool:
+        """Return True if the credentials are valid."""
+        ...
+
+
+class CachingAuthenticator:
+    """
+    Wraps an authenticator with result caching and request coalescing.
+
+    Successful and failed checks are cached separately, each with its own TTL
+    and size bound, under an HMAC of the submitted credentials. Identical
+    checks arriving while one is in flight wait for that check instead of
+    reaching the backend again. Backend errors are never cached.
+    """
+
+    def __init__(
+        self,
+        backend: Authenticator,
+        positive_ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        max_size: int = 1024,
+    ):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            backend: The authenticator doing the actual check
+            positive_ttl: Seconds a successful check stays cached
+            negative_ttl: Seconds a failed check stays cached (0 disables)
+            max_size: Maximum number of cached results of each kind
+        """
+        self.backend = backend
+        self.positive_cache = TTLCache(max_size=max_size, ttl=positive_ttl)
+        self.negative_cache = TTLCache(max_size=max_size, ttl=negative_ttl)
+        self._inflight: Dict[bytes, "asyncio.Future[bool]"] = {}
+        self._cache_secret = secrets.token_bytes(32)
+
+    def cache_key(self, username: str, password: str) -> bytes:
+        """Return the keyed digest identifying a username/password pair."""
+        message = f"{username}\x00{password}".encode("utf-8")
+        return hmac.new(self._cache_secret, message, hashlib.sha256).digest()
+
+    async def authenticate(self, username: str, password: str) -> bool:
+        """Return the cached result, or check with the backend once for all waiters."""
+        key = self.cache_key(username, password)
+        if self.positive_cache.get(key):
+            return True
+        if self.negative_cache.get(key):
+            return False
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._check(key, username, password))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled waiter does not cancel the check for the others
+        return await asyncio.shield(future)
+
+    async def _check(self, key: bytes, username: str, password: str) -> bool:
+        valid = await self.backend.authenticate(username, password)
+        if valid:
+            self.positive_cache.set(key, True)
+        elif self.negative_cache.ttl > 0:
+            self.negative_cache.set(key, True)
+        return valid
+
+    def clear_cache(self) -> None:
+        """Forget all cached results."""
+        self.positive_cache.clear()
+        self.negative_cache.clear()
+
+
+class HTTPAuthenticator:
+    """
+    Checks credentials against an HTTP endpoint of a user directory.
+
+    The submitted credentials are forwarded as HTTP Basic Auth to ``url``: a
+    2xx response accepts them, 401 and 403 reject them and anything else is
+    raised as an error. Requests share a keep-alive connection pool. Wrap it
+    in CachingAuthenticator to avoid a round trip per documentation request.
+    Requires the httpx package.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "GET",
+        timeout: float = 5.0,
+        max_connections: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the HTTP authenticator.
+
+        Args:
+            url: Endpoint that validates Basic Auth credentials
+            method: HTTP method used for the check
+            timeout: Request timeout in seconds
+            max_connections: Size of the connection pool
+            headers: Extra headers sent with every check, e.g. an API key
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "The httpx package is required for HTTPAuthenticator: pip install httpx"
+            ) from None
+        self._httpx = httpx
+        self.url = url
+        self.method = method
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.headers = headers or {}
+        self._client = None
+        self._client_loop = None
+
+    async def _get_client(self):
+        """Return the pooled client, replacing it when the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+        stale, stale_loop = self._client, self._client_loop
+        # Swap before awaiting, so concurrent checks share the new client
+        self._client = self._httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self.headers,
+            limits=self._httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        self._client_loop = loop
+        if stale is not None:
+            await self._close_stale_client(stale, stale_loop)
+        return self._client
+
+    @staticmethod
+    async def _close_stale_client(client, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a client created in another event loop."""
+        if loop.is_running():
+            # Its connections belong to that loop, so close them there
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            await client.aclose()
+        except RuntimeError:
+            # Connections of a closed loop cannot be shut down gracefully
+            pass
+
+    async def authenticate(self, username: str, password: str) -> bool:
+        """Ask the user directory whether the credentials are valid."""
+        client = await self._get_client()
+        response = await client.request(
+            self.method, self.url, auth=(username, password)
+        )
+        if response.status_code in (401, 403):
+            return False
+        response.raise_for_status()
+        return True
+
+    async def aclose(self) -> None:
+        """Close the pooled client."""
+        client, loop = self._client, self._client_loop
+        if client is None:
+            return
+        self._client = None
+        self._client_loop = None
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            await self._close_stale_client(client, loop)
@@ -0,0 +1,322 @@
+"""
+Bearer/JWT authentication for DocShield.
+
+Verifies HS256, RS256 and ES256 JSON Web Tokens issued by an SSO gateway.
+Public keys come from a JWKS document (a local file or URL), cached by key
+id and refreshed when a token names an unknown key, at most once per minimum
+refresh interval. Validated claims are cached per token until it expires, so
+the signature is checked once rather than on every page, schema and asset
+request. RS256 and ES256 need the cryptography package.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from .cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Key type expected for each supported algorithm
+ALGORITHM_KEY_TYPES = {"HS256": "oct", "RS256": "RSA", "ES256": "EC"}
+
+
+class JWTError(ValueError):
+    """Raised when a token is malformed, unsigned, expired or otherwise invalid."""
+
+
+def _b64url_decode(data: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    except ValueError:
+        raise JWTError("Invalid base64url encoding") from None
+
+
+def _b64url_int(data: str) -> int:
+    return int.from_bytes(_b64url_decode(data), "big")
+
+
+def _import_cryptography():
+    """Import the optional cryptography package with a helpful error message."""
+    try:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+        from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+    except ImportError:
+        raise ImportError(
+            "The cryptography package is required for RS256/ES256 tokens: pip install cryptography"
+        ) from None
+    return InvalidSignature, hashes, ec, padding, rsa, encode_dss_signature
+
+
+def load_jwk(jwk: Dict[str, Any]) -> Any:
+    """
+    Convert a JSON Web Key into a key usable by verify_signature.
+
+    Args:
+        jwk: A single key of a JWKS document
+
+    Returns:
+        The secret bytes of an "oct" key, or a cryptography public key
+    """
+    kty = jwk.get("kty")
+    if kty == "oct":
+        return _b64url_decode(jwk["k"])
+    _, _, ec, _, rsa, _ = _import_cryptography()
+    if kty == "RSA":
+        return rsa.RSAPublicNumbers(_b64url_int(jwk["e"]), _b64url_int(jwk["n"])).public_key()
+    if kty == "EC":
+        if jwk.get("crv") != "P-256":
+            raise JWTError(f"Unsupported EC curve: {jwk.get('crv')}")
+        return ec.EllipticCurvePublicNumbers(
+            _b64url_int(jwk["x"]), _b64url_int(jwk["y"]), ec.SECP256R1()
+        ).public_key()
+    raise JWTError(f"Unsupported key type: {kty}")
+
+
+def verify_signature(algorithm: str, key: Any, signing_input: bytes, signature: bytes) -> bool:
+    """Check a JWS signature made with HS256, RS256 or ES256."""
+    if algorithm == "HS256":
+        expected = hmac.new(key, signing_input, hashlib.sha256).digest()
+        return hmac.compare_digest(expected, signature)
+    InvalidSignature, hashes, ec, padding, _, encode_dss_signature = _import_cryptography()
+    try:
+        if algorithm == "RS256":
+            key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+            return True
+        if algorithm == "ES256":
+            if len(signature) != 64:
+                return False
+            der = encode_dss_signature(
+                int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:], "big")
+            )
+            key.verify(der, signing_input, ec.ECDSA(hashes.SHA256()))
+            return True
+    except (InvalidSignature, TypeError, ValueError):
+        return False
+    raise JWTError(f"Unsupported algorithm: {algorithm}")
+
+
+class JWKSCache:
+    """
+    Keys of a JWKS document, indexed by key id.
+
+    The document is loaded once; a token naming an unknown key id triggers a
+    reload, but never more often than ``min_refresh_interval`` seconds, so
+    tokens with made-up key ids cannot hammer the key server.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path, Dict[str, Any]],
+        min_refresh_interval: float = 60.0,
+        timeout: float = 5.0,
+    ):
+        """
+        Initialize the key cache.
+
+        Args:
+            source: JWKS URL (http/https), local file path, or an already
+                loaded JWKS document
+            min_refresh_interval: Minimum seconds between reloads
+            timeout: Timeout in seconds for fetching a JWKS URL
+        """
+        self.source = source
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self.keys: Dict[Optional[str], List[Tuple[Optional[str], str, Any]]] = {}
+        self._last_refresh: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+
+    def _load_document(self) -> Dict[str, Any]:
+        if isinstance(self.source, dict):
+            return self.source
+        source = str(self.source)
+        if source.startswith(("http://", "https://")):
+            with urllib.request.urlopen(source, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        return json.loads(Path(source).read_text(encoding="utf-8"))
+
+    def refresh(self) -> None:
+        """Reload the JWKS document and rebuild the key index."""
+        keys: Dict[Optional[str], List[Tuple[Optional[str], str, Any]]] = {}
+        for jwk in self._load_document().get("keys", []):
+            if jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                key = load_jwk(jwk)
+            except (JWTError, KeyError):
+                # Skip keys of unsupported types rather than rejecting the set
+                continue
+            keys.setdefault(jwk.get("kid"), []).append((jwk.get("alg"), jwk["kty"], key))
+        self.keys = keys
+
+    def _refresh_if_due(self) -> None:
+        with self._refresh_lock:
+            now = time.monotonic()
+            if self._last_refresh is not None and now - self._last_refresh < self.min_refresh_interval:
+                return
+            self._last_refresh = now
+            try:
+                self.refresh()
+            except (OSError, ValueError) as exc:
+                # Keep the last good key set, e.g. while the key server is down
+                logger.warning(f"Failed to load JWKS from {self.source}: {exc}")
+
+    def _candidates(self, kid: Optional[str], algorithm: str) -> List[Any]:
+        entries = self.keys.get(kid, []) if kid is not None else [
+            entry for entries in self.keys.values() for entry in entries
+        ]
+        return [
+            key for alg, kty, key in entries
+            if kty == ALGORITHM_KEY_TYPES[algorithm] and alg in (None, algorithm)
+        ]
+
+    async def get_keys(self, kid: Optional[str], algorithm: str) -> List[Any]:
+        """
+        Return the keys that may have signed a token.
+
+        Args:
+            kid: The token's key id, if any
+            algorithm: The token's signing algorithm
+
+        Returns:
+            Matching keys, reloading the document first if none are known
+        """
+        keys = self._candidates(kid, algorithm)
+        if not keys:
+            await run_in_threadpool(self._refresh_if_due)
+            keys = self._candidates(kid, algorithm)
+        return keys
+
+
+class JWTVerifier:
+    """
+    Validates Bearer tokens and caches their claims until expiry.
+
+    Pass an instance as DocShield's ``jwt_verifier``. The ``sub`` claim
+    becomes the authenticated username.
+    """
+
+    def __init__(
+        self,
+        jwks: Optional[Union[str, Path, Dict[str, Any], JWKSCache]] = None,
+        secret: Optional[Union[str, bytes]] = None,
+        algorithms: Sequence[str] = ("RS256", "ES256"),
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        leeway: float = 0.0,
+        cache_size: int = 1024,
+        max_cache_ttl: float = 3600.0,
+    ):
+        """
+        Initialize the verifier.
+
+        Args:
+            jwks: JWKS URL, file path, document or JWKSCache holding the keys
+            secret: Shared HS256 secret, used for tokens without a JWKS key
+            algorithms: Accepted signing algorithms (HS256, RS256, ES256)
+            issuer: Required "iss" claim, if set
+            audience: Required "aud" claim, if set
+            leeway: Seconds of clock skew tolerated for "exp" and "nbf"
+            cache_size: Maximum number of cached validated tokens
+            max_cache_ttl: Upper bound on how long claims stay cached, also
+                used for tokens without an "exp" claim
+        """
+        unsupported = set(algorithms) - set(ALGORITHM_KEY_TYPES)
+        if unsupported:
+            raise ValueError(f"Unsupported JWT algorithms: {', '.join(sorted(unsupported))}")
+        if jwks is None and secret is None:
+            raise ValueError("JWTVerifier needs a JWKS source or a shared secret")
+        self.jwks = jwks if jwks is None or isinstance(jwks, JWKSCache) else JWKSCache(jwks)
+        self.secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+        self.algorithms = tuple(algorithms)
+        self.issuer = issuer
+        self.audience = audience
+        self.leeway = leeway
+        self.max_cache_ttl = max_cache_ttl
+        self.cache = TTLCache(max_size=cache_size, ttl=max_cache_ttl)
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Validate a token and return its claims.
+
+        Args:
+            token: The compact JWS from the Authorization header
+
+        Returns:
+            The token's claims
+
+        Raises:
+            JWTError: If the token is invalid
+        """
+        cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+        claims = self.cache.get(cache_key)
+        if claims is not None:
+            # Cached entries expire together with the token
+            return claims
+
+        try:
+            encoded_header, encoded_payload, encoded_signature = token.split(".")
+            header = json.loads(_b64url_decode(encoded_header))
+            claims = json.loads(_b64url_decode(encoded_payload))
+        except (ValueError, UnicodeDecodeError):
+            raise JWTError("Malformed token") from None
+        if not isinstance(header, dict) or not isinstance(claims, dict):
+            raise JWTError("Malformed token")
+
+        algorithm = header.get("alg")
+        if algorithm not in self.algorithms:
+            raise JWTError(f"Algorithm not allowed: {algorithm}")
+
+        keys = []
+        if self.jwks is not None:
+            keys = await self.jwks.get_keys(header.get("kid"), algorithm)
+        if not keys and algorithm == "HS256" and self.secret is not None:
+            keys = [self.secret]
+        signing_input = f"{encoded_header}.{encoded_payload}".encode("ascii")
+        signature = _b64url_decode(encoded_signature)
+        if not any(verify_signature(algorithm, key, signing_input, signature) for key in keys):
+            raise JWTError("Invalid signature")
+
+        self._check_time_claims(claims)
+        if self.issuer is not None and claims.get("iss") != self.issuer:
+            raise JWTError("Invalid issuer")
+        if self.audience is not None:
+            audience = claims.get("aud")
+            audiences = audience if isinstance(audience, list) else [audience]
+            if self.audience not in audiences:
+                raise JWTError("Invalid audience")
+
+        ttl = self.max_cache_ttl
+        if "exp" in claims:
+            ttl = min(ttl, float(claims["exp"]) + self.leeway - time.time())
+        if ttl > 0:
+            self.cache.set(cache_key, claims, ttl=ttl)
+        return claims
+
+    def _check_time_claims(self, claims: Dict[str, Any]) -> None:
+        try:
+            expires_at = float(claims.get("exp", "inf"))
+            not_before = float(claims.get("nbf", "-inf"))
+        except (TypeError, ValueError):
+            raise JWTError("Invalid time claim") from None
+        now = time.time()
+        if now > expires_at + self.leeway:
+            raise JWTError("Token expired")
+        if now < not_before - self.leeway:
+            raise JWTError("Token not yet valid")
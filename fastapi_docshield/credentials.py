@@ -0,0 +1,219 @@
+"""
+Hashed credential verification for DocShield.
+
+Plaintext passwords in the ``credentials`` dict can be replaced with password
+hashes (scrypt, PBKDF2, bcrypt or argon2). Hash checks are deliberately slow,
+so they run in a worker thread and successful verifications are remembered in
+a bounded cache: only the first request of a session pays the KDF cost.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+from typing import Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from .cache import TTLCache
+
+# scrypt cost parameters used by hash_password
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# PBKDF2-SHA256 iteration count used by hash_password
+PBKDF2_ITERATIONS = 600_000
+
+# Prefixes of the hash formats verify_password understands
+HASH_PREFIXES = ("scrypt$", "pbkdf2_sha256$", "$2a$", "$2b$", "$2y$", "$argon2")
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+def hash_password(password: str, scheme: str = "scrypt") -> str:
+    """
+    Hash a password for use with HashedCredentials.
+
+    Args:
+        password: The plaintext password
+        scheme: One of "scrypt", "pbkdf2_sha256", "bcrypt" or "argon2";
+            bcrypt and argon2 need the bcrypt / argon2-cffi packages
+
+    Returns:
+        The encoded hash, e.g. "scrypt$16384$8$1$<salt>$<hash>"
+    """
+    salt = secrets.token_bytes(16)
+    if scheme == "scrypt":
+        digest = hashlib.scrypt(
+            password.encode("utf-8"), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=32
+        )
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64encode(salt)}${_b64encode(digest)}"
+    if scheme == "pbkdf2_sha256":
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, PBKDF2_ITERATIONS)
+        return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64encode(salt)}${_b64encode(digest)}"
+    if scheme == "bcrypt":
+        bcrypt = _import_optional("bcrypt", "bcrypt")
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
+    if scheme == "argon2":
+        argon2 = _import_optional("argon2", "argon2-cffi")
+        return argon2.PasswordHasher().hash(password)
+    raise ValueError(f"Unsupported password hash scheme: {scheme}")
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    """
+    Check a password against an encoded hash.
+
+    Args:
+        password: The plaintext password
+        encoded: A hash produced by hash_password (or a compatible tool)
+
+    Returns:
+        True if the password matches
+    """
+    try:
+        if encoded.startswith("scrypt$"):
+            _, n, r, p, salt, expected = encoded.split("$")
+            expected_bytes = _b64decode(expected)
+            digest = hashlib.scrypt(
+                password.encode("utf-8"),
+                salt=_b64decode(salt),
+                n=int(n),
+                r=int(r),
+                p=int(p),
+                dklen=len(expected_bytes),
+                maxmem=256 * int(n) * int(r) * int(p) + 2 ** 20,
+            )
+            return hmac.compare_digest(digest, expected_bytes)
+        if encoded.startswith("pbkdf2_sha256$"):
+            _, iterations, salt, expected = encoded.split("$")
+            digest = hashlib.pbkdf2_hmac(
+                "sha256", password.encode("utf-8"), _b64decode(salt), int(iterations)
+            )
+            return hmac.compare_digest(digest, _b64decode(expected))
+        if encoded.startswith(("$2a$", "$2b$", "$2y$")):
+            bcrypt = _import_optional("bcrypt", "bcrypt")
+            return bcrypt.checkpw(password.encode("utf-8"), encoded.encode("ascii"))
+        if encoded.startswith("$argon2"):
+            argon2 = _import_optional("argon2", "argon2-cffi")
+            try:
+                return argon2.PasswordHasher().verify(encoded, password)
+            except argon2.exceptions.VerificationError:
+                return False
+    except (ValueError, TypeError):
+        # Malformed hash
+        return False
+    raise ValueError("Unsupported password hash format")
+
+
+def _import_optional(module: str, package: str):
+    """Import an optional dependency with a helpful error message."""
+    try:
+        return __import__(module)
+    except ImportError:
+        raise ImportError(
+            f"The {package} package is required for this hash scheme: pip install {package}"
+        ) from None
+
+
+class HashedCredentials:
+    """
+    Credentials stored as password hashes, with a cache of successful checks.
+
+    Pass an instance as DocShield's ``credentials`` instead of a plaintext dict.
+    Successful verifications are cached under an HMAC of the submitted
+    username and password (the decoded Authorization header) keyed with a
+    per-process secret, so the cache never holds the plaintext password.
+    """
+
+    def __init__(
+        self,
+        credentials: Dict[str, str],
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+    ):
+        """
+        Initialize hashed credentials.
+
+        Args:
+            credentials: Dictionary of username:password-hash pairs
+            cache_size: Maximum number of cached successful verifications
+            cache_ttl: Seconds a successful verification stays cached
+
+        Raises:
+            ValueError: If a stored value is not in a supported hash format,
+                e.g. a plaintext password
+        """
+        unsupported = sorted(
+            username for username, encoded in credentials.items() if not self.supports_hash(encoded)
+        )
+        if unsupported:
+            raise ValueError(
+                f"Unsupported password hash format for: {', '.join(unsupported)}; "
+                "create hashes with hash_password()"
+            )
+        self.credentials = credentials
+        self.cache = TTLCache(max_size=cache_size, ttl=cache_ttl)
+        self._cache_secret = secrets.token_bytes(32)
+
+    def supports_hash(self, encoded: str) -> bool:
+        """Return True if verify_hash understands a stored value."""
+        return isinstance(encoded, str) and encoded.startswith(HASH_PREFIXES)
+
+    def get_hash(self, username: str) -> Optional[str]:
+        """Return the stored password hash for a username."""
+        return self.credentials.get(username)
+
+    def cache_key(self, username: str, password: str) -> bytes:
+        """Return the keyed digest identifying a username/password pair."""
+        message = f"{username}\x00{password}".encode("utf-8")
+        return hmac.new(self._cache_secret, message, hashlib.sha256).digest()
+
+    def verify_hash(self, password: str, encoded: str) -> bool:
+        """Check a password against a stored hash; runs in a worker thread."""
+        return verify_password(password, encoded)
+
+    async def authenticate(self, username: str, password: str) -> bool:
+        """
+        Check a username and password.
+
+        Args:
+            username: The submitted username
+            password: The submitted password
+
+        Returns:
+            True if the credentials are valid
+        """
+        encoded = self.get_hash(username)
+        key = self.cache_key(username, password)
+
+        # A cached success only counts while the stored hash is unchanged
+        if encoded is not None and self.cache.get(key) == encoded:
+            return True
+
+        if encoded is None:
+            # Unknown user: still pay for one hash check so timing reveals nothing
+            decoy = next(iter(self.credentials.values()), None)
+            if decoy is not None:
+                await run_in_threadpool(self.verify_hash, password, decoy)
+            return False
+
+        valid = await run_in_threadpool(self.verify_hash, password, encoded)
+        if valid:
+            self.cache.set(key, encoded)
+        return valid
+
+    def clear_cache(self) -> None:
+        """Forget all cached verifications."""
+        self.cache.clear()
@@ -8,13 +8,79 @@ Copyright (c) 2025 George Khananaev
 
 __version__ = "0.2.1"
 
-from typing import Dict, Optional
-from fastapi import FastAPI, HTTPException, status, Depends
-from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from fastapi import APIRouter, FastAPI, HTTPException, Request, Response, status
+from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from fastapi.responses import HTMLResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware import Middleware
+from starlette.routing import BaseRoute, compile_path
+import copy
+import hashlib
+import hmac
+import json
+import logging
+import math
 import secrets
-from .static_handler import StaticHandler
+from .asgi import DocShieldApp, DocShieldMiddleware, DocShieldRoute, route_path
+from .authenticators import Authenticator
+from .bearer import JWTError, JWTVerifier
+from .cache import TTLCache
+from .documents import RouteSelector, generate_openapi
+from .export import export_docs
+from .fragments import FRAGMENT_KINDS, SchemaFragments
+from .history import SchemaHistory
+from .ipfilter import IPFilter
+from .live import EventStream, SchemaBroadcaster
+from .mounts import MountedSchemas, merge_schemas
+from .renderers import DocRenderer
+from .responses import DOCS_CACHE_CONTROL, CachedContent, json_content
+from .ratelimit import RateLimiter
+from .search import SearchIndex
+from .session import SessionSigner
+from .slim import LITE_STRIP_FIELDS, slim_schema, wants_lite
+from .views import SchemaView
+from .static_handler import StaticHandler, REDOC_FONTS_CDN_URL, REDOC_JS_CDN_URL
+
+logger = logging.getLogger(__name__)
+
+
+# Swagger UI parameters that keep very large specs responsive: operations and
+# models start collapsed and response bodies are not syntax highlighted.
+SWAGGER_UI_PERFORMANCE_PARAMETERS: Dict[str, Any] = {
+    "docExpansion": "none",
+    "defaultModelsExpandDepth": -1,
+    "syntaxHighlight": False,
+}
+
+# ReDoc options that keep very large specs responsive: operations are rendered
+# lazily, responses start collapsed and samples are shallow.
+REDOC_PERFORMANCE_OPTIONS: Dict[str, Any] = {
+    "lazyRendering": True,
+    "expandResponses": "",
+    "jsonSampleExpandLevel": 1,
+}
+
+# Swagger UI configuration DocShield uses unless overridden (mirrors FastAPI)
+SWAGGER_UI_DEFAULT_PARAMETERS: Dict[str, Any] = {
+    "dom_id": "#swagger-ui",
+    "layout": "BaseLayout",
+    "deepLinking": True,
+    "showExtensions": True,
+    "showCommonExtensions": True,
+}
+
+
+# Settings reconfigure() applies in place, grouped by the cached content they affect;
+# the remaining ones except those forcing a reinstall only affect authentication
+_URL_SETTINGS = frozenset({"docs_url", "redoc_url", "openapi_url"})
+_PAGE_SETTINGS = frozenset({
+    "swagger_js_url", "swagger_css_url", "redoc_js_url", "use_cdn_fallback", "prefer_local",
+    "custom_css", "custom_js", "swagger_ui_parameters", "redoc_options", "max_inline_custom_size",
+})
+_SCHEMA_SETTINGS = frozenset({"roles", "user_roles", "default_role", "include_mounts", "lite_schema", "lite_strip_fields", "schema_history"})
+_REINSTALL_SETTINGS = frozenset({"mode", "renderers", "schema_fragments", "schema_search", "search_box", "live_reload"})
 
 
 class DocShield:
@@ -31,7 +97,7 @@ class DocShield:
     def __init__(
         self,
         app: FastAPI,
-        credentials: Dict[str, str],
+        credentials: Optional[Union[Dict[str, str], Authenticator]] = None,
         docs_url: str = "/docs",
         redoc_url: str = "/redoc",
         openapi_url: str = "/openapi.json",
@@ -42,13 +108,41 @@ class DocShield:
         prefer_local: bool = False,
         custom_css: Optional[str] = None,
         custom_js: Optional[str] = None,
+        swagger_ui_parameters: Optional[Dict[str, Any]] = None,
+        redoc_options: Optional[Dict[str, Any]] = None,
+        renderers: Optional[Dict[str, DocRenderer]] = None,
+        max_inline_custom_size: Optional[int] = None,
+        session_cookie: bool = False,
+        session_secret: Optional[Union[str, bytes]] = None,
+        session_max_age: int = 900,
+        protect_static: bool = False,
+        rate_limit: Optional[Union[RateLimiter, Dict[str, RateLimiter]]] = None,
+        jwt_verifier: Optional[JWTVerifier] = None,
+        ip_filter: Optional[IPFilter] = None,
+        mode: str = "routes",
+        roles: Optional[Dict[str, SchemaView]] = None,
+        user_roles: Optional[Dict[str, str]] = None,
+        auth_cache_size: int = 1024,
+        auth_cache_ttl: float = 60.0,
+        include_mounts: bool = False,
+        schema_fragments: bool = False,
+        schema_search: bool = False,
+        search_box: bool = False,
+        lite_schema: bool = False,
+        lite_strip_fields: Iterable[str] = LITE_STRIP_FIELDS,
+        schema_history: int = 0,
+        live_reload: bool = False,
+        default_role: Optional[str] = None,
     ):
         """
         Initialize DocShield with the given FastAPI application and credentials.
         
         Args:
             app: The FastAPI application instance to protect
-            credentials: Dictionary of username:password pairs for authentication
+            credentials: Dictionary of username:password pairs for authentication,
+                or an Authenticator such as HashedCredentials, HtpasswdCredentials
+                or CachingAuthenticator(HTTPAuthenticator(...)); may be omitted
+                when jwt_verifier is given
             docs_url: URL path for Swagger UI documentation
             redoc_url: URL path for ReDoc documentation
             openapi_url: URL path for OpenAPI JSON schema
@@ -59,7 +153,85 @@ class DocShield:
             prefer_local: Prefer local static files over CDN
             custom_css: Custom CSS to inject into documentation pages
             custom_js: Custom JavaScript to inject into documentation pages
+            swagger_ui_parameters: Extra SwaggerUIBundle configuration, e.g.
+                SWAGGER_UI_PERFORMANCE_PARAMETERS for very large specs
+            redoc_options: ReDoc options passed to Redoc.init, e.g.
+                REDOC_PERFORMANCE_OPTIONS for very large specs
+            renderers: Additional documentation UIs keyed by URL path,
+                e.g. {"/rapidoc": RapiDocRenderer()}
+            max_inline_custom_size: custom_css/custom_js larger than this many
+                bytes are served as separately cached, content-hashed files
+                instead of being inlined into every page (default: always inline)
+            session_cookie: Issue a signed, HttpOnly session cookie after a
+                successful login so later requests skip credential verification
+            session_secret: Key signing session cookies; random per process if
+                omitted (share one key across workers)
+            session_max_age: Session cookie lifetime in seconds
+            protect_static: Require authentication for /docshield/static assets
+            rate_limit: RateLimiter applied to every protected route, or a dict
+                mapping route paths (e.g. "/openapi.json") to their own limiter;
+                excess requests get a 429 before credentials are verified
+            jwt_verifier: Accept "Authorization: Bearer" JWTs validated by this
+                JWTVerifier, alongside or instead of Basic Auth credentials
+            ip_filter: IPFilter with allowed/denied client networks, checked
+                before authentication on every documentation and static route
+            mode: "routes" adds the documentation routes to the app's router;
+                "middleware" serves them from an ASGI middleware ahead of the
+                router, adding no routes at all; "mount" adds a single route,
+                after the API routes, that dispatches every documentation URL
+                by exact path
+            roles: Schema views keyed by role name, e.g.
+                {"partner": SchemaView(tags=["public"])}
+            user_roles: Role of each username; users without a role get
+                default_role, or the full schema if it is None
+            auth_cache_size: Maximum number of remembered successful Basic
+                Auth headers
+            auth_cache_ttl: Seconds a successful Basic Auth header is
+                remembered (0 disables the cache); entries are dropped as soon
+                as the user's stored credential changes
+            include_mounts: Merge the schemas of FastAPI apps mounted with
+                app.mount() into the OpenAPI schema, prefixed with their
+                mount paths
+            schema_fragments: Serve self-contained parts of the schema at
+                {openapi_url}/tags/{tag} and {openapi_url}/operations/{operationId}
+            schema_search: Serve ranked operation search results at
+                {openapi_url}/search?q=...
+            search_box: Add a search box linking to the matching operations
+                to the Swagger UI and ReDoc pages (enables schema_search)
+            lite_schema: Also serve a slimmed schema at openapi_url, selected
+                with ?lite=1 or an Accept header with profile="lite": the
+                lite_strip_fields are removed and repeated inline schemas are
+                moved into shared components
+            lite_strip_fields: Fields removed from the lite schema
+            schema_history: Number of recent schema versions kept per role, so
+                openapi_url?since=<etag> can answer with a JSON Patch from that
+                version (0 disables)
+            live_reload: Serve a Server-Sent Events stream at
+                openapi_url + "/events" announcing schema changes, and have
+                the Swagger UI and ReDoc pages reload the schema when it changes
+            default_role: Role of users missing from user_roles, e.g. a
+                restrictive view so unlisted users do not see the full schema
         """
+        # Constructor arguments, the starting point for reconfigure()
+        settings = {name: value for name, value in locals().items() if name not in ("self", "app")}
+        self._validate_settings(settings)
+        
+        # Replace a DocShield installed earlier on this app, removing its routes by identity
+        previous = getattr(app.state, "docshield", None)
+        reused_docs_app: Optional[DocShieldApp] = None
+        if previous is not None and mode == "middleware":
+            if previous.mode == "middleware":
+                # Middleware cannot be added once the app has started, so keep serving through the old one
+                reused_docs_app = previous.docs_app
+            elif getattr(app, "middleware_stack", None) is not None:
+                # Fail before the previous installation is removed
+                raise RuntimeError(
+                    "Cannot switch DocShield to middleware mode after the application has started"
+                )
+        if previous is not None:
+            previous.uninstall()
+        self._settings = settings
+        
         # Initialize security scheme
         self.security = HTTPBasic()
         self.app = app
@@ -74,25 +246,401 @@ class DocShield:
         self.prefer_local = prefer_local
         self.custom_css = custom_css
         self.custom_js = custom_js
+        self.swagger_ui_parameters = swagger_ui_parameters
+        self.redoc_options = redoc_options
+        self.renderers = renderers or {}
+        self.max_inline_custom_size = max_inline_custom_size
+        self.protect_static = protect_static
+        self.rate_limit = rate_limit
+        self.jwt_verifier = jwt_verifier
+        self.ip_filter = ip_filter
+        self.mode = mode
+        self.roles = roles or {}
+        self.user_roles = user_roles or {}
+        self.default_role = default_role
+        self.auth_cache = (
+            TTLCache(max_size=auth_cache_size, ttl=auth_cache_ttl) if auth_cache_ttl > 0 else None
+        )
+        self._auth_cache_secret = secrets.token_bytes(32)
+        self.session_signer = (
+            SessionSigner(session_secret, max_age=session_max_age) if session_cookie else None
+        )
         
-        # Initialize static handler if fallback is enabled
-        self.static_handler = StaticHandler(app) if (use_cdn_fallback or prefer_local) else None
+        self.mounted_schemas = MountedSchemas(app) if include_mounts else None
+        self.schema_fragments = schema_fragments
+        self.schema_search = schema_search or search_box
+        self.search_box = search_box
+        self.lite_schema = lite_schema
+        self.lite_strip_fields = tuple(lite_strip_fields)
+        self.schema_history = schema_history
+        self.live_reload = live_reload
         
-        # Store original endpoints
-        self.original_docs_url = app.docs_url
-        self.original_redoc_url = app.redoc_url
-        self.original_openapi_url = app.openapi_url
+        # Set for documents created with add_document
+        self.route_selector: Optional[RouteSelector] = None
+        self.document_title: Optional[str] = None
+        
+        # Rendered documentation pages, keyed by URL path
+        self._page_cache: Dict[str, CachedContent] = {}
+        # OpenAPI schema per role (None for the full schema), serialized and
+        # indexed for fragments on first use
+        self._role_schemas: Dict[Optional[str], Dict[str, Any]] = {}
+        self._schema_cache: Dict[Optional[str], CachedContent] = {}
+        self._fragments: Dict[Optional[str], SchemaFragments] = {}
+        self._search_indexes: Dict[Optional[str], SearchIndex] = {}
+        self._lite_cache: Dict[Optional[str], CachedContent] = {}
+        # Outlive the schema caches; keyed by (role, lite)
+        self._histories: Dict[Tuple[Optional[str], bool], SchemaHistory] = {}
+        self._broadcaster = SchemaBroadcaster(self._check_routes) if live_reload else None
+        # Route table fingerprint the cached schemas were built from
+        self._schema_routes_version: Optional[Tuple[int, int, int]] = None
+        
+        # Initialize static handler if fallback is enabled or custom code is served as files
+        if use_cdn_fallback or prefer_local or max_inline_custom_size is not None:
+            self.static_handler = StaticHandler(
+                app,
+                authenticate=self._authenticate if protect_static else None,
+                check_client=self._check_client if ip_filter else None,
+                register_routes=mode == "routes",
+            )
+        else:
+            self.static_handler = None
+        if self.static_handler:
+            for renderer in self.renderers.values():
+                self.static_handler.register_renderer(renderer)
+        
+        # Move large custom CSS/JS out of the pages
+        self.custom_css_url: Optional[str] = None
+        self.custom_js_url: Optional[str] = None
+        if max_inline_custom_size is not None:
+            self._externalize_custom_code()
         
-        # Remove existing documentation routes
-        self._remove_existing_docs_routes()
+        # Store original endpoints
+        if previous is not None:
+            # The built-in docs are already disabled; keep the app's original settings
+            self.original_docs_url = previous.original_docs_url
+            self.original_redoc_url = previous.original_redoc_url
+            self.original_openapi_url = previous.original_openapi_url
+        else:
+            self.original_docs_url = app.docs_url
+            self.original_redoc_url = app.redoc_url
+            self.original_openapi_url = app.openapi_url
+            
+            # Remove existing documentation routes
+            self._remove_existing_docs_routes()
         
         # Disable built-in docs
         app.docs_url = None
         app.redoc_url = None
         app.openapi_url = None
         
-        # Set up protected documentation routes
-        self._setup_routes()
+        # Set up protected documentation endpoints
+        self.endpoints = self._build_endpoints()
+        self.prefix_endpoints = self._build_prefix_endpoints()
+        self.documents: Dict[str, "DocShield"] = {}
+        # The DocShield a document was added to; documents share its installation
+        self._parent: Optional["DocShield"] = None
+        self.docs_app: Optional[DocShieldApp] = None
+        # Routes added to the app, removed by identity on uninstall
+        self._installed_routes: List[BaseRoute] = list(self.static_handler.routes) if self.static_handler else []
+        # Documentation route by URL path (routes mode), moved in place by reconfigure
+        self._endpoint_routes: Dict[str, BaseRoute] = {}
+        if reused_docs_app is not None:
+            self.docs_app = reused_docs_app
+            self.docs_app.shield = self
+            self.docs_app.active = True
+            self.docs_app.add(self)
+            # Listed again for a middleware stack that is not built yet
+            app.user_middleware.insert(0, Middleware(DocShieldMiddleware, docs_app=self.docs_app))
+        elif mode == "middleware":
+            self.docs_app = DocShieldApp(self)
+            self.docs_app.add(self)
+            app.add_middleware(DocShieldMiddleware, docs_app=self.docs_app)
+        elif mode == "mount":
+            self.docs_app = DocShieldApp(self)
+            self.docs_app.add(self)
+            route = DocShieldRoute(self.docs_app, app.router)
+            app.router.routes.append(route)
+            self._installed_routes.append(route)
+        else:
+            self._setup_routes()
+        
+        # Make the instance discoverable from the app, e.g. for the export CLI
+        app.state.docshield = self
+    
+    def export(self, path: Union[str, Path]) -> Path:
+        """
+        Export the documentation as a static site.
+        
+        Writes the rendered Swagger UI/ReDoc pages, the minified and
+        pre-compressed OpenAPI schema and content-hashed copies of the
+        bundled assets, all linked with relative URLs. The exported files are
+        not protected by DocShield.
+        
+        Args:
+            path: Output directory, created if missing
+            
+        Returns:
+            The output directory
+        """
+        return export_docs(self, path)
+    
+    def add_document(
+        self,
+        name: str,
+        prefixes: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[str]] = None,
+        routers: Optional[Iterable[APIRouter]] = None,
+        docs_url: Optional[str] = None,
+        redoc_url: Optional[str] = None,
+        openapi_url: Optional[str] = None,
+        credentials: Optional[Union[Dict[str, str], Authenticator]] = None,
+        title: Optional[str] = None,
+    ) -> "DocShield":
+        """
+        Publish a separate, protected document for a subset of the routes.
+        
+        The document gets its own Swagger UI, ReDoc and OpenAPI URLs, its own
+        cached schema and pages, and optionally its own credentials. Asset
+        serving, custom code and the other settings are shared with this
+        instance; protected static assets use this instance's credentials.
+        
+        Args:
+            name: Document name, e.g. "v1"
+            prefixes: Include routes under these path prefixes, e.g. ["/v1"]
+            tags: Include routes with these tags
+            routers: Include the routes of these APIRouters
+            docs_url: Swagger UI URL (default "/<name>/docs")
+            redoc_url: ReDoc URL (default "/<name>/redoc")
+            openapi_url: OpenAPI JSON URL (default "/<name>/openapi.json")
+            credentials: Credentials for this document; defaults to this
+                instance's credentials and JWT verifier
+            title: Document title (default "<app title> - <name>")
+            
+        Returns:
+            The document, a DocShield sharing this instance's configuration
+        """
+        if name in self.documents:
+            raise ValueError(f"Document already exists: {name}")
+        
+        document = copy.copy(self)
+        document.docs_url = docs_url or f"/{name}/docs"
+        document.redoc_url = redoc_url or f"/{name}/redoc"
+        document.openapi_url = openapi_url or f"/{name}/openapi.json"
+        document.renderers = {}
+        document.route_selector = RouteSelector(prefixes, tags, routers)
+        document.document_title = title or f"{self.app.title} - {name}"
+        if credentials is not None:
+            document.credentials = credentials
+            document.jwt_verifier = None
+        document.documents = {}
+        document._parent = self
+        document._page_cache = {}
+        document._role_schemas = {}
+        document._schema_cache = {}
+        document._fragments = {}
+        document._search_indexes = {}
+        document._lite_cache = {}
+        document._histories = {}
+        document._broadcaster = SchemaBroadcaster(document._check_routes) if document.live_reload else None
+        if self.auth_cache is not None:
+            document.auth_cache = TTLCache(max_size=self.auth_cache.max_size, ttl=self.auth_cache.ttl)
+        if self.session_signer is not None:
+            # Sessions of one document must not open another
+            document.session_signer = SessionSigner(
+                hmac.new(self.session_signer.secret, name.encode("utf-8"), hashlib.sha256).digest(),
+                max_age=self.session_signer.max_age,
+                cookie_name=f"{self.session_signer.cookie_name}_{name}",
+            )
+        document.endpoints = document._build_endpoints()
+        document.prefix_endpoints = document._build_prefix_endpoints()
+        
+        taken = {
+            path for shield in (self, *self.documents.values())
+            for path in (*shield.endpoints, *shield.prefix_endpoints)
+        }
+        conflicts = taken.intersection((*document.endpoints, *document.prefix_endpoints))
+        if conflicts:
+            raise ValueError(f"Document URLs already in use: {', '.join(sorted(conflicts))}")
+        
+        document._installed_routes = []
+        document._endpoint_routes = {}
+        if self.docs_app is not None:
+            self.docs_app.add(document)
+        else:
+            document._setup_routes()
+        self.documents[name] = document
+        return document
+    
+    def uninstall(self) -> None:
+        """
+        Remove DocShield from the app.
+        
+        The routes this instance and its documents added are removed by
+        identity, and the middleware or mount route stops serving. FastAPI's
+        built-in documentation stays disabled.
+        """
+        routes = list(self._installed_routes)
+        for document in self.documents.values():
+            routes.extend(document._installed_routes)
+        self._remove_routes(routes)
+        
+        if self.docs_app is not None:
+            for shield in (self, *self.documents.values()):
+                self.docs_app.remove(shield)
+            if self.docs_app.shield is self:
+                # A middleware stack that is already built keeps the instance; it now passes requests through
+                self.docs_app.active = False
+                self.app.user_middleware = [
+                    middleware for middleware in self.app.user_middleware
+                    if (getattr(middleware, "kwargs", None) or getattr(middleware, "options", {})).get("docs_app")
+                    is not self.docs_app
+                ]
+        
+        self.documents = {}
+        self._installed_routes = []
+        self._endpoint_routes = {}
+        self.app.openapi_schema = None
+        if getattr(self.app.state, "docshield", None) is self:
+            del self.app.state.docshield
+    
+    def reconfigure(self, **changes: Any) -> None:
+        """
+        Change settings of the installed DocShield.
+        
+        Accepts the constructor's keyword arguments. Only the cached content
+        a change affects is rebuilt: new URLs move the existing routes in
+        place, page settings re-render the pages, schema settings rebuild the
+        schema, and authentication settings start fresh authentication and
+        session state. Changing mode or renderers, or whether local assets are
+        served, reinstalls DocShield.
+        
+        Raises:
+            TypeError: If a setting is unknown
+            ValueError: If the settings are invalid, or a reinstall is needed
+                while named documents exist or on a document itself
+        """
+        unknown = set(changes) - set(self._settings)
+        if unknown:
+            raise TypeError(f"Unknown DocShield settings: {', '.join(sorted(unknown))}")
+        changed = {
+            name: value for name, value in changes.items()
+            if value is not self._settings[name] and value != self._settings[name]
+        }
+        if not changed:
+            return
+        settings = {**self._settings, **changed}
+        
+        serves_assets = bool(
+            settings["use_cdn_fallback"] or settings["prefer_local"]
+            or settings["max_inline_custom_size"] is not None
+        )
+        if _REINSTALL_SETTINGS.intersection(changed) or serves_assets != (self.static_handler is not None):
+            if self._parent is not None:
+                raise ValueError(
+                    "Cannot reinstall a document; its installation is shared with the DocShield it "
+                    "was added to, so reconfigure that instance instead"
+                )
+            if self.documents:
+                raise ValueError("Cannot reinstall DocShield while it has named documents")
+            self.__init__(self.app, **settings)
+            return
+        
+        self._validate_settings(settings)
+        self._settings = settings
+        old_paths = self._route_paths()
+        # Most settings are stored as attributes of the same name
+        for name, value in changed.items():
+            if name in vars(self):
+                setattr(self, name, value)
+        
+        names = set(changed)
+        if names & _URL_SETTINGS:
+            self._move_endpoints(old_paths)
+            self._page_cache.clear()
+        if names & _PAGE_SETTINGS:
+            if names & {"custom_css", "custom_js", "max_inline_custom_size"}:
+                self._drop_custom_assets()
+                if self.max_inline_custom_size is not None:
+                    self._externalize_custom_code()
+            self._page_cache.clear()
+        if names & _SCHEMA_SETTINGS:
+            self.roles = settings["roles"] or {}
+            self.user_roles = settings["user_roles"] or {}
+            self.default_role = settings["default_role"]
+            self.mounted_schemas = MountedSchemas(self.app) if settings["include_mounts"] else None
+            if "schema_history" in names:
+                self._histories.clear()
+            self._clear_schema_caches()
+        if names - _URL_SETTINGS - _PAGE_SETTINGS - _SCHEMA_SETTINGS:
+            # Static assets are protected by the instance documents were added to
+            if self.static_handler is not None and self._parent is None:
+                self.static_handler.set_access(
+                    self._authenticate if self.protect_static else None,
+                    self._check_client if self.ip_filter else None,
+                )
+            self.auth_cache = (
+                TTLCache(max_size=settings["auth_cache_size"], ttl=settings["auth_cache_ttl"])
+                if settings["auth_cache_ttl"] > 0 else None
+            )
+            self.session_signer = (
+                SessionSigner(settings["session_secret"], max_age=settings["session_max_age"])
+                if settings["session_cookie"] else None
+            )
+    
+    @staticmethod
+    def _validate_settings(settings: Dict[str, Any]) -> None:
+        """Raise ValueError for an unusable combination of settings."""
+        if settings["mode"] not in ("routes", "middleware", "mount"):
+            raise ValueError(f"Unsupported DocShield mode: {settings['mode']}")
+        if settings["credentials"] is None and settings["jwt_verifier"] is None:
+            raise ValueError("DocShield needs credentials, a jwt_verifier, or both")
+        roles = settings["roles"] or {}
+        unknown_roles = set((settings["user_roles"] or {}).values()) - set(roles)
+        if unknown_roles:
+            raise ValueError(f"Undefined roles in user_roles: {', '.join(sorted(unknown_roles))}")
+        if settings["default_role"] is not None and settings["default_role"] not in roles:
+            raise ValueError(f"Undefined default_role: {settings['default_role']}")
+        if settings["schema_history"] < 0:
+            raise ValueError("schema_history must not be negative")
+    
+    def _move_endpoints(self, old_paths: List[str]) -> None:
+        """
+        Serve the documentation endpoints at their new URLs.
+        
+        Args:
+            old_paths: _route_paths() before the URL settings changed
+        """
+        if self.docs_app is not None:
+            self.docs_app.remove(self)
+        self.endpoints = self._build_endpoints()
+        self.prefix_endpoints = self._build_prefix_endpoints()
+        if self.docs_app is not None:
+            self.docs_app.add(self)
+            return
+        
+        # Endpoints keep their order, and the routes' content functions do not
+        # depend on the URL, so the routes are re-pointed in place
+        moved = {
+            new_path: self._endpoint_routes.pop(old_path)
+            for old_path, new_path in zip(old_paths, self._route_paths())
+            if new_path != old_path and old_path in self._endpoint_routes
+        }
+        for path, route in moved.items():
+            route.path = path
+            route.path_regex, route.path_format, route.param_convertors = compile_path(path)
+            self._endpoint_routes[path] = route
+    
+    def _remove_routes(self, routes: List[BaseRoute]) -> None:
+        """Remove routes from the app by identity; cheap when they are the last ones added."""
+        if not routes:
+            return
+        app_routes = self.app.router.routes
+        count = len(routes)
+        if count <= len(app_routes) and all(a is b for a, b in zip(app_routes[-count:], routes)):
+            del app_routes[-count:]
+        else:
+            removed = {id(route) for route in routes}
+            app_routes[:] = [route for route in app_routes if id(route) not in removed]
     
     def _remove_existing_docs_routes(self) -> None:
         """
@@ -127,6 +675,257 @@ class DocShield:
         # We can access the router directly
         self.app.router.routes = routes_to_keep
     
+    async def _authenticate(self, request: Request) -> str:
+        """
+        Authenticate a documentation request.
+        
+        Clients outside the IP filter and throttled clients and usernames
+        are rejected first. A valid session cookie is then accepted after a
+        single HMAC check, as is a recently verified Authorization header;
+        otherwise the request's Bearer token or HTTP Basic Auth credentials
+        are verified.
+        
+        Args:
+            request: The incoming request
+            
+        Returns:
+            The authenticated username
+            
+        Raises:
+            HTTPException: If the request is refused, throttled or authentication fails
+        """
+        self._check_client(request)
+        
+        limiter = self._get_rate_limiter(request)
+        if limiter is not None:
+            self._enforce_rate_limit(limiter.check_client(self._client_address(request)))
+        
+        if self.session_signer is not None:
+            username = self.session_signer.verify(
+                request.cookies.get(self.session_signer.cookie_name), self._credential_marker
+            )
+            if username is not None:
+                request.state.docshield_session = True
+                return username
+        
+        if self.jwt_verifier is not None:
+            scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+            if scheme.lower() == "bearer":
+                return await self._authenticate_bearer(request, token.strip())
+            if self.credentials is None:
+                raise self._unauthorized()
+        
+        # A recently verified Authorization header skips parsing and verification
+        cache_key = self._auth_cache_key(request.headers.get("Authorization"))
+        if cache_key is not None:
+            cached = self.auth_cache.get(cache_key)
+            if cached is not None and cached[1] == self._credential_marker(cached[0]):
+                return cached[0]
+        
+        credentials = await self.security(request)
+        if limiter is not None:
+            self._enforce_rate_limit(limiter.check_username(credentials.username))
+        try:
+            username = await self._authenticate_basic(credentials)
+        except HTTPException as exc:
+            # An unreachable user directory is not a failed login
+            if limiter is not None and exc.status_code == status.HTTP_401_UNAUTHORIZED:
+                limiter.record_failure(credentials.username)
+            raise
+        
+        if cache_key is not None:
+            self.auth_cache.set(cache_key, (username, self._credential_marker(username)))
+        return username
+    
+    def _auth_cache_key(self, authorization: Optional[str]) -> Optional[bytes]:
+        """Return the keyed digest of a Basic Authorization header, or None if not cacheable."""
+        if self.auth_cache is None or not authorization or authorization[:6].lower() != "basic ":
+            return None
+        return hmac.new(self._auth_cache_secret, authorization.encode("utf-8"), hashlib.sha256).digest()
+    
+    def _credential_marker(self, username: str) -> Any:
+        """
+        Return the stored credential of a user, used to invalidate cached decisions.
+        
+        Backends without stored credentials (e.g. HTTPAuthenticator) return
+        None, so their cached decisions last until the TTL expires.
+        """
+        if isinstance(self.credentials, dict):
+            return self.credentials.get(username)
+        get_hash = getattr(self.credentials, "get_hash", None)
+        return get_hash(username) if get_hash is not None else None
+    
+    def clear_auth_cache(self) -> None:
+        """Forget all remembered authentication decisions."""
+        if self.auth_cache is not None:
+            self.auth_cache.clear()
+    
+    async def _authenticate_bearer(self, request: Request, token: str) -> str:
+        """
+        Authenticate a Bearer JWT.
+        
+        Args:
+            request: The incoming request; its claims are stored on request.state
+            token: The token from the Authorization header
+            
+        Returns:
+            The token's subject
+            
+        Raises:
+            HTTPException: If the token is invalid or has no subject
+        """
+        try:
+            claims = await self.jwt_verifier.verify(token)
+        except JWTError:
+            raise self._unauthorized() from None
+        subject = claims.get("sub")
+        if not isinstance(subject, str) or not subject:
+            # The subject selects the role; without one the token would see the full schema
+            raise self._unauthorized()
+        request.state.docshield_claims = claims
+        return subject
+    
+    def invalidate(self) -> None:
+        """
+        Drop every cached schema and page.
+        
+        Adding or removing routes is detected automatically; call this after
+        changing existing routes or schema settings in place.
+        """
+        self.app.openapi_schema = None
+        self._clear_schema_caches()
+        self._page_cache.clear()
+        if self.mounted_schemas is not None:
+            self.mounted_schemas.invalidate()
+        for document in self.documents.values():
+            document.invalidate()
+    
+    def invalidate_mount(self, path: Optional[str] = None) -> None:
+        """
+        Regenerate the schema of a mounted sub-application on next request.
+        
+        Only that sub-application's schema is rebuilt; the others are reused
+        when the merged schema is assembled again.
+        
+        Args:
+            path: Mount path, e.g. "/billing"; all sub-applications when omitted
+        """
+        if self.mounted_schemas is not None:
+            self.mounted_schemas.invalidate(path)
+        self._clear_schema_caches()
+    
+    def _client_address(self, request: Request) -> Optional[str]:
+        """Return the client address, resolving trusted proxies when an IP filter is set."""
+        peer = request.client.host if request.client else None
+        if self.ip_filter is None:
+            return peer
+        return self.ip_filter.client_address(peer, request.headers.get("X-Forwarded-For"))
+    
+    def _check_client(self, request: Request) -> None:
+        """Refuse requests from client addresses outside the IP filter."""
+        if self.ip_filter is not None and not self.ip_filter.is_allowed(self._client_address(request)):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    
+    def _get_rate_limiter(self, request: Request) -> Optional[RateLimiter]:
+        """Return the rate limiter configured for the requested documentation URL, if any."""
+        if not isinstance(self.rate_limit, dict):
+            return self.rate_limit
+        return self.rate_limit.get(self._rate_limit_key(route_path(request.scope)))
+    
+    def _rate_limit_key(self, path: str) -> str:
+        """
+        Return the documentation URL a request path resolves to.
+        
+        Every mode uses the same key: the endpoint's URL, "<prefix>{subpath:path}"
+        below a prefix endpoint, or the path itself for assets.
+        """
+        if path in self.endpoints:
+            return path
+        for prefix in self.prefix_endpoints:
+            if path.startswith(prefix):
+                return f"{prefix}{{subpath:path}}"
+        return path
+    
+    def _enforce_rate_limit(self, retry_after: float) -> None:
+        """Reject a throttled request with 429 and a Retry-After header."""
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+    
+    async def _authenticate_basic(self, credentials: HTTPBasicCredentials) -> str:
+        """
+        Authenticate HTTP Basic Auth credentials.
+        
+        Plaintext credential dictionaries are checked inline; Authenticator
+        objects such as HashedCredentials are awaited.
+        
+        Args:
+            credentials: The credentials provided by HTTPBasic
+            
+        Returns:
+            The authenticated username if credentials are valid
+            
+        Raises:
+            HTTPException: 401 if authentication fails, 503 if the
+                authenticator itself fails, e.g. an unreachable user directory
+        """
+        if isinstance(self.credentials, dict):
+            return self._verify_credentials(credentials)
+        
+        try:
+            valid = await self.credentials.authenticate(credentials.username, credentials.password)
+        except Exception as exc:
+            logger.warning(f"Authenticator {type(self.credentials).__name__} failed: {exc!r}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service unavailable",
+            ) from None
+        if valid:
+            return credentials.username
+        raise self._unauthorized()
+    
+    def _start_session(self, request: Request, username: str, response: Response) -> Response:
+        """Attach a session cookie to a response if the request logged in with Basic Auth."""
+        response.raw_headers.extend(self._session_headers(request, username))
+        return response
+    
+    def _session_headers(self, request: Request, username: str) -> List[Tuple[bytes, bytes]]:
+        """Return the raw Set-Cookie header starting a session, if one should be started."""
+        if self.session_signer is None or getattr(request.state, "docshield_session", False):
+            return []
+        if getattr(request.state, "docshield_claims", None) is not None:
+            # A session would outlive the token's expiry or revocation
+            return []
+        token = self.session_signer.issue(username, self._credential_marker(username))
+        response = Response()
+        # One cookie per documentation path, so the API itself never receives it
+        for path in self._session_cookie_paths():
+            response.set_cookie(
+                self.session_signer.cookie_name,
+                token,
+                max_age=self.session_signer.max_age,
+                path=path,
+                secure=request.url.scheme == "https",
+                httponly=True,
+                samesite="strict",
+            )
+        return [header for header in response.raw_headers if header[0] == b"set-cookie"]
+    
+    def _session_cookie_paths(self) -> List[str]:
+        """Return the fewest cookie paths that cover every documentation URL and nothing else."""
+        paths = [*self.endpoints, *(prefix.rstrip("/") for prefix in self.prefix_endpoints)]
+        if self.protect_static:
+            paths.append("/docshield/static")
+        scoped: List[str] = []
+        for path in sorted(set(paths), key=len):
+            # A cookie for /openapi.json is also sent to /openapi.json/search
+            if not any(path.startswith(f"{parent.rstrip('/')}/") for parent in scoped):
+                scoped.append(path)
+        return scoped
+    
     def _verify_credentials(self, credentials: HTTPBasicCredentials) -> str:
         """
         Verify HTTP Basic Auth credentials against our credentials dictionary.
@@ -153,124 +952,336 @@ class DocShield:
                 return username
         
         # If credentials are invalid, raise an exception
-        raise HTTPException(
+        raise self._unauthorized()
+    
+    def _unauthorized(self) -> HTTPException:
+        """Build the exception returned for failed authentication."""
+        return HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Basic"},
+            headers={"WWW-Authenticate": "Basic" if self.credentials is not None else "Bearer"},
         )
     
+    def _build_endpoints(self) -> Dict[str, Callable[[Request, str], CachedContent]]:
+        """
+        Map each protected documentation URL to the function producing its content.
+        
+        Each function takes the request and the authenticated username. Uses
+        the stored swagger_js_url, swagger_css_url, and redoc_js_url.
+        """
+        endpoints: Dict[str, Callable[[Request, str], CachedContent]] = {
+            self.openapi_url: self._get_openapi_content,
+        }
+        if self.schema_search:
+            endpoints[f"{self.openapi_url}/search"] = self._get_search_content
+        if self.live_reload:
+            endpoints[f"{self.openapi_url}/events"] = self._get_event_stream
+        
+        # Swagger UI and ReDoc only if the original app had them
+        if self.original_docs_url is not None:
+            endpoints[self.docs_url] = lambda request, username: self._get_page(
+                self.docs_url, self._render_docs_page
+            )
+        if self.original_redoc_url is not None:
+            endpoints[self.redoc_url] = lambda request, username: self._get_page(
+                self.redoc_url, self._render_redoc_page
+            )
+        
+        # Additional documentation UIs
+        for path, renderer in self.renderers.items():
+            endpoints[path] = self._renderer_endpoint(path, renderer)
+        return endpoints
+    
+    def _build_prefix_endpoints(self) -> Dict[str, Callable[[Request, str], CachedContent]]:
+        """Map URL prefixes to the functions serving every URL below them."""
+        endpoints: Dict[str, Callable[[Request, str], CachedContent]] = {}
+        if self.schema_fragments:
+            endpoints[f"{self.openapi_url}/"] = self._get_fragment_content
+        return endpoints
+    
+    def _route_paths(self) -> List[str]:
+        """Return the route path of every endpoint, in registration order."""
+        return [*self.endpoints, *(f"{prefix}{{subpath:path}}" for prefix in self.prefix_endpoints)]
+    
+    def _renderer_endpoint(self, path: str, renderer: DocRenderer) -> Callable[[Request, str], CachedContent]:
+        return lambda request, username: self._get_page(path, lambda: self._render_renderer_page(renderer))
+    
     def _setup_routes(self) -> None:
+        """Set up a protected route for every documentation endpoint."""
+        get_contents = [*self.endpoints.values(), *self.prefix_endpoints.values()]
+        for path, get_content in zip(self._route_paths(), get_contents):
+            self._setup_route(path, get_content)
+    
+    def _setup_route(self, path: str, get_content: Callable[[Request, str], CachedContent]) -> None:
+        """Set up a protected route serving one documentation endpoint."""
+        @self.app.get(path, include_in_schema=False)
+        async def get_documentation(request: Request):
+            username = await self._authenticate(request)
+            content = await self._get_endpoint_content(get_content, request, username)
+            return self._start_session(request, username, content.to_response(request, DOCS_CACHE_CONTROL))
+        
+        route = self.app.router.routes[-1]
+        self._installed_routes.append(route)
+        self._endpoint_routes[path] = route
+    
+    async def _get_endpoint_content(
+        self,
+        get_content: Callable[[Request, str], CachedContent],
+        request: Request,
+        username: str,
+    ) -> CachedContent:
+        """
+        Call an endpoint function, in a worker thread if the user's schema must be built first.
+        
+        Generating the schema of a large app and its mounted apps would
+        otherwise block the event loop; once it is cached, content is
+        returned inline without a thread hop.
+        """
+        self._check_routes()
+        if self._user_role(username) in self._role_schemas:
+            return get_content(request, username)
+        return await run_in_threadpool(get_content, request, username)
+    
+    def _get_page(self, key: str, render: Callable[[], str]) -> CachedContent:
+        """
+        Return a documentation page, rendering it on first use.
+        
+        The page is kept with a gzip variant and an ETag, so later requests
+        skip rendering and browsers revalidate with a 304.
+        """
+        content = self._page_cache.get(key)
+        if content is None:
+            content = CachedContent(render().encode("utf-8"), "text/html; charset=utf-8")
+            self._page_cache[key] = content
+        return content
+    
+    def _user_role(self, username: str) -> Optional[str]:
+        """Return a user's role, or None if the user sees the full schema."""
+        return self.user_roles.get(username, self.default_role)
+    
+    def _get_role_schema(self, role: Optional[str]) -> Dict[str, Any]:
+        """
+        Return the OpenAPI schema for a role (None for the full schema).
+        
+        Each role's filtered schema is built on first use and kept until the
+        route table changes or the caches are invalidated.
+        """
+        self._check_routes()
+        schema = self._role_schemas.get(role)
+        if schema is None:
+            schema = self._get_openapi_schema()
+            if role is not None:
+                schema = self.roles[role].apply(schema)
+            self._role_schemas[role] = schema
+        return schema
+    
+    def _check_routes(self) -> None:
+        """Drop the cached schemas if routes were added or removed since they were built."""
+        routes_version = self._routes_version()
+        if routes_version != self._schema_routes_version:
+            self.app.openapi_schema = None
+            self._clear_schema_caches()
+            self._schema_routes_version = routes_version
+    
+    def _clear_schema_caches(self) -> None:
+        """Drop the schemas and everything derived from them."""
+        self._role_schemas.clear()
+        self._schema_cache.clear()
+        self._fragments.clear()
+        self._search_indexes.clear()
+        self._lite_cache.clear()
+        if self._broadcaster is not None:
+            # Open docs pages compare the new ETag with the one they have
+            self._broadcaster.notify()
+    
+    def _get_openapi_content(self, request: Request, username: str) -> CachedContent:
+        """
+        Return the serialized OpenAPI schema for a user's role.
+        
+        Each role's schema is serialized once, so every role gets its own
+        bytes, gzip variant and ETag; the same holds for the lite variant.
+        With schema_history, ?since=<etag> returns a JSON Patch from that
+        version of the same variant.
+        """
+        role = self._user_role(username)
+        schema = self._get_role_schema(role)
+        # Both variants are served at one URL, chosen partly by the Accept header
+        lite = self.lite_schema and wants_lite(request.query_params.get("lite"), request.headers.get("accept"))
+        cache = self._lite_cache if lite else self._schema_cache
+        content = cache.get(role)
+        if content is None:
+            document = slim_schema(schema, self.lite_strip_fields) if lite else schema
+            vary = "Accept, Accept-Encoding" if self.lite_schema else "Accept-Encoding"
+            content = cache[role] = json_content(document, vary)
+            if self.schema_history:
+                history = self._histories.get((role, lite))
+                if history is None:
+                    history = self._histories[(role, lite)] = SchemaHistory(self.schema_history)
+                history.record(content, document)
+        
+        since = request.query_params.get("since")
+        if since is None or not self.schema_history:
+            return content
+        return self._histories[(role, lite)].delta(since)
+    
+    def _get_event_stream(self, request: Request, username: str) -> EventStream:
+        """Return the stream announcing the ETag of the user's schema."""
+        return EventStream(
+            request, self._broadcaster, lambda: self._get_openapi_content(request, username).etag
+        )
+    
+    def _get_fragment_content(self, request: Request, username: str) -> CachedContent:
+        """Return a tag or operation fragment of the user's schema, per the URL below openapi_url."""
+        kind, _, name = route_path(request.scope)[len(self.openapi_url) + 1:].partition("/")
+        role = self._user_role(username)
+        schema = self._get_role_schema(role)
+        fragments = self._fragments.get(role)
+        if fragments is None:
+            fragments = self._fragments[role] = SchemaFragments(schema)
+        content = fragments.content(kind, name) if kind in FRAGMENT_KINDS else None
+        if content is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        return content
+    
+    def _get_search_content(self, request: Request, username: str) -> CachedContent:
+        """Return the operations of the user's schema matching the "q" query parameter."""
+        query = request.query_params.get("q", "")
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), 100)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid limit")
+        role = self._user_role(username)
+        # Fetched first so that route changes drop a stale index
+        schema = self._get_role_schema(role)
+        index = self._search_indexes.get(role)
+        if index is None:
+            index = self._search_indexes[role] = SearchIndex(schema)
+        return json_content({"query": query, "results": index.search(query, limit)})
+    
+    def _routes_version(self) -> Tuple[int, int, int]:
         """
-        Set up all protected documentation endpoints.
+        Return a fingerprint of the app's route table that is cheap to compute.
         
-        Uses the stored swagger_js_url, swagger_css_url, and redoc_js_url.
+        Appending, removing or replacing routes changes the list's length, its
+        last route or the list itself (DocShield reassigns it), so the
+        fingerprint changes without walking the routes.
         """
-        # Set up OpenAPI JSON endpoint
-        @self.app.get(self.openapi_url, include_in_schema=False)
-        async def get_openapi(credentials: HTTPBasicCredentials = Depends(self.security)):
-            self._verify_credentials(credentials)
-            # Because we set app.openapi_url to None, we need to restore it temporarily
-            old_openapi_url = self.app.openapi_url
-            self.app.openapi_url = self.openapi_url
-            openapi_schema = self.app.openapi()
+        routes = self.app.router.routes
+        return id(routes), len(routes), id(routes[-1]) if routes else 0
+    
+    def _render_docs_page(self) -> str:
+        """Render the Swagger UI page for the configured asset sources."""
+        # Determine which URLs to use
+        if self.swagger_js_url is not None or self.swagger_css_url is not None:
+            # User provided custom URLs, use them
+            js_url, css_url = self.swagger_js_url, self.swagger_css_url
+        elif self.static_handler and self.prefer_local:
+            # Prefer local files
+            js_url, css_url = self.static_handler.get_swagger_urls(prefer_local=True)
+        elif self.static_handler and self.use_cdn_fallback:
+            # Use CDN with fallback support
+            return self._add_page_scripts(self._get_swagger_with_fallback(), is_swagger=True)
+        else:
+            # Default behavior - use CDN
+            js_url, css_url = None, None
+        
+        return self._add_page_scripts(self._get_swagger_html(self.openapi_url, js_url, css_url), is_swagger=True)
+    
+    def _render_redoc_page(self) -> str:
+        """Render the ReDoc page for the configured asset sources."""
+        # Determine which URL to use
+        if self.redoc_js_url is not None:
+            # User provided custom URL, use it
+            js_url = self.redoc_js_url
+        elif self.static_handler and self.prefer_local:
+            # Prefer local files
+            js_url = self.static_handler.get_redoc_url(prefer_local=True)
+        elif self.static_handler and self.use_cdn_fallback:
+            # Use CDN with fallback support
+            return self._add_page_scripts(self._get_redoc_with_fallback(), is_swagger=False)
+        else:
+            # Default behavior - use CDN
+            js_url = REDOC_JS_CDN_URL
+        
+        html = self._get_redoc_html(js_url, self.openapi_url, self._get_redoc_fonts_url())
+        return self._add_page_scripts(html, is_swagger=False)
+    
+    def _render_renderer_page(self, renderer: DocRenderer) -> str:
+        """Render the page of an additional documentation UI."""
+        if self.static_handler:
+            # Renderer assets are served locally whenever they are bundled
+            asset_urls = self.static_handler.get_renderer_urls(renderer, prefer_local=True)
+        else:
+            asset_urls = dict(renderer.cdn_urls)
+        return self._get_renderer_html(renderer, self.openapi_url, asset_urls)
+    
+    def _page_title(self) -> str:
+        return self.document_title or self.app.title
+    
+    def _get_openapi_schema(self) -> Dict[str, Any]:
+        """Generate the application's OpenAPI schema, or the document's for add_document."""
+        if self.route_selector is not None:
+            routes = self.route_selector.select(self.app.routes)
+            return generate_openapi(self.app, routes, self.document_title)
+        
+        # Because we set app.openapi_url to None, we need to restore it temporarily
+        old_openapi_url = self.app.openapi_url
+        self.app.openapi_url = self.openapi_url
+        try:
+            schema = self.app.openapi()
+        finally:
             self.app.openapi_url = old_openapi_url
-            return openapi_schema
+        if self.mounted_schemas is not None:
+            schema = merge_schemas(schema, self.mounted_schemas.schemas())
+        return schema
+    
+    def _get_swagger_html(
+        self,
+        openapi_url: str,
+        swagger_js_url: Optional[str] = None,
+        swagger_css_url: Optional[str] = None,
+    ) -> str:
+        """Generate Swagger UI HTML; bundle URLs default to FastAPI's CDN."""
+        kwargs = {
+            "openapi_url": openapi_url,
+            "title": self._page_title() + " - Swagger UI",
+        }
+        if swagger_js_url is not None:
+            kwargs["swagger_js_url"] = swagger_js_url
+        if swagger_css_url is not None:
+            kwargs["swagger_css_url"] = swagger_css_url
+        if self.swagger_ui_parameters:
+            kwargs["swagger_ui_parameters"] = self.swagger_ui_parameters
         
-        # Set up Swagger UI endpoint if the original app had it
-        if self.original_docs_url is not None:
-            @self.app.get(self.docs_url, include_in_schema=False)
-            async def get_docs(credentials: HTTPBasicCredentials = Depends(self.security)):
-                self._verify_credentials(credentials)
-                
-                # Determine which URLs to use
-                if self.swagger_js_url is not None or self.swagger_css_url is not None:
-                    # User provided custom URLs, use them
-                    kwargs = {
-                        "openapi_url": self.openapi_url,
-                        "title": self.app.title + " - Swagger UI",
-                    }
-                    if self.swagger_js_url is not None:
-                        kwargs["swagger_js_url"] = self.swagger_js_url
-                    if self.swagger_css_url is not None:
-                        kwargs["swagger_css_url"] = self.swagger_css_url
-                elif self.static_handler and self.prefer_local:
-                    # Prefer local files
-                    js_url, css_url = self.static_handler.get_swagger_urls(prefer_local=True)
-                    kwargs = {
-                        "openapi_url": self.openapi_url,
-                        "title": self.app.title + " - Swagger UI",
-                        "swagger_js_url": js_url,
-                        "swagger_css_url": css_url,
-                    }
-                elif self.static_handler and self.use_cdn_fallback:
-                    # Use CDN with fallback support
-                    return self._get_swagger_with_fallback()
-                else:
-                    # Default behavior - use CDN
-                    kwargs = {
-                        "openapi_url": self.openapi_url,
-                        "title": self.app.title + " - Swagger UI",
-                    }
-                
-                # If custom CSS/JS provided and not using fallback mode, wrap the response
-                if self.custom_css or self.custom_js:
-                    html_content = get_swagger_ui_html(**kwargs).body.decode('utf-8')
-                    return HTMLResponse(self._inject_custom_code(html_content, is_swagger=True))
-                
-                return get_swagger_ui_html(**kwargs)
+        html_content = get_swagger_ui_html(**kwargs).body.decode('utf-8')
         
-        # Set up ReDoc endpoint if the original app had it
-        if self.original_redoc_url is not None:
-            @self.app.get(self.redoc_url, include_in_schema=False)
-            async def get_redoc(credentials: HTTPBasicCredentials = Depends(self.security)):
-                self._verify_credentials(credentials)
-                
-                # Determine which URL to use
-                if self.redoc_js_url is not None:
-                    # User provided custom URL, use it
-                    kwargs = {
-                        "openapi_url": self.openapi_url,
-                        "title": self.app.title + " - ReDoc",
-                        "redoc_js_url": self.redoc_js_url,
-                    }
-                elif self.static_handler and self.prefer_local:
-                    # Prefer local files
-                    js_url = self.static_handler.get_redoc_url(prefer_local=True)
-                    kwargs = {
-                        "openapi_url": self.openapi_url,
-                        "title": self.app.title + " - ReDoc",
-                        "redoc_js_url": js_url,
-                    }
-                elif self.static_handler and self.use_cdn_fallback:
-                    # Use CDN with fallback support
-                    return self._get_redoc_with_fallback()
-                else:
-                    # Default behavior - use CDN
-                    kwargs = {
-                        "openapi_url": self.openapi_url,
-                        "title": self.app.title + " - ReDoc",
-                    }
-                
-                # If custom CSS/JS provided and not using fallback mode, wrap the response
-                if self.custom_css or self.custom_js:
-                    html_content = get_redoc_html(**kwargs).body.decode('utf-8')
-                    return HTMLResponse(self._inject_custom_code(html_content, is_swagger=False))
-                
-                return get_redoc_html(**kwargs)
+        # If custom CSS/JS provided, inject it
+        if self.custom_css or self.custom_js:
+            html_content = self._inject_custom_code(html_content, is_swagger=True)
+        return html_content
+    
+    def _get_renderer_html(
+        self, renderer: DocRenderer, openapi_url: str, asset_urls: Dict[str, str]
+    ) -> str:
+        """Generate the HTML of an additional documentation UI."""
+        html_content = renderer.render(
+            title=f"{self._page_title()} - {renderer.label}",
+            openapi_url=openapi_url,
+            asset_urls=asset_urls,
+        )
+        if self.custom_css or self.custom_js:
+            html_content = self._inject_custom_code(html_content, is_swagger=False)
+        return html_content
     
-    def _get_swagger_with_fallback(self) -> HTMLResponse:
+    def _get_swagger_with_fallback(self) -> str:
         """Generate Swagger UI HTML with automatic CDN fallback."""
-        custom_styles = f"""
-        <style>
-            {self.custom_css if self.custom_css else ''}
-        </style>
-        """ if self.custom_css else ""
+        custom_styles = self._custom_styles_html()
         
         html_content = f"""
         <!DOCTYPE html>
         <html>
         <head>
-        <title>{self.app.title} - Swagger UI</title>
+        <title>{self._page_title()} - Swagger UI</title>
         <link rel="shortcut icon" href="https://fastapi.tiangolo.com/img/favicon.png">
         <style>
             body {{ margin: 0; }}
@@ -324,22 +1335,19 @@ class DocShield:
         Promise.all([loadSwaggerCSS(), loadSwaggerJS()]).then(() => {{
             const ui = SwaggerUIBundle({{
                 url: '{self.openapi_url}',
-                dom_id: '#swagger-ui',
-                layout: 'BaseLayout',
-                deepLinking: true,
-                showExtensions: true,
-                showCommonExtensions: true,
+                {self._swagger_ui_config_js()}
                 presets: [
                     SwaggerUIBundle.presets.apis,
                     SwaggerUIBundle.SwaggerUIStandalonePreset
                 ],
             }});
+            window.ui = ui;
             if (cdnFailed) {{
                 console.log('Documentation loaded using local fallback');
             }}
             
             // Custom JavaScript
-            {self.custom_js if self.custom_js else '// No custom JS'}
+            {self._custom_script_js()}
         }}).catch(error => {{
             console.error('Failed to load Swagger UI:', error);
             document.getElementById('swagger-ui').innerHTML = '<h2>Failed to load documentation</h2>';
@@ -348,31 +1356,27 @@ class DocShield:
         </body>
         </html>
         """
-        return HTMLResponse(content=html_content)
+        return html_content
     
-    def _get_redoc_with_fallback(self) -> HTMLResponse:
+    def _get_redoc_with_fallback(self) -> str:
         """Generate ReDoc HTML with automatic CDN fallback."""
-        custom_styles = f"""
-        <style>
-            {self.custom_css if self.custom_css else ''}
-        </style>
-        """ if self.custom_css else ""
+        custom_styles = self._custom_styles_html()
         
         html_content = f"""
         <!DOCTYPE html>
         <html>
         <head>
-        <title>{self.app.title} - ReDoc</title>
+        <title>{self._page_title()} - ReDoc</title>
         <meta charset="utf-8"/>
         <meta name="viewport" content="width=device-width, initial-scale=1">
-        <link href="https://fonts.googleapis.com/css?family=Montserrat:300,400,700|Roboto:300,400,700" rel="stylesheet">
+        <link href="{self._get_redoc_fonts_url()}" rel="stylesheet">
         <style>
             body {{ margin: 0; padding: 0; }}
         </style>
         {custom_styles}
         </head>
         <body>
-        <redoc spec-url="{self.openapi_url}"></redoc>
+        <div id="redoc-container"></div>
         
         <script>
         function loadReDoc() {{
@@ -393,10 +1397,11 @@ class DocShield:
         }}
         
         loadReDoc().then(() => {{
+            Redoc.init({json.dumps(self.openapi_url)}, {json.dumps(self.redoc_options or {})}, document.getElementById('redoc-container'));
             console.log('ReDoc loaded successfully');
             
             // Custom JavaScript
-            {self.custom_js if self.custom_js else '// No custom JS'}
+            {self._custom_script_js()}
         }}).catch(error => {{
             console.error('Failed to load ReDoc:', error);
             document.body.innerHTML = '<h2>Failed to load documentation</h2>';
@@ -405,18 +1410,235 @@ class DocShield:
         </body>
         </html>
         """
-        return HTMLResponse(content=html_content)
+        return html_content
+    
+    def _get_redoc_html(self, redoc_js_url: str, openapi_url: str, fonts_url: str) -> str:
+        """Generate ReDoc HTML loading the bundle from a single URL."""
+        html_content = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+        <title>{self._page_title()} - ReDoc</title>
+        <meta charset="utf-8"/>
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <link rel="shortcut icon" href="https://fastapi.tiangolo.com/img/favicon.png">
+        <link href="{fonts_url}" rel="stylesheet">
+        <style>
+            body {{ margin: 0; padding: 0; }}
+        </style>
+        </head>
+        <body>
+        <noscript>
+            ReDoc requires Javascript to function. Please enable it to browse the documentation.
+        </noscript>
+        <div id="redoc-container"></div>
+        <script src="{redoc_js_url}"></script>
+        <script>
+        Redoc.init({json.dumps(openapi_url)}, {json.dumps(self.redoc_options or {})}, document.getElementById('redoc-container'));
+        </script>
+        </body>
+        </html>
+        """
+        
+        # If custom CSS/JS provided, inject it
+        if self.custom_css or self.custom_js:
+            html_content = self._inject_custom_code(html_content, is_swagger=False)
+        return html_content
+    
+    def _get_redoc_fonts_url(self) -> str:
+        """
+        Get the ReDoc fonts stylesheet URL.
+        
+        The bundled fonts are used whenever local files are preferred or the
+        CDN fallback is active, so a blocked Google Fonts request never delays
+        the first paint. Otherwise Google Fonts is loaded with display=swap.
+        """
+        if self.static_handler and (self.prefer_local or self.use_cdn_fallback):
+            return self.static_handler.get_fonts_url(prefer_local=True)
+        return REDOC_FONTS_CDN_URL
+    
+    def _swagger_ui_config_js(self) -> str:
+        """Render the merged SwaggerUIBundle options as JavaScript object entries."""
+        parameters = dict(SWAGGER_UI_DEFAULT_PARAMETERS)
+        if self.swagger_ui_parameters:
+            parameters.update(self.swagger_ui_parameters)
+        return "\n                ".join(
+            f"{json.dumps(key)}: {json.dumps(value)}," for key, value in parameters.items()
+        )
+    
+    def _drop_custom_assets(self) -> None:
+        """Stop serving the externalized custom CSS/JS, unless another document still links to it."""
+        owner = self._parent or self
+        in_use = {
+            url for shield in (owner, *owner.documents.values()) if shield is not self
+            for url in (shield.custom_css_url, shield.custom_js_url)
+        }
+        for url in (self.custom_css_url, self.custom_js_url):
+            if url and url not in in_use:
+                self.static_handler.remove_content_asset(url)
+        self.custom_css_url = self.custom_js_url = None
+    
+    def _externalize_custom_code(self) -> None:
+        """Serve custom CSS/JS above max_inline_custom_size as content-hashed files."""
+        limit = self.max_inline_custom_size
+        if self.custom_css and len(self.custom_css.encode("utf-8")) > limit:
+            self.custom_css_url = self.static_handler.add_content_asset(
+                "custom.css", self.custom_css.encode("utf-8"), "text/css; charset=utf-8"
+            )
+        if self.custom_js and len(self.custom_js.encode("utf-8")) > limit:
+            self.custom_js_url = self.static_handler.add_content_asset(
+                "custom.js", self.custom_js.encode("utf-8"), "application/javascript; charset=utf-8"
+            )
+    
+    def _custom_styles_html(self) -> str:
+        """Render the custom CSS as an inline style or a stylesheet link."""
+        if self.custom_css_url:
+            return f'<link rel="stylesheet" href="{self.custom_css_url}">'
+        if self.custom_css:
+            return f"<style>{self.custom_css}</style>"
+        return ""
+    
+    def _custom_script_js(self) -> str:
+        """Render JavaScript running the custom JS once the UI has loaded."""
+        if self.custom_js_url:
+            return (
+                "var customScript = document.createElement('script');\n"
+                f"            customScript.src = {json.dumps(self.custom_js_url)};\n"
+                "            document.body.appendChild(customScript);"
+            )
+        return self.custom_js if self.custom_js else '// No custom JS'
+    
+    def _add_page_scripts(self, html: str, is_swagger: bool) -> str:
+        """Add the optional search box and live reload to a Swagger UI or ReDoc page."""
+        return self._add_live_reload(self._add_search_box(html, is_swagger), is_swagger)
+    
+    def _add_live_reload(self, html: str, is_swagger: bool) -> str:
+        """Reload the page's schema when the events stream announces a new ETag."""
+        if not self.live_reload:
+            return html
+        if is_swagger:
+            show_spec = """
+                var system = window.ui || (typeof ui !== 'undefined' ? ui : null);
+                if (system) { system.specActions.updateSpec(text); }"""
+        else:
+            show_spec = f"""
+                Redoc.init(JSON.parse(text), {json.dumps(self.redoc_options or {})}, document.getElementById('redoc-container'));"""
+        live_reload = f"""
+        <script>
+        (function () {{
+            if (!window.EventSource) {{ return; }}
+            var etag = null;
+            var source = new EventSource({json.dumps(self.openapi_url + "/events")}, {{withCredentials: true}});
+            
+            function showSpec(text) {{{show_spec}
+            }}
+            
+            source.addEventListener('schema', function (event) {{
+                // The first event names the version the page loaded
+                var previous = etag;
+                etag = event.data;
+                if (previous === null || previous === etag) {{ return; }}
+                fetch({json.dumps(self.openapi_url)}, {{credentials: 'same-origin', headers: {{'If-None-Match': previous}}}})
+                    .then(function (response) {{ return response.status === 200 ? response.text() : null; }})
+                    .then(function (text) {{ if (text) {{ showSpec(text); }} }});
+            }});
+        }})();
+        </script>
+        </body>"""
+        return html.replace("</body>", live_reload, 1)
+    
+    def _add_search_box(self, html: str, is_swagger: bool) -> str:
+        """Add the operation search box to a page when search_box is enabled."""
+        if not self.search_box:
+            return html
+        if is_swagger:
+            # Expand the operation through Swagger UI's layout actions, as its deep links do
+            open_operation = """
+                var system = window.ui || (typeof ui !== 'undefined' ? ui : null);
+                var tag = result.tags[0] || 'default';
+                var id = 'operations-' + [tag, result.operationId].map(function (part) {
+                    return encodeURIComponent(part).replace(/%20/g, '_');
+                }).join('-');
+                if (system) {
+                    system.layoutActions.show(['operations-tag', tag], true);
+                    system.layoutActions.show(['operations', tag, result.operationId], true);
+                }
+                window.location.hash = '/' + encodeURIComponent(tag) + '/' + encodeURIComponent(result.operationId);
+                setTimeout(function () {
+                    var element = document.getElementById(id);
+                    if (element) { element.scrollIntoView(); }
+                }, 100);"""
+        else:
+            open_operation = """
+                window.location.hash = 'operation/' + encodeURIComponent(result.operationId);"""
+        search_box = f"""
+        <div id="docshield-search">
+            <input type="search" placeholder="Search operations" aria-label="Search operations" autocomplete="off">
+            <ul></ul>
+        </div>
+        <style>
+            #docshield-search {{ position: fixed; top: 8px; right: 16px; z-index: 1000; width: 360px; font-family: sans-serif; }}
+            #docshield-search input {{ width: 100%; box-sizing: border-box; padding: 6px 10px; border: 1px solid #ccc; border-radius: 4px; }}
+            #docshield-search ul {{ list-style: none; margin: 0; padding: 0; max-height: 60vh; overflow-y: auto; background: #fff; box-shadow: 0 2px 8px rgba(0, 0, 0, 0.15); }}
+            #docshield-search a {{ display: block; padding: 6px 10px; color: #333; text-decoration: none; font-size: 13px; }}
+            #docshield-search a:hover {{ background: #f0f0f0; }}
+        </style>
+        <script>
+        (function () {{
+            var box = document.getElementById('docshield-search');
+            var input = box.querySelector('input');
+            var list = box.querySelector('ul');
+            var timer = null;
+            
+            function openOperation(result) {{{open_operation}
+            }}
+            
+            function showResults(results) {{
+                list.innerHTML = '';
+                results.forEach(function (result) {{
+                    var link = document.createElement('a');
+                    link.href = '#';
+                    link.textContent = result.method + ' ' + result.path + (result.summary ? ' - ' + result.summary : '');
+                    link.addEventListener('click', function (event) {{
+                        event.preventDefault();
+                        list.innerHTML = '';
+                        if (result.operationId) {{ openOperation(result); }}
+                    }});
+                    var item = document.createElement('li');
+                    item.appendChild(link);
+                    list.appendChild(item);
+                }});
+            }}
+            
+            input.addEventListener('input', function () {{
+                clearTimeout(timer);
+                timer = setTimeout(function () {{
+                    var query = input.value.trim();
+                    if (!query) {{ showResults([]); return; }}
+                    fetch({json.dumps(self.openapi_url + "/search")} + '?q=' + encodeURIComponent(query), {{credentials: 'same-origin'}})
+                        .then(function (response) {{ return response.json(); }})
+                        .then(function (data) {{ showResults(data.results || []); }});
+                }}, 150);
+            }});
+        }})();
+        </script>
+        </body>"""
+        return html.replace("</body>", search_box, 1)
     
     def _inject_custom_code(self, html: str, is_swagger: bool = True) -> str:
         """Inject custom CSS and JavaScript into the HTML."""
         if self.custom_css:
             # Inject custom CSS before closing head tag
-            css_injection = f"<style>{self.custom_css}</style></head>"
+            css_injection = f"{self._custom_styles_html()}</head>"
             html = html.replace("</head>", css_injection)
         
-        if self.custom_js:
+        if self.custom_js_url:
+            # Load external custom JS before closing body tag
+            js_injection = f'<script src="{self.custom_js_url}"></script></body>'
+            html = html.replace("</body>", js_injection)
+        elif self.custom_js:
             # Inject custom JS before closing body tag
             js_injection = f"<script>{self.custom_js}</script></body>"
             html = html.replace("</body>", js_injection)
         
-        return html
\ No newline at end of file
+        return html
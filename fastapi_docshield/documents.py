@@ -0,0 +1,113 @@
+"""
+Named OpenAPI documents covering a subset of an application's routes.
+
+Used by DocShield.add_document to publish, e.g., separate v1, v2 and internal
+documentation from one application. Routes are selected by path prefix, tag
+or the APIRouter they were included from.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import inspect
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from fastapi import APIRouter, FastAPI
+from fastapi.openapi.utils import get_openapi
+from starlette.routing import BaseRoute
+
+try:
+    from fastapi.routing import iter_route_contexts
+except ImportError:  # FastAPI versions copying included routes into app.routes
+    iter_route_contexts = None
+
+# Optional get_openapi arguments (newer FastAPI versions) and the app attributes holding them
+_OPTIONAL_OPENAPI_ARGUMENTS = {
+    "summary": "summary",
+    "terms_of_service": "terms_of_service",
+    "contact": "contact",
+    "license_info": "license_info",
+    "separate_input_output_schemas": "separate_input_output_schemas",
+    "external_docs": "openapi_external_docs",
+}
+
+
+class RouteSelector:
+    """
+    Selects the routes of one document.
+
+    A route is selected when it matches any of the given prefixes, tags or
+    routers.
+    """
+
+    def __init__(
+        self,
+        prefixes: Optional[Iterable[str]] = None,
+        tags: Optional[Iterable[str]] = None,
+        routers: Optional[Iterable[APIRouter]] = None,
+    ):
+        """
+        Initialize the selector.
+
+        Args:
+            prefixes: Path prefixes, e.g. ["/v1"]
+            tags: Route tags
+            routers: APIRouters whose routes were included into the app
+        """
+        self.prefixes = [prefix.rstrip("/") for prefix in prefixes or ()]
+        self.tags = set(tags or ())
+        self.routers = list(routers or ())
+
+    def select(self, routes: Sequence[BaseRoute]) -> List[BaseRoute]:
+        """Return the selected routes, in application order."""
+        if iter_route_contexts is not None:
+            # Newer FastAPI keeps included routers nested; select their routes individually
+            routes = list(iter_route_contexts(routes))
+        # Included routes may be copies, so router routes are recognised by endpoint
+        endpoints = {
+            getattr(route, "endpoint", None) for router in self.routers for route in router.routes
+        }
+        endpoints.discard(None)
+        return [route for route in routes if self._matches(route, endpoints)]
+
+    def _matches(self, route: BaseRoute, endpoints: set) -> bool:
+        path = getattr(route, "path", "")
+        if any(path == prefix or path.startswith(f"{prefix}/") for prefix in self.prefixes):
+            return True
+        if self.tags.intersection(getattr(route, "tags", None) or ()):
+            return True
+        return getattr(route, "endpoint", None) in endpoints
+
+
+def generate_openapi(app: FastAPI, routes: Sequence[BaseRoute], title: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Generate an OpenAPI schema for some of an application's routes.
+
+    Uses the application's metadata (version, description, servers, ...) and
+    keeps only the tag definitions the routes use.
+
+    Args:
+        app: The FastAPI application
+        routes: The routes to document
+        title: Document title, defaults to the application's title
+
+    Returns:
+        The OpenAPI schema
+    """
+    used_tags = {tag for route in routes for tag in getattr(route, "tags", None) or ()}
+    tags = [tag for tag in app.openapi_tags or () if tag.get("name") in used_tags] or None
+    kwargs: Dict[str, Any] = {
+        "title": title or app.title,
+        "version": app.version,
+        "openapi_version": app.openapi_version,
+        "description": app.description,
+        "routes": routes,
+        "tags": tags,
+        "servers": app.servers,
+    }
+    parameters = inspect.signature(get_openapi).parameters
+    for argument, attribute in _OPTIONAL_OPENAPI_ARGUMENTS.items():
+        if argument in parameters and hasattr(app, attribute):
+            kwargs[argument] = getattr(app, attribute)
+    return get_openapi(**kwargs)
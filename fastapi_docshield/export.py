@@ -0,0 +1,154 @@
+"""
+Static-site export for DocShield.
+
+This module writes the rendered documentation pages, the minified OpenAPI
+schema and content-hashed copies of the bundled assets to a directory, all
+wired together with relative URLs, so the documentation can be served by any
+static web server (e.g. nginx with ``gzip_static on``) without the Python app.
+
+The exported files are not protected; put authentication in front of them in
+the web server serving the directory.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import gzip
+import hashlib
+import json
+import posixpath
+from pathlib import Path
+from typing import Dict, Union
+
+from .static_handler import FONT_FILES, STATIC_DIR
+
+# File suffixes worth writing a pre-compressed .gz sibling for
+COMPRESSIBLE_SUFFIXES = {".html", ".json", ".js", ".css"}
+
+
+class _SiteWriter:
+    """Writes files below the export directory, with gzip siblings."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def write(self, relative_path: str, content: bytes) -> None:
+        """Write a file and, for text formats, its pre-compressed variant."""
+        target = self.root / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        if target.suffix in COMPRESSIBLE_SUFFIXES:
+            # mtime=0 keeps repeated exports byte-identical
+            target.with_name(target.name + ".gz").write_bytes(
+                gzip.compress(content, compresslevel=9, mtime=0)
+            )
+
+    def write_asset(self, filename: str, content: bytes) -> str:
+        """Write a content-hashed asset and return its path relative to the root."""
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        stem, dot, suffix = filename.rpartition(".")
+        relative_path = f"assets/{stem}.{digest}{dot}{suffix}"
+        self.write(relative_path, content)
+        return relative_path
+
+
+def _page_path(url: str) -> str:
+    """Map a documentation URL to the file serving it, e.g. /docs -> docs/index.html."""
+    path = url.strip("/")
+    if not path:
+        return "index.html"
+    if posixpath.splitext(path)[1]:
+        return path
+    return f"{path}/index.html"
+
+
+def _relative_url(target: str, page: str) -> str:
+    """Return the URL of a file relative to the page linking to it."""
+    return posixpath.relpath(target, posixpath.dirname(page) or ".")
+
+
+def export_docs(shield, path: Union[str, Path]) -> Path:
+    """
+    Export a DocShield's documentation as a static site.
+
+    Args:
+        shield: The DocShield instance to export
+        path: Output directory, created if missing
+
+    Returns:
+        The output directory
+    """
+    root = Path(path)
+    writer = _SiteWriter(root)
+
+    # Minified schema
+    openapi_path = _page_path(shield.openapi_url)
+    schema = shield._get_openapi_schema()
+    writer.write(
+        openapi_path,
+        json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    )
+
+    # Bundled assets; font files go first so the stylesheet can reference their hashed names
+    assets: Dict[str, str] = {}
+    fonts_css = (STATIC_DIR / "fonts" / "fonts.css").read_text(encoding="utf-8")
+    for filename in FONT_FILES:
+        if filename != "fonts.css":
+            hashed = writer.write_asset(filename, (STATIC_DIR / "fonts" / filename).read_bytes())
+            fonts_css = fonts_css.replace(f"url({filename})", f"url({posixpath.basename(hashed)})")
+    assets["fonts.css"] = writer.write_asset("fonts.css", fonts_css.encode("utf-8"))
+    for directory, filename in (
+        ("swagger", "swagger-ui-bundle.js"),
+        ("swagger", "swagger-ui.css"),
+        ("redoc", "redoc.standalone.js"),
+    ):
+        assets[filename] = writer.write_asset(filename, (STATIC_DIR / directory / filename).read_bytes())
+
+    # Generated assets, e.g. externalized custom CSS/JS
+    content_assets: Dict[str, str] = {}
+    if shield.static_handler:
+        for hashed_name, asset in shield.static_handler.content_assets.items():
+            # "custom.<hash>.css" -> "custom.css"; write_asset adds the same hash back
+            stem, suffix = hashed_name.split(".", 1)[0], hashed_name.rsplit(".", 1)[1]
+            content_assets[f"/docshield/static/custom/{hashed_name}"] = writer.write_asset(
+                f"{stem}.{suffix}", asset.body
+            )
+
+    def write_page(page: str, html: str) -> None:
+        """Write a page, pointing generated asset URLs at their exported copies."""
+        for url, relative_path in content_assets.items():
+            html = html.replace(url, _relative_url(relative_path, page))
+        writer.write(page, html.encode("utf-8"))
+
+    if shield.original_docs_url is not None:
+        page = _page_path(shield.docs_url)
+        html = shield._get_swagger_html(
+            _relative_url(openapi_path, page),
+            shield.swagger_js_url or _relative_url(assets["swagger-ui-bundle.js"], page),
+            shield.swagger_css_url or _relative_url(assets["swagger-ui.css"], page),
+        )
+        write_page(page, html)
+
+    if shield.original_redoc_url is not None:
+        page = _page_path(shield.redoc_url)
+        html = shield._get_redoc_html(
+            shield.redoc_js_url or _relative_url(assets["redoc.standalone.js"], page),
+            _relative_url(openapi_path, page),
+            _relative_url(assets["fonts.css"], page),
+        )
+        write_page(page, html)
+
+    for url, renderer in shield.renderers.items():
+        page = _page_path(url)
+        asset_urls = dict(renderer.cdn_urls)
+        for filename in renderer.local_files:
+            file_path = STATIC_DIR / renderer.name / filename
+            if file_path.exists():
+                asset_urls[filename] = _relative_url(
+                    writer.write_asset(filename, file_path.read_bytes()), page
+                )
+        html = shield._get_renderer_html(renderer, _relative_url(openapi_path, page), asset_urls)
+        write_page(page, html)
+
+    return root
@@ -0,0 +1,94 @@
+"""
+Self-contained slices of an OpenAPI schema, by tag and by operation.
+
+Clients that only need part of a large specification (a code generator for
+one service area, a portal page per tag) can fetch a fragment holding the
+selected operations and just the components they reference. The schema is
+indexed once, including a component dependency graph, and each fragment is
+serialized on first request and then served as cached bytes.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .responses import CachedContent, json_content
+from .views import HTTP_METHODS, component_graph, prune_components
+
+# Fragment kinds, as used in the URL: {openapi_url}/tags/{tag}, {openapi_url}/operations/{operationId}
+FRAGMENT_KINDS = ("tags", "operations")
+
+
+class SchemaFragments:
+    """The tag and operation fragments of one OpenAPI schema."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Index a schema.
+
+        Args:
+            schema: The OpenAPI schema; it must not be modified afterwards
+        """
+        self.schema = schema
+        self.graph = component_graph(schema.get("components", {}))
+        # (path, method) pairs of each fragment, keyed by (kind, name)
+        self.operations: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        for path, path_item in schema.get("paths", {}).items():
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS:
+                    continue
+                operation_id = operation.get("operationId")
+                if operation_id is not None:
+                    self.operations.setdefault(("operations", operation_id), []).append((path, method))
+                for tag in operation.get("tags", ()):
+                    self.operations.setdefault(("tags", tag), []).append((path, method))
+        self._contents: Dict[Tuple[str, str], CachedContent] = {}
+
+    def build(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Build a fragment document.
+
+        Args:
+            kind: "tags" or "operations"
+            name: The tag name or operationId
+
+        Returns:
+            An OpenAPI document with the selected operations, their tags and
+            the components they reference, or None if nothing matches
+        """
+        operations = self.operations.get((kind, name))
+        if operations is None:
+            return None
+        fragment = {
+            key: value for key, value in self.schema.items()
+            if key not in ("paths", "components", "tags", "webhooks")
+        }
+        paths: Dict[str, Dict[str, Any]] = {}
+        used_tags: Set[str] = set()
+        for path, method in operations:
+            path_item = self.schema["paths"][path]
+            if path not in paths:
+                paths[path] = {key: value for key, value in path_item.items() if key not in HTTP_METHODS}
+            paths[path][method] = path_item[method]
+            used_tags.update(path_item[method].get("tags", ()))
+        fragment["paths"] = paths
+        if "tags" in self.schema:
+            fragment["tags"] = [tag for tag in self.schema["tags"] if tag.get("name") in used_tags]
+        if "components" in self.schema:
+            components = prune_components(self.schema["components"], fragment, self.graph)
+            if components:
+                fragment["components"] = components
+        return fragment
+
+    def content(self, kind: str, name: str) -> Optional[CachedContent]:
+        """Return a serialized fragment, or None if nothing matches."""
+        key = (kind, name)
+        content = self._contents.get(key)
+        if content is None:
+            fragment = self.build(kind, name)
+            if fragment is None:
+                return None
+            content = self._contents[key] = json_content(fragment)
+        return content
@@ -0,0 +1,138 @@
+"""
+Recent schema versions and JSON Patch deltas between them.
+
+Clients that poll the OpenAPI schema usually already hold a recent version.
+SchemaHistory keeps the last few versions of a document keyed by their ETag,
+so a client can ask for ``?since=<etag>`` and receive an RFC 6902 JSON Patch
+from its version to the current one instead of the whole document.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .responses import CachedContent, json_content
+
+JSON_PATCH_MEDIA_TYPE = "application/json-patch+json"
+
+
+def json_patch(old: Any, new: Any) -> List[Dict[str, Any]]:
+    """
+    Compute an RFC 6902 JSON Patch that turns one JSON document into another.
+
+    Objects are compared key by key and arrays element by element, so a
+    change deep inside the document becomes a single small operation.
+
+    Args:
+        old: The base document
+        new: The target document
+
+    Returns:
+        The patch operations
+    """
+    operations: List[Dict[str, Any]] = []
+    _diff(old, new, "", operations)
+    return operations
+
+
+def _diff(old: Any, new: Any, pointer: str, operations: List[Dict[str, Any]]) -> None:
+    if old is new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                operations.append({"op": "remove", "path": f"{pointer}/{_escape(key)}"})
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, f"{pointer}/{_escape(key)}", operations)
+            else:
+                operations.append({"op": "add", "path": f"{pointer}/{_escape(key)}", "value": value})
+    elif isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _diff(old[index], new[index], f"{pointer}/{index}", operations)
+        # Remove from the end so earlier indexes stay valid
+        for index in range(len(old) - 1, common - 1, -1):
+            operations.append({"op": "remove", "path": f"{pointer}/{index}"})
+        for index in range(common, len(new)):
+            operations.append({"op": "add", "path": f"{pointer}/{index}", "value": new[index]})
+    elif type(old) is not type(new) or old != new:
+        # True == 1 in Python but not in JSON, hence the type check
+        operations.append({"op": "replace", "path": pointer, "value": new})
+
+
+def _escape(key: str) -> str:
+    """Escape an object key for use in a JSON Pointer (RFC 6901)."""
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _version(etag: str) -> str:
+    """Return the opaque part of an ETag, so W/"abc", "abc" and abc are one version."""
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    return etag.strip('"')
+
+
+class SchemaHistory:
+    """A bounded ring of recent versions of one document."""
+
+    def __init__(self, max_versions: int):
+        """
+        Initialize the history.
+
+        Args:
+            max_versions: Number of versions kept; the oldest is evicted first
+        """
+        self.max_versions = max_versions
+        self._versions: "OrderedDict[str, Any]" = OrderedDict()
+        self._current: Optional[CachedContent] = None
+        # Deltas to the current version, keyed by base version
+        self._deltas: Dict[str, CachedContent] = {}
+
+    def record(self, content: CachedContent, document: Any) -> None:
+        """
+        Make a document the current version.
+
+        Args:
+            content: The serialized document, whose ETag names the version
+            document: The document itself; it must not be modified afterwards
+        """
+        version = _version(content.etag)
+        self._versions.pop(version, None)
+        self._versions[version] = document
+        while len(self._versions) > self.max_versions:
+            self._versions.popitem(last=False)
+        self._current = content
+        self._deltas.clear()
+
+    def delta(self, since: str) -> CachedContent:
+        """
+        Return the patch from a version to the current one.
+
+        The response carries the ETag of the current version, so a client
+        that is up to date gets 304 when it also sends If-None-Match.
+
+        Args:
+            since: ETag of the client's version
+
+        Returns:
+            The JSON Patch, or the current document when the base version is
+            unknown or the patch would not be smaller
+        """
+        base_version = _version(since)
+        content = self._deltas.get(base_version)
+        if content is not None:
+            return content
+        base = self._versions.get(base_version)
+        current = self._current
+        if base is None:
+            return current
+        operations = json_patch(base, self._versions[_version(current.etag)])
+        content = json_content(operations, current.vary, JSON_PATCH_MEDIA_TYPE, current.etag)
+        if len(content.body) >= len(current.body):
+            content = current
+        self._deltas[base_version] = content
+        return content
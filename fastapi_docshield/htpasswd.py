@@ -0,0 +1,204 @@
+"""
+htpasswd file credential backend for DocShield.
+
+Reads an Apache htpasswd file (bcrypt, SHA1 and apr1/MD5 entries) into an
+in-memory username index and reloads it when the file's modification time
+changes, checking at most once per reload interval. Reloads are parsed in a
+background thread and swapped in atomically.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .credentials import HashedCredentials, verify_password
+
+logger = logging.getLogger(__name__)
+
+_ITOA64 = "./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def apr1_hash(password: str, salt: str) -> str:
+    """
+    Compute an Apache apr1 (MD5-crypt) hash.
+
+    Args:
+        password: The plaintext password
+        salt: Up to 8 salt characters
+
+    Returns:
+        The encoded hash, e.g. "$apr1$<salt>$<hash>"
+    """
+    magic = b"$apr1$"
+    secret = password.encode("utf-8")
+    salt_bytes = salt.encode("ascii")[:8]
+
+    context = secret + magic + salt_bytes
+    final = hashlib.md5(secret + salt_bytes + secret).digest()
+    for length in range(len(secret), 0, -16):
+        context += final[:min(16, length)]
+    length = len(secret)
+    while length:
+        context += b"\x00" if length & 1 else secret[:1]
+        length >>= 1
+    final = hashlib.md5(context).digest()
+
+    for round_number in range(1000):
+        block = secret if round_number & 1 else final
+        if round_number % 3:
+            block += salt_bytes
+        if round_number % 7:
+            block += secret
+        block += final if round_number & 1 else secret
+        final = hashlib.md5(block).digest()
+
+    encoded = ""
+    for a, b, c in ((0, 6, 12), (1, 7, 13), (2, 8, 14), (3, 9, 15), (4, 10, 5)):
+        value = (final[a] << 16) | (final[b] << 8) | final[c]
+        for _ in range(4):
+            encoded += _ITOA64[value & 0x3F]
+            value >>= 6
+    value = final[11]
+    for _ in range(2):
+        encoded += _ITOA64[value & 0x3F]
+        value >>= 6
+
+    return f"$apr1${salt_bytes.decode('ascii')}${encoded}"
+
+
+def verify_htpasswd_hash(password: str, encoded: str) -> bool:
+    """
+    Check a password against an htpasswd entry.
+
+    Supports bcrypt ($2y$), SHA1 ({SHA}) and apr1 ($apr1$) entries, plus the
+    formats understood by verify_password.
+
+    Args:
+        password: The plaintext password
+        encoded: The hash part of an htpasswd line
+
+    Returns:
+        True if the password matches
+    """
+    try:
+        if encoded.startswith("{SHA}"):
+            digest = base64.b64encode(hashlib.sha1(password.encode("utf-8")).digest()).decode("ascii")
+            return hmac.compare_digest(digest, encoded[5:])
+        if encoded.startswith("$apr1$"):
+            salt = encoded[6:].split("$", 1)[0]
+            return hmac.compare_digest(apr1_hash(password, salt), encoded)
+        return verify_password(password, encoded)
+    except (TypeError, ValueError) as exc:
+        # Unsupported or malformed entry, e.g. legacy DES crypt or a
+        # non-ASCII salt or digest, which hmac.compare_digest rejects
+        logger.warning(f"Unusable htpasswd entry: {exc}")
+        return False
+
+
+def parse_htpasswd(content: str) -> Dict[str, str]:
+    """Parse htpasswd content into a username -> hash index."""
+    entries: Dict[str, str] = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or ":" not in line:
+            continue
+        username, encoded = line.split(":", 1)
+        entries[username] = encoded
+    return entries
+
+
+class HtpasswdCredentials(HashedCredentials):
+    """
+    Credentials read from an htpasswd file, reloaded when the file changes.
+
+    Pass an instance as DocShield's ``credentials``. Successful verifications
+    share HashedCredentials' cache, so the hash cost is paid once per session
+    and survives reloads for users whose entry did not change.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        reload_interval: float = 5.0,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+    ):
+        """
+        Initialize htpasswd credentials.
+
+        Args:
+            path: Path of the htpasswd file
+            reload_interval: Minimum seconds between file modification checks
+            cache_size: Maximum number of cached successful verifications
+            cache_ttl: Seconds a successful verification stays cached
+        """
+        self.path = Path(path)
+        self.reload_interval = reload_interval
+        self._mtime = self._stat_mtime()
+        super().__init__(
+            parse_htpasswd(self.path.read_text(encoding="utf-8")),
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+        )
+        self._last_check = time.monotonic()
+        self._reload_lock = threading.Lock()
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get_hash(self, username: str) -> Optional[str]:
+        """Return the stored hash for a username, scheduling a reload if the file changed."""
+        self._check_for_changes()
+        return self.credentials.get(username)
+
+    def supports_hash(self, encoded: str) -> bool:
+        """Accept every entry; verify_htpasswd_hash fails logins with unsupported ones."""
+        return True
+
+    def verify_hash(self, password: str, encoded: str) -> bool:
+        """Check a password against an htpasswd entry; runs in a worker thread."""
+        return verify_htpasswd_hash(password, encoded)
+
+    def reload(self) -> None:
+        """Re-read the htpasswd file and swap in the new index."""
+        mtime = self._stat_mtime()
+        try:
+            entries = parse_htpasswd(self.path.read_text(encoding="utf-8"))
+        except OSError as exc:
+            # Keep serving the last good index, e.g. while the file is being replaced
+            logger.warning(f"Failed to reload htpasswd file {self.path}: {exc}")
+            return
+        self.credentials = entries
+        self._mtime = mtime
+
+    def _check_for_changes(self) -> None:
+        """Start a background reload when the file's mtime changed, at most once per interval."""
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return
+        self._last_check = now
+        if self._stat_mtime() == self._mtime:
+            return
+        if not self._reload_lock.acquire(blocking=False):
+            # A reload is already running
+            return
+        threading.Thread(target=self._reload_in_background, daemon=True).start()
+
+    def _reload_in_background(self) -> None:
+        try:
+            self.reload()
+        finally:
+            self._reload_lock.release()
@@ -0,0 +1,160 @@
+"""
+Client address filtering for DocShield.
+
+Allow and deny lists of IPv4/IPv6 networks are compiled into binary prefix
+tries, so a lookup walks at most one node per address bit regardless of how
+many networks are listed. Behind reverse proxies the client address can be
+taken from X-Forwarded-For, trusting only the listed proxy networks.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import ipaddress
+from typing import Any, Iterable, List, Optional, Union
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class PrefixTrie:
+    """
+    A binary trie mapping IP networks to values, with longest-prefix lookup.
+
+    IPv4 and IPv6 networks live in separate roots. Nodes are three-item lists:
+    the children for bit 0 and bit 1, and the value stored at that prefix.
+    """
+
+    _EMPTY = object()
+
+    def __init__(self):
+        self._roots = {4: self._node(), 6: self._node()}
+        self._size = 0
+
+    def _node(self) -> List[Any]:
+        return [None, None, self._EMPTY]
+
+    def insert(self, network: Union[str, IPNetwork], value: Any = True) -> None:
+        """
+        Store a value for a network, replacing any value already stored for it.
+
+        Args:
+            network: A network such as "10.0.0.0/8" or "2001:db8::/32"; a bare
+                address is treated as a single-host network
+            value: The value returned for addresses inside the network
+        """
+        if isinstance(network, str):
+            network = ipaddress.ip_network(network, strict=False)
+        node = self._roots[network.version]
+        address = int(network.network_address)
+        for shift in range(network.max_prefixlen - 1, network.max_prefixlen - network.prefixlen - 1, -1):
+            bit = (address >> shift) & 1
+            if node[bit] is None:
+                node[bit] = self._node()
+            node = node[bit]
+        if node[2] is self._EMPTY:
+            self._size += 1
+        node[2] = value
+
+    def lookup(self, address: IPAddress, default: Any = None) -> Any:
+        """Return the value of the longest stored network containing address."""
+        node = self._roots[address.version]
+        value = node[2]
+        number = int(address)
+        for shift in range(address.max_prefixlen - 1, -1, -1):
+            node = node[(number >> shift) & 1]
+            if node is None:
+                break
+            if node[2] is not self._EMPTY:
+                value = node[2]
+        return default if value is self._EMPTY else value
+
+    def __len__(self) -> int:
+        return self._size
+
+
+def parse_address(value: str) -> Optional[IPAddress]:
+    """Parse an IP address, unwrapping IPv4-mapped IPv6; None if invalid."""
+    try:
+        address = ipaddress.ip_address(value.strip())
+    except ValueError:
+        return None
+    if address.version == 6 and address.ipv4_mapped is not None:
+        return address.ipv4_mapped
+    return address
+
+
+class IPFilter:
+    """
+    Allow/deny lists of networks applied to documentation requests.
+
+    The most specific matching network decides: with ``allow=["10.0.0.0/8"]``
+    and ``deny=["10.9.0.0/16"]``, 10.9.1.1 is denied and 10.1.1.1 allowed.
+    A network listed in both is denied. Addresses matching neither list are
+    denied when an allow list is given and allowed otherwise.
+    """
+
+    def __init__(
+        self,
+        allow: Optional[Iterable[str]] = None,
+        deny: Optional[Iterable[str]] = None,
+        trusted_proxies: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            allow: Networks (CIDR notation or single addresses) allowed access
+            deny: Networks refused access
+            trusted_proxies: Reverse proxies whose X-Forwarded-For header is
+                used to find the real client address
+        """
+        allow = list(allow or [])
+        self.default_allowed = not allow
+        self.rules = PrefixTrie()
+        for network in allow:
+            self.rules.insert(network, True)
+        for network in deny or []:
+            self.rules.insert(network, False)
+        self.trusted_proxies = PrefixTrie()
+        for network in trusted_proxies or []:
+            self.trusted_proxies.insert(network)
+
+    def is_allowed(self, address: Optional[str]) -> bool:
+        """Return True if a client address may access the documentation."""
+        parsed = parse_address(address) if address else None
+        if parsed is None:
+            return False
+        return self.rules.lookup(parsed, self.default_allowed)
+
+    def client_address(self, peer: Optional[str], forwarded_for: Optional[str]) -> Optional[str]:
+        """
+        Determine the client address of a request.
+
+        X-Forwarded-For is only honoured when the connecting peer is a trusted
+        proxy; the header is read right to left, skipping further trusted
+        proxies, so clients cannot spoof their address by prepending entries.
+
+        Args:
+            peer: The address of the connecting peer
+            forwarded_for: The X-Forwarded-For header, if any
+
+        Returns:
+            The client address, or None if it cannot be determined
+        """
+        if not peer or not forwarded_for or not len(self.trusted_proxies):
+            return peer
+        parsed_peer = parse_address(peer)
+        if parsed_peer is None or not self.trusted_proxies.lookup(parsed_peer, False):
+            return peer
+        client = peer
+        for entry in reversed(forwarded_for.split(",")):
+            address = parse_address(entry)
+            if address is None:
+                # Unparseable hop: stop rather than trust anything before it
+                return entry.strip() or None
+            client = str(address)
+            if not self.trusted_proxies.lookup(address, False):
+                break
+        return client
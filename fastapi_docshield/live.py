@@ -0,0 +1,157 @@
+"""
+Live reload of open documentation pages.
+
+Docs pages subscribe to a Server-Sent Events stream that announces the
+schema's ETag whenever it changes, then re-fetch only the schema with a
+conditional GET. One SchemaBroadcaster per DocShield instance wakes every
+open stream through a single shared event, and a single background task
+watches the route table while anyone is subscribed, so hundreds of open tabs
+cost one timer rather than one poll each.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import asyncio
+from typing import AsyncIterator, Callable, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.types import Scope, Send
+
+# Seconds between route table checks while streams are open
+POLL_INTERVAL = 1.0
+
+# Seconds between keep-alive comments, so proxies do not close idle streams
+KEEPALIVE_INTERVAL = 15.0
+
+
+class SchemaBroadcaster:
+    """Wakes every subscribed stream when the schema may have changed."""
+
+    def __init__(self, poll: Callable[[], None], poll_interval: float = POLL_INTERVAL):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            poll: Called every poll_interval seconds while there are
+                subscribers; expected to call notify() when it detects a change
+            poll_interval: Seconds between polls
+        """
+        self.poll = poll
+        self.poll_interval = poll_interval
+        self.subscribers = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set and replaced on every change; created in the serving event loop
+        self._changed: Optional[asyncio.Event] = None
+        self._poller: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        """Wake every subscriber; safe to call from any thread."""
+        loop = self._loop
+        if loop is None or self.subscribers == 0:
+            return
+        try:
+            loop.call_soon_threadsafe(self._publish)
+        except RuntimeError:
+            # The loop has been closed
+            pass
+
+    def _publish(self) -> None:
+        if self._changed is not None:
+            changed, self._changed = self._changed, asyncio.Event()
+            changed.set()
+
+    async def changes(self, keepalive_interval: float = KEEPALIVE_INTERVAL) -> AsyncIterator[bool]:
+        """
+        Follow changes until the consumer stops iterating.
+
+        Yields True at once and after every change, and False when
+        keepalive_interval seconds pass without one.
+        """
+        self._attach()
+        try:
+            changed = self._changed
+            yield True
+            while True:
+                try:
+                    await asyncio.wait_for(changed.wait(), keepalive_interval)
+                except asyncio.TimeoutError:
+                    yield False
+                    continue
+                changed = self._changed
+                yield True
+        finally:
+            self._detach()
+
+    def _attach(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._changed = asyncio.Event()
+            self._poller = None
+        self.subscribers += 1
+        if self._poller is None:
+            self._poller = loop.create_task(self._poll())
+
+    def _detach(self) -> None:
+        self.subscribers -= 1
+        if self.subscribers == 0 and self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            self.poll()
+
+
+class EventStream:
+    """A Server-Sent Events response announcing a user's schema ETag."""
+
+    def __init__(self, request: Request, broadcaster: SchemaBroadcaster, current_etag: Callable[[], str]):
+        """
+        Initialize the stream.
+
+        Args:
+            request: The subscribing request
+            broadcaster: The broadcaster to follow
+            current_etag: Returns the ETag of the schema this user is served
+        """
+        self.request = request
+        self.broadcaster = broadcaster
+        self.current_etag = current_etag
+
+    async def events(self) -> AsyncIterator[str]:
+        """Send a "schema" event with the ETag on connect and whenever it changes."""
+        sent = None
+        async for changed in self.broadcaster.changes():
+            if not changed:
+                yield ": keep-alive\n\n"
+                continue
+            etag = self.current_etag()
+            if etag != sent:
+                sent = etag
+                yield f"event: schema\ndata: {etag}\n\n"
+
+    def to_response(self, request: Request, cache_control: str) -> Response:
+        """Build the streaming response, like CachedContent.to_response."""
+        return StreamingResponse(
+            self.events(),
+            media_type="text/event-stream",
+            # Ask nginx not to buffer the stream
+            headers={"Cache-Control": cache_control, "X-Accel-Buffering": "no"},
+        )
+
+    async def send(
+        self,
+        scope: Scope,
+        send: Send,
+        cache_control: str,
+        extra_headers: Iterable[Tuple[bytes, bytes]] = (),
+    ) -> None:
+        """Stream to an ASGI ``send`` callable, like CachedContent.send."""
+        response = self.to_response(self.request, cache_control)
+        response.raw_headers.extend(extra_headers)
+        await response(scope, self.request.receive, send)
@@ -0,0 +1,203 @@
+"""
+OpenAPI schemas of FastAPI sub-applications mounted with app.mount().
+
+FastAPI's own schema stops at a Mount, so a gateway app mounting several
+FastAPI apps documents none of their routes. MountedSchemas finds the mounted
+apps, generates their schemas and keeps them until invalidated;
+merge_schemas folds them into the parent schema with the mount path prefixed
+to every path and colliding component names renamed.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import copy
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from fastapi import FastAPI
+from starlette.routing import Mount
+
+from .views import HTTP_METHODS, collect_refs
+
+
+def find_mounted_apps(app: FastAPI, prefix: str = "") -> List[Tuple[str, FastAPI]]:
+    """
+    Find the FastAPI apps mounted into an app, including nested mounts.
+
+    Args:
+        app: The parent application
+        prefix: Path prefix of app itself
+
+    Returns:
+        (mount path, app) pairs in route order, e.g. [("/billing", billing_app)]
+    """
+    found: List[Tuple[str, FastAPI]] = []
+    for route in app.routes:
+        if isinstance(route, Mount) and isinstance(route.app, FastAPI):
+            path = prefix + route.path
+            found.append((path, route.app))
+            found.extend(find_mounted_apps(route.app, path))
+    return found
+
+
+class MountedSchemas:
+    """
+    Generated schemas of an app's mounted FastAPI sub-applications.
+
+    Schemas are generated on first use and reused until invalidate() drops
+    them. Generation runs in the calling thread; DocShield calls it from a
+    worker thread so the event loop is not blocked.
+    """
+
+    def __init__(self, app: FastAPI):
+        """
+        Initialize the schema store.
+
+        Args:
+            app: The parent application
+        """
+        self.app = app
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def schemas(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return (mount path, schema) pairs for every mounted FastAPI app."""
+        mounted = find_mounted_apps(self.app)
+        with self._lock:
+            for path, app in mounted:
+                if path not in self._schemas:
+                    self._schemas[path] = app.openapi()
+            return [(path, self._schemas[path]) for path, _ in mounted]
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop generated schemas so they are rebuilt on next use.
+
+        Args:
+            path: Mount path of one sub-application, e.g. "/billing";
+                all sub-applications when omitted
+        """
+        with self._lock:
+            for mount_path, app in find_mounted_apps(self.app):
+                if path is None or mount_path == path:
+                    # FastAPI caches the schema on the app as well
+                    app.openapi_schema = None
+                    self._schemas.pop(mount_path, None)
+
+
+def merge_schemas(schema: Dict[str, Any], mounted: Sequence[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Merge sub-application schemas into their parent's schema.
+
+    Paths are prefixed with the mount path. A component whose name is already
+    taken by a different definition is renamed to "<mount>_<name>" and the
+    references to it are rewritten; identical definitions are shared.
+    Colliding operationIds are prefixed the same way.
+
+    Args:
+        schema: The parent schema; it is not modified
+        mounted: (mount path, schema) pairs, e.g. from MountedSchemas.schemas()
+
+    Returns:
+        The merged schema
+    """
+    merged = copy.deepcopy(schema)
+    paths = merged.setdefault("paths", {})
+    components = merged.setdefault("components", {})
+    tag_names = {tag.get("name") for tag in merged.get("tags", [])}
+    operation_ids = {
+        operation.get("operationId")
+        for path_item in paths.values()
+        for method, operation in path_item.items()
+        if method in HTTP_METHODS
+    }
+
+    for prefix, sub_schema in mounted:
+        slug = re.sub(r"[^A-Za-z0-9.-]+", "_", prefix.strip("/")) or "mounted"
+        renames = _component_renames(components, sub_schema.get("components", {}), slug)
+        sub_schema = _rewrite_refs(sub_schema, renames)
+        scheme_renames = {
+            ref.rsplit("/", 1)[1]: target.rsplit("/", 1)[1]
+            for ref, target in renames.items()
+            if ref.startswith("#/components/securitySchemes/")
+        }
+
+        for section, entries in sub_schema.get("components", {}).items():
+            target = components.setdefault(section, {})
+            for name, entry in entries.items():
+                ref = f"#/components/{section}/{name}"
+                new_name = renames[ref].rsplit("/", 1)[1] if ref in renames else name
+                # Existing entries under the same name are identical definitions
+                target.setdefault(new_name, entry)
+
+        default_security = sub_schema.get("security")
+        for path, path_item in sub_schema.get("paths", {}).items():
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS:
+                    continue
+                if default_security is not None:
+                    operation.setdefault("security", default_security)
+                if scheme_renames and "security" in operation:
+                    operation["security"] = [
+                        {scheme_renames.get(name, name): scopes for name, scopes in requirement.items()}
+                        for requirement in operation["security"]
+                    ]
+                operation_id = operation.get("operationId")
+                if operation_id is not None:
+                    if operation_id in operation_ids:
+                        operation_id = operation["operationId"] = f"{slug}_{operation_id}"
+                    operation_ids.add(operation_id)
+            paths[prefix + path] = path_item
+
+        for tag in sub_schema.get("tags", []):
+            if tag.get("name") not in tag_names:
+                merged.setdefault("tags", []).append(tag)
+                tag_names.add(tag.get("name"))
+
+    if not components:
+        del merged["components"]
+    return merged
+
+
+def _component_renames(existing: Dict[str, Any], incoming: Dict[str, Any], slug: str) -> Dict[str, str]:
+    """Map the $refs of colliding incoming components to their new refs."""
+    renames: Dict[str, str] = {}
+    new_names: Set[str] = set()
+    changed = True
+    # Repeat until stable: renaming a component changes every definition
+    # referencing it, which then no longer equals the existing one
+    while changed:
+        changed = False
+        for section, entries in incoming.items():
+            taken = existing.get(section, {})
+            for name, entry in entries.items():
+                ref = f"#/components/{section}/{name}"
+                if ref in renames or name not in taken:
+                    continue
+                refs: Set[str] = set()
+                collect_refs(entry, refs)
+                if taken[name] == entry and not refs.intersection(renames):
+                    continue
+                new_name, suffix = f"{slug}_{name}", 2
+                while new_name in taken or new_name in entries or f"{section}/{new_name}" in new_names:
+                    new_name, suffix = f"{slug}_{name}_{suffix}", suffix + 1
+                new_names.add(f"{section}/{new_name}")
+                renames[ref] = f"#/components/{section}/{new_name}"
+                changed = True
+    return renames
+
+
+def _rewrite_refs(value: Any, renames: Dict[str, str]) -> Any:
+    """Deep-copy a JSON value, rewriting renamed "$ref" targets."""
+    if isinstance(value, dict):
+        copied = {key: _rewrite_refs(item, renames) for key, item in value.items()}
+        ref = copied.get("$ref")
+        if isinstance(ref, str) and ref in renames:
+            copied["$ref"] = renames[ref]
+        return copied
+    if isinstance(value, list):
+        return [_rewrite_refs(item, renames) for item in value]
+    return value
@@ -0,0 +1,135 @@
+"""
+Brute-force throttling for DocShield.
+
+Token buckets keyed by client address and by submitted username reject
+excess requests with 429 before credentials are verified, so credential
+stuffing cannot drive the (possibly expensive) verification path.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+
+class TokenBuckets:
+    """
+    Token buckets keyed by an arbitrary hashable, with LRU-bounded memory.
+
+    Each key may spend ``capacity`` tokens at once; tokens refill evenly over
+    ``period`` seconds. Only the least recently used ``max_keys`` buckets are
+    kept; an evicted bucket simply starts full again.
+    """
+
+    def __init__(self, capacity: int, period: float, max_keys: int = 10000):
+        """
+        Initialize the buckets.
+
+        Args:
+            capacity: Burst size, and the number of tokens refilled per period
+            period: Seconds to refill an empty bucket
+            max_keys: Maximum number of tracked keys
+        """
+        self.capacity = capacity
+        self.period = period
+        self.max_keys = max_keys
+        self._rate = capacity / period
+        self._buckets: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tokens(self, key: Hashable, now: float) -> float:
+        entry = self._buckets.get(key)
+        if entry is None:
+            return float(self.capacity)
+        tokens, updated_at = entry
+        return min(self.capacity, tokens + (now - updated_at) * self._rate)
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        Spend a token for key.
+
+        Returns:
+            0 if a token was available, otherwise the seconds until one will be
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._tokens(key, now)
+            if tokens < 1:
+                return (1 - tokens) / self._rate
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return 0.0
+
+    def retry_after(self, key: Hashable) -> float:
+        """Return the seconds until key has a token, without spending one."""
+        now = time.monotonic()
+        with self._lock:
+            tokens = self._tokens(key, now)
+        return 0.0 if tokens >= 1 else (1 - tokens) / self._rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RateLimiter:
+    """
+    Per-client-address and per-username throttling for documentation routes.
+
+    Every request spends a token from its client address' bucket. Failed
+    logins additionally spend a token from the submitted username's bucket,
+    and a username whose bucket is empty is rejected before its credentials
+    are checked again.
+    """
+
+    def __init__(
+        self,
+        per_ip: int = 60,
+        per_username: Optional[int] = 10,
+        period: float = 60.0,
+        max_keys: int = 10000,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            per_ip: Requests allowed per client address per period
+            per_username: Failed logins allowed per username per period
+                (None disables the username limit)
+            period: Length of the refill period in seconds
+            max_keys: Maximum number of tracked addresses and usernames each
+        """
+        self.ip_buckets = TokenBuckets(per_ip, period, max_keys)
+        self.username_buckets = (
+            TokenBuckets(per_username, period, max_keys) if per_username else None
+        )
+
+    def check_client(self, client: Optional[str]) -> float:
+        """
+        Spend a token from a client address' bucket.
+
+        Returns:
+            0 if the request may proceed, otherwise the seconds to wait
+        """
+        return self.ip_buckets.acquire(client)
+
+    def check_username(self, username: str) -> float:
+        """
+        Check, before verification, whether a username may attempt a login.
+
+        Returns:
+            0 if the login may be attempted, otherwise the seconds to wait
+        """
+        if self.username_buckets is None:
+            return 0.0
+        return self.username_buckets.retry_after(username)
+
+    def record_failure(self, username: str) -> None:
+        """Spend a token from a username's bucket after a failed login."""
+        if self.username_buckets is not None:
+            self.username_buckets.acquire(username)
@@ -0,0 +1,161 @@
+"""
+Additional documentation UI renderers for DocShield.
+
+Swagger UI and ReDoc are heavy for teams that only need to browse endpoints.
+This module provides pluggable renderer classes for lighter alternative UIs
+which DocShield serves next to the existing Swagger UI and ReDoc pages, behind
+the same authentication and reading the same OpenAPI schema endpoint.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import abc
+import html
+import json
+from typing import Any, Dict, Optional
+
+
+class DocRenderer(abc.ABC):
+    """
+    Base class for documentation UI renderers.
+
+    Subclasses declare the assets they need and render the HTML page. Assets
+    listed in ``local_files`` are bundled in ``fastapi_docshield/static/<name>/``
+    and served by StaticHandler; ``cdn_urls`` is used when they are unavailable.
+    """
+
+    # Short identifier, also the static sub-directory of the bundled assets
+    name: str = ""
+    # Human readable UI name used in the page title
+    label: str = ""
+    # Bundled asset file names mapped to their media types
+    local_files: Dict[str, str] = {}
+    # CDN URL for every asset file name
+    cdn_urls: Dict[str, str] = {}
+
+    def __init__(self, options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the renderer.
+
+        Args:
+            options: UI specific configuration rendered into the page
+        """
+        self.options = options or {}
+
+    @abc.abstractmethod
+    def render(self, title: str, openapi_url: str, asset_urls: Dict[str, str]) -> str:
+        """
+        Render the documentation page.
+
+        Args:
+            title: Page title
+            openapi_url: URL of the OpenAPI schema
+            asset_urls: URL to load every asset from, keyed by asset file name
+
+        Returns:
+            The HTML page
+        """
+
+
+class RapiDocRenderer(DocRenderer):
+    """RapiDoc web component (~0.9 MB, no stylesheet), bundled locally."""
+
+    name = "rapidoc"
+    label = "RapiDoc"
+    local_files = {"rapidoc-min.js": "application/javascript"}
+    cdn_urls = {"rapidoc-min.js": "https://cdn.jsdelivr.net/npm/rapidoc@9.3.8/dist/rapidoc-min.js"}
+
+    def render(self, title: str, openapi_url: str, asset_urls: Dict[str, str]) -> str:
+        """Render the RapiDoc page; options become <rapi-doc> attributes."""
+        attributes = {"render-style": "read", "show-header": "false"}
+        attributes.update({key: _attribute_value(value) for key, value in self.options.items()})
+        attributes["spec-url"] = openapi_url
+        rendered_attributes = " ".join(
+            f'{key}="{html.escape(value)}"' for key, value in attributes.items()
+        )
+        return f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+        <title>{title}</title>
+        <meta charset="utf-8"/>
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <script type="module" src="{asset_urls["rapidoc-min.js"]}"></script>
+        </head>
+        <body>
+        <rapi-doc {rendered_attributes}></rapi-doc>
+        </body>
+        </html>
+        """
+
+
+class ElementsRenderer(DocRenderer):
+    """Stoplight Elements web component, loaded from the CDN."""
+
+    name = "elements"
+    label = "Elements"
+    cdn_urls = {
+        "web-components.min.js": "https://unpkg.com/@stoplight/elements@9/web-components.min.js",
+        "styles.min.css": "https://unpkg.com/@stoplight/elements@9/styles.min.css",
+    }
+
+    def render(self, title: str, openapi_url: str, asset_urls: Dict[str, str]) -> str:
+        """Render the Elements page; options become <elements-api> attributes."""
+        attributes = {"router": "hash", "layout": "sidebar"}
+        attributes.update({key: _attribute_value(value) for key, value in self.options.items()})
+        attributes["apiDescriptionUrl"] = openapi_url
+        rendered_attributes = " ".join(
+            f'{key}="{html.escape(value)}"' for key, value in attributes.items()
+        )
+        return f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+        <title>{title}</title>
+        <meta charset="utf-8"/>
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <link rel="stylesheet" href="{asset_urls["styles.min.css"]}">
+        <script src="{asset_urls["web-components.min.js"]}"></script>
+        </head>
+        <body>
+        <elements-api {rendered_attributes}></elements-api>
+        </body>
+        </html>
+        """
+
+
+class ScalarRenderer(DocRenderer):
+    """Scalar API reference, loaded from the CDN."""
+
+    name = "scalar"
+    label = "Scalar"
+    cdn_urls = {"api-reference.js": "https://cdn.jsdelivr.net/npm/@scalar/api-reference@1"}
+
+    def render(self, title: str, openapi_url: str, asset_urls: Dict[str, str]) -> str:
+        """Render the Scalar page; options become its JSON configuration."""
+        configuration = html.escape(json.dumps(self.options))
+        return f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+        <title>{title}</title>
+        <meta charset="utf-8"/>
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        </head>
+        <body>
+        <script id="api-reference" data-url="{html.escape(openapi_url)}" data-configuration="{configuration}"></script>
+        <script src="{asset_urls["api-reference.js"]}"></script>
+        </body>
+        </html>
+        """
+
+
+def _attribute_value(value: Any) -> str:
+    """Convert an option value to an HTML attribute value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
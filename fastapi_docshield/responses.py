@@ -0,0 +1,197 @@
+"""
+Pre-rendered response bodies for DocShield.
+
+Documentation pages and generated assets are rendered once and kept as bytes
+together with a gzip-compressed variant and an ETag, so each request only
+negotiates the encoding and answers conditional requests with 304. The
+same content can be written straight to an ASGI ``send`` callable with
+precomputed headers, bypassing Response objects entirely.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.types import Scope, Send
+
+# Bodies smaller than this are not worth compressing
+MIN_GZIP_SIZE = 512
+
+# Cache-Control of the protected pages and schema: always revalidate via ETag
+DOCS_CACHE_CONTROL = "private, no-cache"
+
+
+class CachedContent:
+    """A response body with its gzip variant and ETag, computed once."""
+
+    __slots__ = ("body", "gzip_body", "etag", "media_type", "vary", "_raw_headers")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str,
+        vary: str = "Accept-Encoding",
+        etag: Optional[str] = None,
+    ):
+        """
+        Initialize cached content.
+
+        Args:
+            body: The uncompressed response body
+            media_type: The response media type
+            vary: Vary header value, naming the request headers that select
+                this representation
+            etag: ETag to send instead of the hash of the body, e.g. the
+                version of the document a patch produces
+        """
+        self.body = body
+        self.media_type = media_type
+        self.vary = vary
+        # Weak ETag, shared by the identity and gzip representations
+        self.etag = etag or f'W/"{hashlib.sha256(body).hexdigest()[:16]}"'
+        self.gzip_body: Optional[bytes] = None
+        if len(body) >= MIN_GZIP_SIZE:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                self.gzip_body = compressed
+        # Raw ASGI headers keyed by (cache_control, status, gzip)
+        self._raw_headers: Dict[Tuple[str, int, bool], List[Tuple[bytes, bytes]]] = {}
+
+    def to_response(self, request: Request, cache_control: str) -> Response:
+        """
+        Build the response for a request.
+
+        Answers with 304 when If-None-Match matches and serves the gzip
+        variant when the client accepts it.
+
+        Args:
+            request: The incoming request
+            cache_control: Cache-Control header value
+
+        Returns:
+            The response
+        """
+        headers: Dict[str, str] = {
+            "ETag": self.etag,
+            "Cache-Control": cache_control,
+            "Vary": self.vary,
+        }
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+
+        body = self.body
+        if self.gzip_body is not None and accepts_gzip(request.headers.get("accept-encoding")):
+            body = self.gzip_body
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+    def raw_headers(self, cache_control: str, status_code: int, gzipped: bool) -> List[Tuple[bytes, bytes]]:
+        """Return the precomputed ASGI headers of one response variant."""
+        key = (cache_control, status_code, gzipped)
+        headers = self._raw_headers.get(key)
+        if headers is None:
+            headers = [
+                (b"etag", self.etag.encode("latin-1")),
+                (b"cache-control", cache_control.encode("latin-1")),
+                (b"vary", self.vary.encode("latin-1")),
+            ]
+            if status_code == 200:
+                body = self.gzip_body if gzipped else self.body
+                headers.append((b"content-type", self.media_type.encode("latin-1")))
+                headers.append((b"content-length", str(len(body)).encode("latin-1")))
+                if gzipped:
+                    headers.append((b"content-encoding", b"gzip"))
+            self._raw_headers[key] = headers
+        return headers
+
+    async def send(
+        self,
+        scope: Scope,
+        send: Send,
+        cache_control: str,
+        extra_headers: Iterable[Tuple[bytes, bytes]] = (),
+    ) -> None:
+        """
+        Write the response for an ASGI request directly to ``send``.
+
+        Behaves like to_response: answers with 304 when If-None-Match matches
+        and serves the gzip variant when the client accepts it.
+
+        Args:
+            scope: The ASGI connection scope
+            send: The ASGI send callable
+            cache_control: Cache-Control header value
+            extra_headers: Additional raw headers, e.g. Set-Cookie
+        """
+        if_none_match = accept_encoding = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+            elif name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+
+        if etag_matches(if_none_match, self.etag):
+            status_code, gzipped, body = 304, False, b""
+        elif self.gzip_body is not None and accepts_gzip(accept_encoding):
+            status_code, gzipped, body = 200, True, self.gzip_body
+        else:
+            status_code, gzipped, body = 200, False, self.body
+
+        headers = self.raw_headers(cache_control, status_code, gzipped)
+        if extra_headers:
+            headers = [*headers, *extra_headers]
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({
+            "type": "http.response.body",
+            "body": b"" if scope["method"] == "HEAD" else body,
+        })
+
+
+def json_content(
+    value: Any,
+    vary: str = "Accept-Encoding",
+    media_type: str = "application/json",
+    etag: Optional[str] = None,
+) -> CachedContent:
+    """Serialize a JSON document compactly into cached content."""
+    body = json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return CachedContent(body, media_type, vary, etag)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Check whether an Accept-Encoding header allows gzip."""
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            quality = params.strip().lower()
+            if quality.startswith("q="):
+                try:
+                    return float(quality[2:]) > 0
+                except ValueError:
+                    return False
+            return True
+    return False
@@ -0,0 +1,131 @@
+"""
+Operation search over an OpenAPI schema.
+
+Filtering a very large specification in the browser means downloading and
+scanning all of it. SearchIndex builds an inverted index over each
+operation's operationId, path segments, summary, description, tags and
+parameter names once per schema, so a query only touches the postings of
+its terms.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import bisect
+import re
+from typing import Any, Dict, List, Tuple
+
+from .views import HTTP_METHODS
+
+# Words: acronyms, capitalized or lowercase runs and numbers, so that
+# "getUserByID", "get_user_by_id" and "/users/{user_id}" share tokens
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+# Score of a term found in each field
+FIELD_WEIGHTS = {
+    "operationId": 3.0,
+    "path": 3.0,
+    "summary": 2.0,
+    "tags": 2.0,
+    "parameters": 1.5,
+    "description": 1.0,
+}
+
+# Share of the score a term earns when it only prefixes a word
+PREFIX_MATCH_FACTOR = 0.5
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase words, breaking camelCase and snake_case."""
+    return [word.lower() for word in _WORD.findall(text)]
+
+
+class SearchIndex:
+    """An inverted index of the operations of one OpenAPI schema."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Index a schema.
+
+        Args:
+            schema: The OpenAPI schema
+        """
+        self.operations: List[Dict[str, Any]] = []
+        # Word -> {operation index: score}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        for path, path_item in schema.get("paths", {}).items():
+            shared_parameters = path_item.get("parameters", [])
+            for method, operation in path_item.items():
+                if method not in HTTP_METHODS:
+                    continue
+                index = len(self.operations)
+                tags = operation.get("tags") or []
+                self.operations.append({
+                    "operationId": operation.get("operationId"),
+                    "method": method.upper(),
+                    "path": path,
+                    "summary": operation.get("summary"),
+                    "tags": tags,
+                })
+                parameters = [*shared_parameters, *operation.get("parameters", [])]
+                fields = {
+                    "operationId": operation.get("operationId") or "",
+                    "path": path,
+                    "summary": operation.get("summary") or "",
+                    "tags": " ".join(tags),
+                    "parameters": " ".join(parameter.get("name", "") for parameter in parameters),
+                    "description": operation.get("description") or "",
+                }
+                for field, text in fields.items():
+                    weight = FIELD_WEIGHTS[field]
+                    for word in set(tokenize(text)):
+                        postings = self._postings.setdefault(word, {})
+                        postings[index] = postings.get(index, 0.0) + weight
+        self._words = sorted(self._postings)
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find the operations matching every word of a query.
+
+        A query word matches an indexed word exactly or, with a lower score,
+        as its prefix, so "cust" finds "customers".
+
+        Args:
+            query: Free text, e.g. "list customer invoices"
+            limit: Maximum number of results
+
+        Returns:
+            The best matching operations, highest score first, each with its
+            operationId, method, path, summary, tags and score
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        scores: Dict[int, float] = {}
+        for position, term in enumerate(sorted(terms, key=len, reverse=True)):
+            matches = self._match(term)
+            if position == 0:
+                scores = matches
+            else:
+                scores = {index: score + matches[index] for index, score in scores.items() if index in matches}
+            if not scores:
+                return []
+        ranked: List[Tuple[float, int]] = sorted((-score, index) for index, score in scores.items())
+        return [
+            {**self.operations[index], "score": -negative_score}
+            for negative_score, index in ranked[:limit]
+        ]
+
+    def _match(self, term: str) -> Dict[int, float]:
+        """Return the best score of every operation containing the term or a word it prefixes."""
+        matches = dict(self._postings.get(term, {}))
+        start = bisect.bisect_right(self._words, term)
+        for word in self._words[start:]:
+            if not word.startswith(term):
+                break
+            for index, score in self._postings[word].items():
+                prefix_score = score * PREFIX_MATCH_FACTOR
+                if prefix_score > matches.get(index, 0.0):
+                    matches[index] = prefix_score
+        return matches
@@ -0,0 +1,102 @@
+"""
+Signed session cookies for DocShield.
+
+After a successful HTTP Basic login DocShield can issue a short-lived,
+HMAC-signed cookie. Later documentation requests carrying the cookie are
+authenticated with a single HMAC check instead of a credential verification.
+A keyed digest of the user's stored credential is signed into the cookie, so
+changing or removing the credential ends the session.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+from typing import Any, Callable, Optional, Union
+
+
+class SessionSigner:
+    """Issues and verifies signed "username.expiry.credential.signature" session tokens."""
+
+    def __init__(
+        self,
+        secret: Optional[Union[str, bytes]] = None,
+        max_age: int = 900,
+        cookie_name: str = "docshield_session",
+    ):
+        """
+        Initialize the signer.
+
+        Args:
+            secret: Signing key; a random per-process key is used if omitted,
+                so sessions end on restart and are not shared between workers
+            max_age: Session lifetime in seconds
+            cookie_name: Name of the session cookie
+        """
+        if secret is None:
+            secret = secrets.token_bytes(32)
+        self.secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+        self.max_age = max_age
+        self.cookie_name = cookie_name
+
+    def _signature(self, payload: str) -> str:
+        digest = hmac.new(self.secret, payload.encode("utf-8"), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+    def _credential_digest(self, credential: Any) -> str:
+        """Return a short keyed digest of a stored credential, or "" if there is none."""
+        if credential is None:
+            return ""
+        digest = hmac.new(self.secret, f"credential:{credential}".encode("utf-8"), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest[:16]).decode("ascii").rstrip("=")
+
+    def issue(self, username: str, credential: Any = None) -> str:
+        """
+        Return a signed session token for a username.
+
+        Args:
+            username: The authenticated username
+            credential: The user's stored credential, which the token is bound to
+        """
+        encoded_user = base64.urlsafe_b64encode(username.encode("utf-8")).decode("ascii").rstrip("=")
+        payload = f"{encoded_user}.{int(time.time()) + self.max_age}.{self._credential_digest(credential)}"
+        return f"{payload}.{self._signature(payload)}"
+
+    def verify(
+        self,
+        token: Optional[str],
+        credential_of: Optional[Callable[[str], Any]] = None,
+    ) -> Optional[str]:
+        """
+        Verify a session token.
+
+        Args:
+            token: The cookie value, if any
+            credential_of: Returns a user's current stored credential; the
+                token is rejected if it was issued for a different one
+
+        Returns:
+            The username if the token is authentic, unexpired and bound to the
+            user's current credential, otherwise None
+        """
+        if not token:
+            return None
+        payload, _, signature = token.rpartition(".")
+        if not hmac.compare_digest(self._signature(payload), signature):
+            return None
+        try:
+            encoded_user, expires_at, credential_digest = payload.split(".")
+            if int(expires_at) < time.time():
+                return None
+            username = base64.urlsafe_b64decode(encoded_user + "=" * (-len(encoded_user) % 4)).decode("utf-8")
+        except ValueError:
+            return None
+        credential = credential_of(username) if credential_of is not None else None
+        if not hmac.compare_digest(self._credential_digest(credential), credential_digest):
+            return None
+        return username
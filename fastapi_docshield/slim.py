@@ -0,0 +1,204 @@
+"""
+A slimmed-down OpenAPI schema for machine consumers.
+
+Code generators and gateways do not read markdown descriptions or examples,
+which often make up half of a large specification. slim_schema strips such
+annotation fields and moves inline schemas that occur more than once into
+shared components, referenced with $ref, so the "lite" document is much
+smaller than the full one while describing the same API.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Fields stripped by default
+LITE_STRIP_FIELDS = ("description", "example", "examples", "externalDocs")
+
+# Keys whose object values map user-chosen names (property names, paths,
+# status codes, ...) to definitions; their keys are never stripped
+_NAME_MAPS = frozenset({
+    "properties", "patternProperties", "$defs", "definitions", "paths", "webhooks", "responses",
+    "content", "headers", "callbacks", "links", "encoding", "variables", "mapping", "scopes",
+    "schemas", "parameters", "requestBodies", "securitySchemes", "pathItems",
+})
+
+# Keys whose values are schemas, or lists or maps of schemas
+_SCHEMA_KEYS = frozenset({"schema", "items", "additionalProperties", "not", "contains", "propertyNames"})
+_SCHEMA_LIST_KEYS = frozenset({"allOf", "anyOf", "oneOf", "prefixItems"})
+_SCHEMA_MAP_KEYS = frozenset({"properties", "patternProperties"})
+
+# Inline schemas shorter than this (serialized) stay inline; a $ref is about 40 bytes
+MIN_HOIST_SIZE = 80
+
+
+def slim_schema(schema: Dict[str, Any], strip_fields: Iterable[str] = LITE_STRIP_FIELDS) -> Dict[str, Any]:
+    """
+    Build the lite variant of a schema.
+
+    Response descriptions are kept because OpenAPI requires them.
+
+    Args:
+        schema: The full OpenAPI schema; it is not modified
+        strip_fields: Annotation fields to remove, e.g. ("description", "example")
+
+    Returns:
+        The slimmed schema
+    """
+    slim = _strip(schema, frozenset(strip_fields), False)
+    components = slim.get("components", {})
+    schemas: Dict[str, Any] = dict(components.get("schemas", {}))
+
+    # Count the inline schemas outside the named components
+    counts: Dict[str, int] = {}
+    for key, value in slim.items():
+        if key != "components":
+            _count_schemas(value, False, counts)
+    for section, entries in components.items():
+        if section != "schemas":
+            _count_schemas(entries, False, counts)
+    for entry in schemas.values():
+        # Named schemas only count for their nested schemas
+        _count_schemas(entry, False, counts, top_level=True)
+
+    # Inline copies of a named schema, or inline schemas used twice, become references
+    names = {_canonical(entry): name for name, entry in schemas.items()}
+    hoisted = {key for key, count in counts.items() if count > 1 or key in names}
+    if not hoisted:
+        return slim
+    hoister = _Hoister(schemas, names, hoisted)
+    for key in list(slim):
+        if key != "components":
+            slim[key] = hoister.visit(slim[key], False)
+    for section in list(components):
+        if section != "schemas":
+            components[section] = hoister.visit(components[section], False)
+    for name in list(schemas):
+        schemas[name] = hoister.visit(schemas[name], False, top_level=True)
+    slim["components"] = {**components, "schemas": schemas}
+    return slim
+
+
+def _strip(value: Any, strip_fields: frozenset, names: bool, response: bool = False) -> Any:
+    """Copy a JSON value without the stripped fields."""
+    if isinstance(value, list):
+        return [_strip(item, strip_fields, False) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if names:
+        return {key: _strip(item, strip_fields, False, response) for key, item in value.items()}
+    copied = {}
+    for key, item in value.items():
+        if key in strip_fields and not (response and key == "description"):
+            continue
+        copied[key] = _strip(item, strip_fields, key in _NAME_MAPS, key == "responses")
+    return copied
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _is_candidate(value: Any) -> bool:
+    """Return True for an inline schema worth hoisting into components."""
+    return (
+        isinstance(value, dict)
+        and "$ref" not in value
+        and ("properties" in value or "items" in value or "enum" in value or "allOf" in value
+             or "anyOf" in value or "oneOf" in value)
+    )
+
+
+def _count_schemas(value: Any, is_schema: bool, counts: Dict[str, int], top_level: bool = False) -> None:
+    """Count the inline schemas below a JSON value by their canonical form."""
+    if isinstance(value, list):
+        for item in value:
+            _count_schemas(item, is_schema, counts)
+        return
+    if not isinstance(value, dict):
+        return
+    if is_schema and not top_level and _is_candidate(value):
+        key = _canonical(value)
+        if len(key) >= MIN_HOIST_SIZE:
+            counts[key] = counts.get(key, 0) + 1
+    for key, item in value.items():
+        if key in _SCHEMA_MAP_KEYS and isinstance(item, dict) and (is_schema or top_level):
+            for schema in item.values():
+                _count_schemas(schema, True, counts)
+        elif key in _SCHEMA_LIST_KEYS and isinstance(item, list):
+            for schema in item:
+                _count_schemas(schema, True, counts)
+        else:
+            _count_schemas(item, key in _SCHEMA_KEYS, counts)
+
+
+class _Hoister:
+    """Replaces hoisted inline schemas with references to shared components."""
+
+    def __init__(self, schemas: Dict[str, Any], names: Dict[str, str], hoisted: Set[str]):
+        self.schemas = schemas
+        self.names = names
+        self.hoisted = hoisted
+
+    def visit(self, value: Any, is_schema: bool, top_level: bool = False) -> Any:
+        if isinstance(value, list):
+            return [self.visit(item, is_schema) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if is_schema and not top_level and _is_candidate(value):
+            key = _canonical(value)
+            if key in self.hoisted:
+                return {"$ref": f"#/components/schemas/{self._name(key, value)}"}
+        copied = {}
+        for key, item in value.items():
+            if key in _SCHEMA_MAP_KEYS and isinstance(item, dict) and (is_schema or top_level):
+                copied[key] = {name: self.visit(schema, True) for name, schema in item.items()}
+            elif key in _SCHEMA_LIST_KEYS and isinstance(item, list):
+                copied[key] = [self.visit(schema, True) for schema in item]
+            else:
+                copied[key] = self.visit(item, key in _SCHEMA_KEYS)
+        return copied
+
+    def _name(self, key: str, value: Dict[str, Any]) -> str:
+        """Return the component name of a hoisted schema, adding the component on first use."""
+        name = self.names.get(key)
+        if name is not None:
+            return name
+        base = re.sub(r"[^A-Za-z0-9._-]+", "", str(value.get("title", ""))) or "InlineSchema"
+        name, suffix = base, 2
+        while name in self.schemas:
+            name, suffix = f"{base}{suffix}", suffix + 1
+        self.names[key] = name
+        # Reserve the name while nested schemas are hoisted
+        self.schemas[name] = None
+        self.schemas[name] = self.visit(value, False, top_level=True)
+        return name
+
+
+def wants_lite(query_value: Optional[str], accept: Optional[str]) -> bool:
+    """
+    Check whether a request asks for the lite schema.
+
+    Args:
+        query_value: The "lite" query parameter, if present; any value but
+            "0" and "false" selects the lite variant
+        accept: The Accept header; a media range with profile="lite"
+            selects the lite variant
+
+    Returns:
+        True for the lite variant
+    """
+    if query_value is not None:
+        return query_value.lower() not in ("0", "false")
+    if not accept:
+        return False
+    for media_range in accept.split(","):
+        for parameter in media_range.split(";")[1:]:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "profile" and value.strip().strip('"') == "lite":
+                return True
+    return False
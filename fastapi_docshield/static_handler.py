@@ -9,62 +9,280 @@ License: MIT
 Copyright (c) 2025 George Khananaev
 """
 
+import hashlib
 import os
 from pathlib import Path
-from typing import Optional
-from fastapi import FastAPI, Response
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import FileResponse
+from starlette.routing import BaseRoute
 import logging
+from .responses import CachedContent
 
 logger = logging.getLogger(__name__)
 
+# Directory holding the bundled documentation assets
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Default CDN locations of the documentation bundles
+SWAGGER_JS_CDN_URL = "https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js"
+SWAGGER_CSS_CDN_URL = "https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css"
+REDOC_JS_CDN_URL = "https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js"
+REDOC_FONTS_CDN_URL = (
+    "https://fonts.googleapis.com/css?family=Montserrat:300,400,700|Roboto:300,400,700&display=swap"
+)
+
+# Bundled ReDoc font files and their media types
+FONT_FILES = {
+    "fonts.css": "text/css",
+    "montserrat-latin.woff2": "font/woff2",
+    "roboto-latin.woff2": "font/woff2",
+}
+
+# URL prefix of all assets served by DocShield
+STATIC_URL_PREFIX = "/docshield/static/"
+
 class StaticHandler:
     """Handles static file serving with CDN fallback support."""
     
-    def __init__(self, app: FastAPI):
-        """Initialize the static handler with the FastAPI app."""
+    def __init__(
+        self,
+        app: FastAPI,
+        authenticate: Optional[Callable[[Request], Awaitable[str]]] = None,
+        check_client: Optional[Callable[[Request], None]] = None,
+        register_routes: bool = True,
+    ):
+        """
+        Initialize the static handler with the FastAPI app.
+        
+        Args:
+            app: The FastAPI application instance
+            authenticate: Optional request authenticator; when given, every
+                static asset requires authentication and is cached privately
+            check_client: Optional check run before authentication, e.g. an
+                IP filter; assets are then also cached privately
+            register_routes: Add the asset routes to the app; when False the
+                assets are served through get_asset, e.g. by a middleware
+        """
         self.app = app
-        self.static_dir = Path(__file__).parent / "static"
-        self._setup_static_routes()
+        self.set_access(authenticate, check_client)
+        self.static_dir = STATIC_DIR
+        # Generated assets (e.g. externalized custom CSS/JS), keyed by hashed file name
+        self.content_assets: Dict[str, CachedContent] = {}
+        # Bundled files by URL path, loaded into memory on first use by get_asset
+        self.files: Dict[str, Tuple[Path, str]] = {
+            f"{STATIC_URL_PREFIX}swagger-ui-bundle.js": (
+                self.static_dir / "swagger" / "swagger-ui-bundle.js", "application/javascript"
+            ),
+            f"{STATIC_URL_PREFIX}swagger-ui.css": (
+                self.static_dir / "swagger" / "swagger-ui.css", "text/css"
+            ),
+            f"{STATIC_URL_PREFIX}redoc.standalone.js": (
+                self.static_dir / "redoc" / "redoc.standalone.js", "application/javascript"
+            ),
+        }
+        for filename, media_type in FONT_FILES.items():
+            self.files[f"{STATIC_URL_PREFIX}fonts/{filename}"] = (
+                self.static_dir / "fonts" / filename, media_type
+            )
+        self._file_contents: Dict[str, CachedContent] = {}
+        self.register_routes = register_routes
+        # Routes added to the app, so they can be removed by identity
+        self.routes: List[BaseRoute] = []
+        if register_routes:
+            self._setup_static_routes()
+    
+    def set_access(
+        self,
+        authenticate: Optional[Callable[[Request], Awaitable[str]]],
+        check_client: Optional[Callable[[Request], None]],
+    ) -> None:
+        """Set the access checks for assets and the matching cache scope."""
+        self.authenticate = authenticate
+        self.check_client = check_client
+        self.cache_scope = "private" if authenticate or check_client else "public"
+        self.cache_control = f"{self.cache_scope}, max-age=3600"
     
     def _setup_static_routes(self):
         """Set up routes for serving local static files."""
+        start = len(self.app.router.routes)
         
         @self.app.get("/docshield/static/swagger-ui-bundle.js", include_in_schema=False)
-        async def serve_swagger_js():
+        async def serve_swagger_js(request: Request):
             """Serve Swagger UI JavaScript bundle."""
+            await self.check_access(request)
             file_path = self.static_dir / "swagger" / "swagger-ui-bundle.js"
             if file_path.exists():
                 return FileResponse(
                     file_path,
                     media_type="application/javascript",
-                    headers={"Cache-Control": "public, max-age=3600"}
+                    headers={"Cache-Control": self.cache_control}
                 )
             return Response(content="// Swagger UI bundle not found", status_code=404)
         
         @self.app.get("/docshield/static/swagger-ui.css", include_in_schema=False)
-        async def serve_swagger_css():
+        async def serve_swagger_css(request: Request):
             """Serve Swagger UI CSS."""
+            await self.check_access(request)
             file_path = self.static_dir / "swagger" / "swagger-ui.css"
             if file_path.exists():
                 return FileResponse(
                     file_path,
                     media_type="text/css",
-                    headers={"Cache-Control": "public, max-age=3600"}
+                    headers={"Cache-Control": self.cache_control}
                 )
             return Response(content="/* Swagger UI CSS not found */", status_code=404)
         
         @self.app.get("/docshield/static/redoc.standalone.js", include_in_schema=False)
-        async def serve_redoc_js():
+        async def serve_redoc_js(request: Request):
             """Serve ReDoc JavaScript bundle."""
+            await self.check_access(request)
             file_path = self.static_dir / "redoc" / "redoc.standalone.js"
             if file_path.exists():
                 return FileResponse(
                     file_path,
                     media_type="application/javascript",
-                    headers={"Cache-Control": "public, max-age=3600"}
+                    headers={"Cache-Control": self.cache_control}
                 )
             return Response(content="// ReDoc bundle not found", status_code=404)
+        
+        @self.app.get("/docshield/static/fonts/{filename}", include_in_schema=False)
+        async def serve_font(filename: str, request: Request):
+            """Serve bundled ReDoc fonts and their stylesheet."""
+            await self.check_access(request)
+            media_type = FONT_FILES.get(filename)
+            file_path = self.static_dir / "fonts" / filename
+            if media_type is not None and file_path.exists():
+                return FileResponse(
+                    file_path,
+                    media_type=media_type,
+                    headers={"Cache-Control": self.cache_control}
+                )
+            return Response(content="/* Font not found */", status_code=404)
+        
+        @self.app.get("/docshield/static/custom/{filename}", include_in_schema=False)
+        async def serve_content_asset(filename: str, request: Request):
+            """Serve a generated, content-hashed asset."""
+            await self.check_access(request)
+            asset = self.content_assets.get(filename)
+            if asset is not None:
+                # The file name changes with the content, so it can be cached forever
+                return asset.to_response(request, f"{self.cache_scope}, max-age=31536000, immutable")
+            return Response(content="/* Asset not found */", status_code=404)
+        
+        self.routes.extend(self.app.router.routes[start:])
+    
+    def get_asset(self, path: str) -> Optional[Tuple[CachedContent, str]]:
+        """
+        Look up the asset served at a URL path.
+        
+        Args:
+            path: The request path, e.g. "/docshield/static/swagger-ui.css"
+            
+        Returns:
+            The asset content and its Cache-Control value, or None if unknown
+        """
+        custom_prefix = f"{STATIC_URL_PREFIX}custom/"
+        if path.startswith(custom_prefix):
+            asset = self.content_assets.get(path[len(custom_prefix):])
+            if asset is None:
+                return None
+            return asset, f"{self.cache_scope}, max-age=31536000, immutable"
+        
+        content = self._file_contents.get(path)
+        if content is None:
+            entry = self.files.get(path)
+            if entry is None or not entry[0].exists():
+                return None
+            file_path, media_type = entry
+            content = CachedContent(file_path.read_bytes(), media_type)
+            self._file_contents[path] = content
+        return content, self.cache_control
+    
+    async def check_access(self, request: Request) -> None:
+        """Check the client and authenticate a static asset request when assets are protected."""
+        if self.check_client is not None:
+            self.check_client(request)
+        if self.authenticate is not None:
+            await self.authenticate(request)
+    
+    def add_content_asset(self, filename: str, content: bytes, media_type: str) -> str:
+        """
+        Register a generated asset under a content-hashed file name.
+        
+        Args:
+            filename: Base file name, e.g. "custom.css"
+            content: The asset body
+            media_type: The asset media type
+            
+        Returns:
+            The URL the asset is served from
+        """
+        stem, dot, suffix = filename.rpartition(".")
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        hashed_name = f"{stem}.{digest}{dot}{suffix}"
+        self.content_assets[hashed_name] = CachedContent(content, media_type)
+        return f"/docshield/static/custom/{hashed_name}"
+    
+    def remove_content_asset(self, url: str) -> None:
+        """
+        Stop serving an asset registered with add_content_asset.
+        
+        Args:
+            url: The URL add_content_asset returned
+        """
+        self.content_assets.pop(url.rpartition("/")[2], None)
+    
+    def register_renderer(self, renderer) -> None:
+        """
+        Set up the route serving a documentation renderer's bundled assets.
+        
+        Args:
+            renderer: A DocRenderer whose local_files live in static/<renderer.name>/
+        """
+        if not renderer.local_files:
+            return
+        for filename, media_type in renderer.local_files.items():
+            self.files[f"{STATIC_URL_PREFIX}{renderer.name}/{filename}"] = (
+                self.static_dir / renderer.name / filename, media_type
+            )
+        if not self.register_routes:
+            return
+        start = len(self.app.router.routes)
+        
+        @self.app.get(f"/docshield/static/{renderer.name}/{{filename}}", include_in_schema=False)
+        async def serve_renderer_asset(filename: str, request: Request):
+            """Serve a bundled renderer asset."""
+            await self.check_access(request)
+            media_type = renderer.local_files.get(filename)
+            file_path = self.static_dir / renderer.name / filename
+            if media_type is not None and file_path.exists():
+                return FileResponse(
+                    file_path,
+                    media_type=media_type,
+                    headers={"Cache-Control": self.cache_control}
+                )
+            return Response(content="// Asset not found", status_code=404)
+        
+        self.routes.extend(self.app.router.routes[start:])
+    
+    def get_renderer_urls(self, renderer, prefer_local: bool = False) -> Dict[str, str]:
+        """
+        Get a renderer's asset URLs based on preference and availability.
+        
+        Args:
+            renderer: The DocRenderer to resolve assets for
+            prefer_local: If True, prefer bundled files over CDN
+            
+        Returns:
+            Asset URL keyed by asset file name
+        """
+        urls = dict(renderer.cdn_urls)
+        if prefer_local:
+            for filename in renderer.local_files:
+                if (self.static_dir / renderer.name / filename).exists():
+                    urls[filename] = f"/docshield/static/{renderer.name}/{filename}"
+        return urls
     
     def get_swagger_urls(self, prefer_local: bool = False) -> tuple[str, str]:
         """
@@ -83,10 +301,7 @@ class StaticHandler:
             )
         
         # Default to CDN
-        return (
-            "https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
-            "https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css"
-        )
+        return (SWAGGER_JS_CDN_URL, SWAGGER_CSS_CDN_URL)
     
     def get_redoc_url(self, prefer_local: bool = False) -> str:
         """
@@ -102,14 +317,30 @@ class StaticHandler:
             return "/docshield/static/redoc.standalone.js"
         
         # Default to CDN
-        return "https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js"
+        return REDOC_JS_CDN_URL
+    
+    def get_fonts_url(self, prefer_local: bool = False) -> str:
+        """
+        Get the ReDoc fonts stylesheet URL based on preference and availability.
+        
+        Args:
+            prefer_local: If True, prefer the bundled fonts over Google Fonts
+            
+        Returns:
+            Fonts stylesheet URL
+        """
+        if prefer_local and self._check_local_files("fonts"):
+            return "/docshield/static/fonts/fonts.css"
+        
+        # Default to Google Fonts
+        return REDOC_FONTS_CDN_URL
     
     def _check_local_files(self, doc_type: str) -> bool:
         """
         Check if local static files exist.
         
         Args:
-            doc_type: Either "swagger" or "redoc"
+            doc_type: One of "swagger", "redoc" or "fonts"
             
         Returns:
             True if all required files exist
@@ -121,6 +352,8 @@ class StaticHandler:
         elif doc_type == "redoc":
             js_file = self.static_dir / "redoc" / "redoc.standalone.js"
             return js_file.exists()
+        elif doc_type == "fonts":
+            return all((self.static_dir / "fonts" / name).exists() for name in FONT_FILES)
         return False
     
     def get_fallback_html(self, doc_type: str) -> str:
@@ -0,0 +1,185 @@
+"""
+Role-based views of the OpenAPI schema.
+
+A SchemaView selects operations by tag, path pattern or operationId, in
+both paths and webhooks. The filtered schema keeps only the components the
+selected operations reference, directly or through other components, so a
+view does not leak the shapes of hidden endpoints.
+
+Author: George Khananaev
+License: MIT
+Copyright (c) 2025 George Khananaev
+"""
+
+import copy
+import fnmatch
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Keys of a path item that hold operations
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+
+class SchemaView:
+    """
+    A filter selecting the operations one role may see.
+
+    An operation is included when it matches any of the given filters; a
+    view without filters includes everything.
+    """
+
+    def __init__(
+        self,
+        tags: Optional[Iterable[str]] = None,
+        paths: Optional[Iterable[str]] = None,
+        operations: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the view.
+
+        Args:
+            tags: Operation tags to include, e.g. ["public"]
+            paths: Path patterns to include, with shell-style wildcards,
+                e.g. ["/public/*"]
+            operations: operationIds to include
+        """
+        self.tags = set(tags or ())
+        self.paths = list(paths or ())
+        self.operations = set(operations or ())
+
+    def includes(self, path: str, operation: Dict[str, Any]) -> bool:
+        """Return True if an operation belongs to the view; for webhooks, path is the webhook name."""
+        if not (self.tags or self.paths or self.operations):
+            return True
+        if self.tags.intersection(operation.get("tags", ())):
+            return True
+        if operation.get("operationId") in self.operations:
+            return True
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in self.paths)
+
+    def apply(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the filtered schema for this view.
+
+        Args:
+            schema: The full OpenAPI schema; it is not modified
+
+        Returns:
+            A schema with only the included operations and webhooks, their
+            tags and the components they reference
+        """
+        view = {
+            key: value for key, value in schema.items()
+            if key not in ("paths", "webhooks", "components", "tags")
+        }
+        used_tags: Set[str] = set()
+        view["paths"] = self._filter_path_items(schema.get("paths", {}), used_tags)
+        if "webhooks" in schema:
+            webhooks = self._filter_path_items(schema["webhooks"], used_tags)
+            if webhooks:
+                view["webhooks"] = webhooks
+
+        if "tags" in schema:
+            view["tags"] = [copy.deepcopy(tag) for tag in schema["tags"] if tag.get("name") in used_tags]
+        if "components" in schema:
+            view["components"] = prune_components(schema["components"], view)
+        return view
+
+    def _filter_path_items(self, path_items: Dict[str, Any], used_tags: Set[str]) -> Dict[str, Any]:
+        """Keep the included operations of paths or webhooks, adding their tags to used_tags."""
+        kept: Dict[str, Any] = {}
+        for path, path_item in path_items.items():
+            operations = {
+                method: operation for method, operation in path_item.items()
+                if method in HTTP_METHODS and self.includes(path, operation)
+            }
+            if not operations:
+                continue
+            shared = {key: value for key, value in path_item.items() if key not in HTTP_METHODS}
+            kept[path] = copy.deepcopy({**shared, **operations})
+            for operation in operations.values():
+                used_tags.update(operation.get("tags", ()))
+        return kept
+
+
+def collect_refs(value: Any, refs: Set[str]) -> None:
+    """Add every "$ref" target found in a JSON value to refs."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            ref = item.get("$ref")
+            if isinstance(ref, str):
+                refs.add(ref)
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+def component_graph(components: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """Map each component's $ref to the $refs its definition uses directly."""
+    graph: Dict[str, Set[str]] = {}
+    for section, entries in components.items():
+        for name, entry in entries.items():
+            refs: Set[str] = set()
+            collect_refs(entry, refs)
+            graph[f"#/components/{section}/{name}"] = refs
+    return graph
+
+
+def prune_components(
+    components: Dict[str, Any],
+    document: Dict[str, Any],
+    graph: Optional[Dict[str, Set[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Keep only the components a document references, following nested references.
+
+    Security schemes are kept when named by a security requirement.
+
+    Args:
+        components: The full schema's components
+        document: The schema without components, e.g. a filtered view
+        graph: component_graph(components), when pruning the same components
+            repeatedly
+
+    Returns:
+        The pruned components, with empty sections dropped
+    """
+    pending: Set[str] = set()
+    collect_refs(document, pending)
+    reachable: Set[str] = set()
+    while pending:
+        ref = pending.pop()
+        if ref in reachable or not ref.startswith("#/components/"):
+            continue
+        reachable.add(ref)
+        if graph is not None:
+            pending.update(graph.get(ref, ()))
+            continue
+        _, _, section, name = ref.split("/", 3)
+        target = components.get(section, {}).get(name)
+        if target is not None:
+            collect_refs(target, pending)
+
+    security_schemes: Set[str] = set()
+    requirements = list(document.get("security", []))
+    path_items = [*document.get("paths", {}).values(), *document.get("webhooks", {}).values()]
+    for path_item in path_items:
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS:
+                requirements.extend(operation.get("security", []))
+    for requirement in requirements:
+        security_schemes.update(requirement)
+
+    pruned: Dict[str, Any] = {}
+    for section, entries in components.items():
+        if section == "securitySchemes":
+            kept = {name: entry for name, entry in entries.items() if name in security_schemes}
+        else:
+            kept = {
+                name: entry for name, entry in entries.items()
+                if f"#/components/{section}/{name}" in reachable
+            }
+        if kept:
+            pruned[section] = copy.deepcopy(kept)
+    return pruned
@@ -0,0 +1,136 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, RapiDocRenderer
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app(**kwargs):
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root():
+        return {"Hello": "World"}
+
+    DocShield(app=app, credentials={"admin": "password"}, **kwargs)
+    return app
+
+
+def test_middleware_mode_adds_no_routes():
+    """Test middleware mode leaves only the application's own routes"""
+    app = create_app(mode="middleware", renderers={"/rapidoc": RapiDocRenderer()})
+    assert [route.path for route in app.router.routes] == ["/"]
+
+
+def test_mount_mode_adds_one_route_last():
+    """Test mount mode dispatches everything through a single trailing route"""
+    app = create_app(mode="mount", renderers={"/rapidoc": RapiDocRenderer()})
+    assert [route.path for route in app.router.routes] == ["/", ""]
+
+    @app.get("/later")
+    def later():
+        return {"later": True}
+
+    client = TestClient(app)
+    assert client.get("/later").json() == {"later": True}
+    assert client.get("/rapidoc", headers=get_auth_header("admin", "password")).status_code == 200
+    assert client.get("/docshield/static/rapidoc/rapidoc-min.js").status_code == 200
+    assert client.get("/missing").status_code == 404
+
+
+@pytest.mark.parametrize("added", ["before", "after"])
+def test_mount_mode_yields_to_api_routes(added):
+    """Test API routes, even catch-alls, win over the docs however they were ordered"""
+    app = FastAPI()
+
+    def add_catch_all():
+        @app.get("/{slug}")
+        def page(slug: str):
+            return {"slug": slug}
+
+    if added == "before":
+        add_catch_all()
+    DocShield(app=app, credentials={"admin": "password"}, mode="mount", schema_search=True)
+    if added == "after":
+        add_catch_all()
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password")
+
+    assert client.get("/docs", headers=headers).json() == {"slug": "docs"}
+    # URLs the catch-all does not match are still served
+    assert client.get("/openapi.json/search?q=page", headers=headers).status_code == 200
+    assert client.get("/docshield/static/swagger-ui.css").status_code == 200
+
+    # Middleware mode serves the docs ahead of every route
+    middleware_app = FastAPI()
+
+    @middleware_app.get("/{slug}")
+    def page(slug: str):
+        return {"slug": slug}
+
+    DocShield(app=middleware_app, credentials={"admin": "password"}, mode="middleware")
+    assert "swagger-ui" in TestClient(middleware_app).get("/docs", headers=headers).text
+
+
+@pytest.mark.parametrize("mode", ["middleware", "mount"])
+def test_asgi_modes_serve_protected_docs(mode):
+    """Test pages and schema require auth and match the routes mode output"""
+    app = create_app(mode=mode)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password")
+
+    response = client.get("/docs")
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Basic"
+    assert response.json() == {"detail": "Not authenticated"}
+    assert client.get("/docs", headers=get_auth_header("admin", "wrong")).status_code == 401
+
+    response = client.get("/docs", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert response.headers["content-encoding"] == "gzip"
+
+    route_client = TestClient(create_app())
+    for path in ("/docs", "/redoc", "/openapi.json"):
+        assert client.get(path, headers=headers).content == route_client.get(path, headers=headers).content
+
+    schema = client.get("/openapi.json", headers=headers)
+    assert schema.json()["paths"]["/"]["get"]
+    revalidated = client.get("/openapi.json", headers={**headers, "If-None-Match": schema.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    head = client.head("/docs", headers=headers)
+    assert head.status_code == 200
+    assert head.content == b""
+
+    # Other methods and paths reach the application as usual
+    assert client.post("/docs", headers=headers).status_code in (404, 405)
+    assert client.get("/").json() == {"Hello": "World"}
+
+
+@pytest.mark.parametrize("mode", ["middleware", "mount"])
+def test_asgi_modes_static_assets_and_session(mode):
+    """Test bundled assets, static protection and session cookies without per-URL routes"""
+    app = create_app(mode=mode, protect_static=True, session_cookie=True)
+    client = TestClient(app)
+
+    assert client.get("/docshield/static/swagger-ui.css").status_code == 401
+    assert client.get("/docshield/static/missing.js").status_code == 404
+
+    response = client.get("/docs", headers=get_auth_header("admin", "password"))
+    assert response.status_code == 200
+    assert "docshield_session=" in response.headers["set-cookie"]
+
+    asset = client.get("/docshield/static/swagger-ui.css")
+    assert asset.status_code == 200
+    assert asset.headers["content-type"] == "text/css"
+    assert asset.headers["cache-control"] == "private, max-age=3600"
+    assert client.get("/docshield/static/fonts/fonts.css").status_code == 200
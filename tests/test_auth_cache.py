@@ -0,0 +1,106 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, HashedCredentials, hash_password
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app(credentials, **kwargs):
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root():
+        return {"Hello": "World"}
+
+    shield = DocShield(app=app, credentials=credentials, **kwargs)
+    return app, shield
+
+
+def count_verifications(shield):
+    calls = []
+    verify = shield._authenticate_basic
+
+    async def counting(credentials):
+        calls.append(credentials.username)
+        return await verify(credentials)
+
+    shield._authenticate_basic = counting
+    return calls
+
+
+def test_auth_cache_skips_repeat_verification():
+    """Test a verified Authorization header is only checked once"""
+    app, shield = create_app({"admin": "password"})
+    calls = count_verifications(shield)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password")
+
+    for path in ("/docs", "/openapi.json", "/docs", "/redoc"):
+        assert client.get(path, headers=headers).status_code == 200
+    assert calls == ["admin"]
+
+    # Failures are never cached
+    for _ in range(2):
+        assert client.get("/docs", headers=get_auth_header("admin", "wrong")).status_code == 401
+    assert len(calls) == 3
+
+
+def test_auth_cache_invalidated_on_credential_change():
+    """Test cached decisions end when the stored credential changes or is removed"""
+    credentials = {"admin": "password", "guest": "guest"}
+    app, shield = create_app(credentials)
+    client = TestClient(app)
+
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 200
+    credentials["admin"] = "rotated"
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 401
+
+    assert client.get("/docs", headers=get_auth_header("guest", "guest")).status_code == 200
+    del credentials["guest"]
+    assert client.get("/docs", headers=get_auth_header("guest", "guest")).status_code == 401
+
+    hashed = HashedCredentials({"admin": hash_password("password", "pbkdf2_sha256")})
+    app, shield = create_app(hashed)
+    client = TestClient(app)
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 200
+    hashed.credentials = {"admin": hash_password("other", "pbkdf2_sha256")}
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 401
+
+
+def test_auth_cache_disabled_and_cleared():
+    """Test the cache can be disabled or cleared"""
+    app, shield = create_app({"admin": "password"}, auth_cache_ttl=0)
+    calls = count_verifications(shield)
+    client = TestClient(app)
+    for _ in range(2):
+        client.get("/docs", headers=get_auth_header("admin", "password"))
+    assert len(calls) == 2
+    assert shield.auth_cache is None
+
+    app, shield = create_app({"admin": "password"})
+    calls = count_verifications(shield)
+    client = TestClient(app)
+    client.get("/docs", headers=get_auth_header("admin", "password"))
+    shield.clear_auth_cache()
+    client.get("/docs", headers=get_auth_header("admin", "password"))
+    assert len(calls) == 2
+
+
+def test_protected_static_assets_use_auth_cache():
+    """Test protected static assets share the cached authentication check"""
+    app, shield = create_app({"admin": "password"}, protect_static=True)
+    calls = count_verifications(shield)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password")
+
+    assert client.get("/docshield/static/swagger-ui.css").status_code == 401
+    assert client.get("/docs", headers=headers).status_code == 200
+    for path in ("/docshield/static/swagger-ui.css", "/docshield/static/swagger-ui-bundle.js"):
+        assert client.get(path, headers=headers).status_code == 200
+    assert calls == ["admin"]
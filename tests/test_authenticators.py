@@ -0,0 +1,201 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import Authenticator, CachingAuthenticator, DocShield, HashedCredentials, HTTPAuthenticator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import base64
+import httpx
+import threading
+
+DIRECTORY_USERS = {"admin": "password"}
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+class DirectoryHandler(BaseHTTPRequestHandler):
+    """Stand-in user directory: 204 for known credentials, 401 otherwise."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.hits += 1
+        if self.path == "/broken":
+            status = 500
+        elif self.headers.get("Authorization") in {
+            get_auth_header(user, password)["Authorization"] for user, password in DIRECTORY_USERS.items()
+        }:
+            status = 204
+        else:
+            status = 401
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def directory():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DirectoryHandler)
+    server.hits = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class CountingAuthenticator:
+    """Slow in-memory backend that records how often it is asked."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def authenticate(self, username, password):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return DIRECTORY_USERS.get(username) == password
+
+
+def test_builtin_credentials_satisfy_protocol(directory):
+    """Test the built-in backends implement the Authenticator protocol"""
+    url = f"http://127.0.0.1:{directory.server_port}/check"
+    assert isinstance(HashedCredentials({}), Authenticator)
+    assert isinstance(HTTPAuthenticator(url), Authenticator)
+    assert isinstance(CachingAuthenticator(CountingAuthenticator()), Authenticator)
+
+
+def test_http_authenticator(directory):
+    """Test checks against the stand-in directory reuse one pooled client"""
+    authenticator = HTTPAuthenticator(f"http://127.0.0.1:{directory.server_port}/check")
+
+    async def run():
+        assert await authenticator.authenticate("admin", "password")
+        client = authenticator._client
+        assert not await authenticator.authenticate("admin", "wrong")
+        assert authenticator._client is client
+        await authenticator.aclose()
+
+    asyncio.run(run())
+    assert directory.hits == 2
+
+    broken = HTTPAuthenticator(f"http://127.0.0.1:{directory.server_port}/broken")
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(broken.authenticate("admin", "password"))
+
+
+def test_http_authenticator_closes_client_of_previous_loop(directory):
+    """Test that a new event loop gets a new client and the old one is closed"""
+    authenticator = HTTPAuthenticator(f"http://127.0.0.1:{directory.server_port}/check")
+    asyncio.run(authenticator.authenticate("admin", "password"))
+    first = authenticator._client
+
+    assert asyncio.run(authenticator.authenticate("admin", "password"))
+    assert authenticator._client is not first
+    assert first.is_closed
+
+    # The client can still be closed from yet another loop
+    second = authenticator._client
+    asyncio.run(authenticator.aclose())
+    assert second.is_closed
+
+
+def test_caching_authenticator_positive_and_negative():
+    """Test successful and failed results are cached with their own TTLs"""
+    backend = CountingAuthenticator()
+    authenticator = CachingAuthenticator(backend, positive_ttl=60, negative_ttl=0)
+
+    async def run():
+        assert await authenticator.authenticate("admin", "password")
+        assert await authenticator.authenticate("admin", "password")
+        assert not await authenticator.authenticate("admin", "wrong")
+        assert not await authenticator.authenticate("admin", "wrong")
+
+    asyncio.run(run())
+    # One backend call for the success, two for the uncached failures
+    assert backend.calls == 3
+
+    cached = CachingAuthenticator(backend, negative_ttl=60)
+    asyncio.run(cached.authenticate("admin", "wrong"))
+    asyncio.run(cached.authenticate("admin", "wrong"))
+    assert backend.calls == 4
+
+
+def test_caching_authenticator_coalesces_concurrent_checks():
+    """Test identical concurrent checks reach the backend once"""
+    backend = CountingAuthenticator()
+    authenticator = CachingAuthenticator(backend)
+
+    async def run():
+        return await asyncio.gather(
+            *(authenticator.authenticate("admin", "password") for _ in range(10)),
+            authenticator.authenticate("admin", "other"),
+        )
+
+    results = asyncio.run(run())
+    assert results == [True] * 10 + [False]
+    assert backend.calls == 2
+    assert not authenticator._inflight
+
+
+def test_caching_authenticator_does_not_cache_errors(directory):
+    """Test backend errors propagate and are retried on the next request"""
+    backend = HTTPAuthenticator(f"http://127.0.0.1:{directory.server_port}/broken")
+    authenticator = CachingAuthenticator(backend)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(authenticator.authenticate("admin", "password"))
+    assert directory.hits == 2
+
+
+def test_docshield_with_http_directory(directory):
+    """Test DocShield authenticates docs requests against the directory with caching"""
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root():
+        return {"Hello": "World"}
+
+    DocShield(
+        app=app,
+        credentials=CachingAuthenticator(
+            HTTPAuthenticator(f"http://127.0.0.1:{directory.server_port}/check")
+        ),
+    )
+    client = TestClient(app)
+
+    assert client.get("/docs").status_code == 401
+    assert client.get("/docs", headers=get_auth_header("admin", "wrong")).status_code == 401
+    for _ in range(3):
+        assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 200
+        assert client.get("/openapi.json", headers=get_auth_header("admin", "password")).status_code == 200
+    # One round trip for the failure and one for the success
+    assert directory.hits == 2
+
+
+def test_docshield_answers_503_when_directory_fails(directory, caplog):
+    """Test a failing user directory yields 503, is logged, and is not cached"""
+    app = FastAPI()
+    DocShield(
+        app=app,
+        credentials=CachingAuthenticator(
+            HTTPAuthenticator(f"http://127.0.0.1:{directory.server_port}/broken")
+        ),
+    )
+    client = TestClient(app)
+
+    for _ in range(2):
+        response = client.get("/docs", headers=get_auth_header("admin", "password"))
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Authentication service unavailable"}
+    # Each request retried the directory
+    assert directory.hits == 2
+    assert "HTTPStatusError" in caplog.text
@@ -0,0 +1,229 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, JWKSCache, JWTError, JWTVerifier, SchemaView
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+SECRET = b"test-secret"
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def b64url_int(value):
+    return b64url(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+
+def make_token(claims, sign, alg="HS256", kid=None):
+    """Build a compact JWS; sign maps the signing input to the raw signature."""
+    header = {"alg": alg, "typ": "JWT"}
+    if kid is not None:
+        header["kid"] = kid
+    signing_input = f"{b64url(json.dumps(header).encode())}.{b64url(json.dumps(claims).encode())}"
+    return f"{signing_input}.{b64url(sign(signing_input.encode()))}"
+
+
+def hs256(signing_input):
+    return hmac.new(SECRET, signing_input, hashlib.sha256).digest()
+
+
+def claims(**extra):
+    return {"sub": "alice", "exp": int(time.time()) + 300, **extra}
+
+
+def get_bearer_header(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def test_hs256_claims_validation():
+    """Test signature, expiry, issuer and audience checks"""
+    verifier = JWTVerifier(secret=SECRET, algorithms=["HS256"], issuer="sso", audience="docs")
+
+    token = make_token(claims(iss="sso", aud=["docs", "api"]), hs256)
+    assert asyncio.run(verifier.verify(token))["sub"] == "alice"
+
+    invalid_tokens = [
+        make_token(claims(iss="sso", aud="docs"), lambda data: b"x" * 32),
+        make_token(claims(iss="sso", aud="docs", exp=int(time.time()) - 10), hs256),
+        make_token(claims(iss="sso", aud="docs", nbf=int(time.time()) + 60), hs256),
+        make_token(claims(iss="other", aud="docs"), hs256),
+        make_token(claims(iss="sso", aud="api"), hs256),
+        make_token(claims(iss="sso", aud="docs"), lambda data: b"", alg="none"),
+        "not-a-token",
+    ]
+    for token in invalid_tokens:
+        with pytest.raises(JWTError):
+            asyncio.run(verifier.verify(token))
+
+
+def test_claims_cached_until_expiry():
+    """Test a validated token skips signature verification until it expires"""
+    verifier = JWTVerifier(secret=SECRET, algorithms=["HS256"])
+    token = make_token(claims(exp=int(time.time()) + 2), hs256)
+
+    asyncio.run(verifier.verify(token))
+    verifier.secret = b"rotated"
+    # Still served from the claims cache
+    assert asyncio.run(verifier.verify(token))["sub"] == "alice"
+    entry_ttl = verifier.cache._entries[hashlib.sha256(token.encode()).digest()][0] - time.monotonic()
+    assert 0 < entry_ttl <= 2
+
+
+def test_rs256_and_es256_with_jwks_file(tmp_path):
+    """Test asymmetric tokens verified with keys from a JWKS file"""
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+
+    rsa_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ec_key = ec.generate_private_key(ec.SECP256R1())
+    rsa_numbers = rsa_key.public_key().public_numbers()
+    ec_numbers = ec_key.public_key().public_numbers()
+    jwks_path = tmp_path / "jwks.json"
+    jwks_path.write_text(json.dumps({"keys": [
+        {"kty": "RSA", "kid": "rsa-1", "alg": "RS256",
+         "n": b64url_int(rsa_numbers.n), "e": b64url_int(rsa_numbers.e)},
+        {"kty": "EC", "kid": "ec-1", "crv": "P-256",
+         "x": b64url_int(ec_numbers.x), "y": b64url_int(ec_numbers.y)},
+    ]}))
+
+    def rs256(data):
+        return rsa_key.sign(data, padding.PKCS1v15(), hashes.SHA256())
+
+    def es256(data):
+        r, s = decode_dss_signature(ec_key.sign(data, ec.ECDSA(hashes.SHA256())))
+        return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+    verifier = JWTVerifier(jwks=str(jwks_path))
+    assert asyncio.run(verifier.verify(make_token(claims(), rs256, "RS256", "rsa-1")))["sub"] == "alice"
+    assert asyncio.run(verifier.verify(make_token(claims(), es256, "ES256", "ec-1")))["sub"] == "alice"
+    # A key is only used with its own algorithm
+    with pytest.raises(JWTError):
+        asyncio.run(verifier.verify(make_token(claims(), rs256, "RS256", "ec-1")))
+
+
+def test_jwks_refresh_on_unknown_kid_is_rate_limited():
+    """Test unknown key ids reload the key set at most once per interval"""
+    documents = [{"keys": []}, {"keys": [{"kty": "oct", "kid": "k1", "k": b64url(SECRET)}]}]
+    cache = JWKSCache({"keys": []}, min_refresh_interval=60)
+    loads = []
+
+    def load_document():
+        loads.append(1)
+        return documents[min(len(loads), 2) - 1]
+
+    cache._load_document = load_document
+    verifier = JWTVerifier(jwks=cache, algorithms=["HS256"])
+    token = make_token(claims(), hs256, kid="k1")
+
+    # First lookup loads the (still empty) key set; the retry is throttled
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            asyncio.run(verifier.verify(token))
+    assert len(loads) == 1
+
+    cache._last_refresh -= 60
+    assert asyncio.run(verifier.verify(token))["sub"] == "alice"
+    assert len(loads) == 2
+
+
+def test_docshield_bearer_auth():
+    """Test DocShield accepts Bearer tokens alongside Basic credentials"""
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root():
+        return {"Hello": "World"}
+
+    DocShield(
+        app=app,
+        credentials={"admin": "password"},
+        jwt_verifier=JWTVerifier(secret=SECRET, algorithms=["HS256"]),
+    )
+    client = TestClient(app)
+
+    token = make_token(claims(), hs256)
+    assert client.get("/docs", headers=get_bearer_header(token)).status_code == 200
+    assert client.get("/openapi.json", headers=get_bearer_header(token)).status_code == 200
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 200
+
+    response = client.get("/docs", headers=get_bearer_header("bogus"))
+    assert response.status_code == 401
+
+
+def test_docshield_bearer_starts_no_session():
+    """Test Bearer logins get no session cookie, so docs are refused once the token expires"""
+    app = FastAPI()
+    DocShield(
+        app=app,
+        credentials={"admin": "password"},
+        jwt_verifier=JWTVerifier(secret=SECRET, algorithms=["HS256"]),
+        session_cookie=True,
+    )
+    client = TestClient(app)
+
+    token = make_token(claims(exp=int(time.time()) + 1), hs256)
+    response = client.get("/docs", headers=get_bearer_header(token))
+    assert response.status_code == 200
+    assert "set-cookie" not in response.headers
+
+    time.sleep(2)
+    assert client.get("/docs", headers=get_bearer_header(token)).status_code == 401
+    assert client.get("/docs").status_code == 401
+    # Basic Auth logins still start a session
+    assert "set-cookie" in client.get("/docs", headers=get_auth_header("admin", "password")).headers
+
+
+def test_docshield_bearer_requires_subject():
+    """Test valid tokens without a usable subject are rejected, so they cannot bypass roles"""
+    app = FastAPI()
+
+    @app.get("/priv", tags=["private"])
+    def private():
+        return {}
+
+    DocShield(
+        app=app,
+        jwt_verifier=JWTVerifier(secret=SECRET, algorithms=["HS256"]),
+        roles={"partner": SchemaView(tags=["public"])},
+        user_roles={"bob": "partner"},
+    )
+    client = TestClient(app)
+
+    no_subject = make_token({"exp": int(time.time()) + 300}, hs256)
+    assert client.get("/openapi.json", headers=get_bearer_header(no_subject)).status_code == 401
+    for subject in ["", 42, None]:
+        token = make_token(claims(sub=subject), hs256)
+        assert client.get("/openapi.json", headers=get_bearer_header(token)).status_code == 401
+
+    bob = client.get("/openapi.json", headers=get_bearer_header(make_token(claims(sub="bob"), hs256)))
+    assert "/priv" not in bob.json()["paths"]
+
+
+def test_docshield_bearer_only():
+    """Test DocShield can run with a JWT verifier and no Basic credentials"""
+    app = FastAPI()
+    DocShield(app=app, jwt_verifier=JWTVerifier(secret=SECRET, algorithms=["HS256"]))
+    client = TestClient(app)
+
+    response = client.get("/docs", headers=get_auth_header("admin", "password"))
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+    assert client.get("/docs", headers=get_bearer_header(make_token(claims(), hs256))).status_code == 200
+
+    with pytest.raises(ValueError):
+        DocShield(app=FastAPI())
@@ -0,0 +1,82 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, HashedCredentials, hash_password, verify_password
+from fastapi_docshield import credentials as credentials_module
+import asyncio
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+@pytest.mark.parametrize("scheme", ["scrypt", "pbkdf2_sha256", "bcrypt", "argon2"])
+def test_hash_and_verify(scheme, monkeypatch):
+    """Test that every supported scheme round-trips"""
+    if scheme == "bcrypt":
+        pytest.importorskip("bcrypt")
+    if scheme == "argon2":
+        pytest.importorskip("argon2")
+    monkeypatch.setattr(credentials_module, "PBKDF2_ITERATIONS", 1000)
+
+    encoded = hash_password("s3cret", scheme)
+    assert "s3cret" not in encoded
+    assert verify_password("s3cret", encoded)
+    assert not verify_password("wrong", encoded)
+
+
+def test_verify_rejects_malformed_and_unknown_hashes():
+    """Test that malformed hashes fail and unknown formats raise"""
+    assert not verify_password("s3cret", "scrypt$not$a$valid$hash")
+    with pytest.raises(ValueError):
+        verify_password("s3cret", "plaintext")
+
+
+def test_hashed_credentials_reject_unsupported_formats():
+    """Test that plaintext or unknown stored values fail at startup, not at login"""
+    with pytest.raises(ValueError, match="admin"):
+        HashedCredentials({"admin": "pw", "ops": hash_password("s3cret")})
+
+
+def test_hashed_credentials_protect_docs(monkeypatch):
+    """Test that DocShield accepts hashed credentials and caches successes"""
+    calls = []
+    original = credentials_module.verify_password
+
+    def counting_verify(password, encoded):
+        calls.append(password)
+        return original(password, encoded)
+
+    monkeypatch.setattr(credentials_module, "verify_password", counting_verify)
+
+    app = FastAPI()
+    DocShield(app=app, credentials=HashedCredentials({"admin": hash_password("password123")}))
+    client = TestClient(app)
+
+    headers = get_auth_header("admin", "password123")
+    assert client.get("/docs", headers=headers).status_code == 200
+    assert client.get("/openapi.json", headers=headers).status_code == 200
+    assert client.get("/redoc", headers=headers).status_code == 200
+    # Only the first request paid for the hash check
+    assert len(calls) == 1
+
+    response = client.get("/docs", headers=get_auth_header("admin", "wrong"))
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Basic"
+    assert client.get("/docs", headers=get_auth_header("nobody", "password123")).status_code == 401
+    # Failures are never cached
+    assert client.get("/docs", headers=get_auth_header("admin", "wrong")).status_code == 401
+    assert len(calls) == 4
+
+
+def test_cached_success_invalidated_when_hash_changes():
+    """Test that changing a user's hash invalidates the cached verification"""
+    store = HashedCredentials({"admin": hash_password("old")}, cache_ttl=60)
+    assert asyncio.run(store.authenticate("admin", "old"))
+    store.credentials["admin"] = hash_password("new")
+    assert not asyncio.run(store.authenticate("admin", "old"))
+    assert asyncio.run(store.authenticate("admin", "new"))
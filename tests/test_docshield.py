@@ -3,6 +3,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from fastapi_docshield import DocShield
 import base64
+import re
 
 
 def get_auth_header(username, password):
@@ -169,4 +170,117 @@ def test_custom_urls():
     assert response.status_code == 200
     
     response = client.get("/custom-openapi.json", headers=headers)
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+
+def test_swagger_ui_parameters_in_all_modes():
+    """Test that swagger_ui_parameters reach every Swagger UI rendering path"""
+    from fastapi_docshield import SWAGGER_UI_PERFORMANCE_PARAMETERS
+
+    headers = get_auth_header("admin", "password123")
+    for options in ({}, {"prefer_local": True}, {"use_cdn_fallback": False}):
+        app = FastAPI()
+        DocShield(
+            app=app,
+            credentials={"admin": "password123"},
+            swagger_ui_parameters=SWAGGER_UI_PERFORMANCE_PARAMETERS,
+            **options
+        )
+        response = TestClient(app).get("/docs", headers=headers)
+        assert response.status_code == 200
+        assert '"docExpansion": "none"' in response.text
+        assert '"defaultModelsExpandDepth": -1' in response.text
+
+
+def test_redoc_options_in_all_modes():
+    """Test that redoc_options reach every ReDoc rendering path"""
+    from fastapi_docshield import REDOC_PERFORMANCE_OPTIONS
+
+    headers = get_auth_header("admin", "password123")
+    for options in ({}, {"prefer_local": True}, {"use_cdn_fallback": False}):
+        app = FastAPI()
+        DocShield(
+            app=app,
+            credentials={"admin": "password123"},
+            redoc_options=REDOC_PERFORMANCE_OPTIONS,
+            **options
+        )
+        response = TestClient(app).get("/redoc", headers=headers)
+        assert response.status_code == 200
+        assert "Redoc.init(" in response.text
+        assert '"lazyRendering": true' in response.text
+
+
+def test_redoc_uses_bundled_fonts():
+    """Test that ReDoc uses bundled fonts in local and fallback modes"""
+    headers = get_auth_header("admin", "password123")
+    for options in ({}, {"prefer_local": True}):
+        app = FastAPI()
+        DocShield(app=app, credentials={"admin": "password123"}, **options)
+        client = TestClient(app)
+        response = client.get("/redoc", headers=headers)
+        assert "/docshield/static/fonts/fonts.css" in response.text
+        assert "fonts.googleapis.com" not in response.text
+
+        response = client.get("/docshield/static/fonts/fonts.css")
+        assert response.status_code == 200
+        assert "font-display: swap" in response.text
+        response = client.get("/docshield/static/fonts/roboto-latin.woff2")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "font/woff2"
+        assert client.get("/docshield/static/fonts/missing.woff2").status_code == 404
+
+    app = FastAPI()
+    DocShield(app=app, credentials={"admin": "password123"}, use_cdn_fallback=False)
+    response = TestClient(app).get("/redoc", headers=headers)
+    assert "fonts.googleapis.com" in response.text
+    assert "display=swap" in response.text
+
+
+def test_docs_pages_cached_with_etag_and_gzip():
+    """Test that docs pages are served pre-compressed with ETags"""
+    app = FastAPI()
+    DocShield(app=app, credentials={"admin": "password123"}, custom_css="body { color: red; }" * 50)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    for path in ("/docs", "/redoc"):
+        response = client.get(path, headers={**headers, "Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        etag = response.headers["etag"]
+
+        response = client.get(path, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # The ETag never bypasses authentication
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 401
+
+
+def test_large_custom_code_served_as_hashed_assets():
+    """Test that custom CSS/JS above the limit are moved out of the pages"""
+    app = FastAPI()
+    custom_css = ".swagger-ui { color: red; }\n" * 100
+    DocShield(
+        app=app,
+        credentials={"admin": "password123"},
+        custom_css=custom_css,
+        custom_js="console.log('small');",
+        max_inline_custom_size=1024,
+    )
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    for path in ("/docs", "/redoc"):
+        html = client.get(path, headers=headers).text
+        assert custom_css not in html
+        assert "console.log('small');" in html
+
+    css_url = re.search(r'href="(/docshield/static/custom/custom\.[0-9a-f]{12}\.css)"', html).group(1)
+    response = client.get(css_url)
+    assert response.status_code == 200
+    assert response.text == custom_css
+    assert "immutable" in response.headers["cache-control"]
+    assert client.get("/docshield/static/custom/unknown.css").status_code == 404
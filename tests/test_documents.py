@@ -0,0 +1,153 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+v1 = APIRouter()
+v2 = APIRouter()
+
+
+@v1.get("/items")
+def list_items_v1():
+    return []
+
+
+@v2.get("/items")
+def list_items_v2():
+    return []
+
+
+def create_app(mode="routes"):
+    app = FastAPI(title="Shop", openapi_tags=[{"name": "internal"}, {"name": "unused"}])
+    app.include_router(v1, prefix="/v1")
+    app.include_router(v2, prefix="/v2")
+
+    @app.get("/admin/stats", tags=["internal"])
+    def stats():
+        return {}
+
+    shield = DocShield(app=app, credentials={"admin": "password123"}, mode=mode)
+    shield.add_document("v1", prefixes=["/v1"])
+    shield.add_document("v2", routers=[v2], title="Shop API v2")
+    shield.add_document("internal", tags=["internal"], credentials={"staff": "secret"})
+    return app, shield
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_documents_select_routes(mode):
+    app, _ = create_app(mode)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    full = client.get("/openapi.json", headers=headers).json()
+    assert set(full["paths"]) == {"/v1/items", "/v2/items", "/admin/stats"}
+
+    schema = client.get("/v1/openapi.json", headers=headers).json()
+    assert set(schema["paths"]) == {"/v1/items"}
+    assert schema["info"]["title"] == "Shop - v1"
+
+    schema = client.get("/v2/openapi.json", headers=headers).json()
+    assert set(schema["paths"]) == {"/v2/items"}
+    assert schema["info"]["title"] == "Shop API v2"
+
+    schema = client.get("/internal/openapi.json", headers=get_auth_header("staff", "secret")).json()
+    assert set(schema["paths"]) == {"/admin/stats"}
+    assert [tag["name"] for tag in schema["tags"]] == ["internal"]
+
+
+def test_document_pages():
+    app, _ = create_app()
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    response = client.get("/v2/docs", headers=headers)
+    assert response.status_code == 200
+    assert "Shop API v2 - Swagger UI" in response.text
+    assert "/v2/openapi.json" in response.text
+
+    response = client.get("/v1/redoc", headers=headers)
+    assert response.status_code == 200
+    assert "/v1/openapi.json" in response.text
+
+
+def test_document_credentials():
+    app, _ = create_app()
+    client = TestClient(app)
+
+    assert client.get("/internal/docs", headers=get_auth_header("admin", "password123")).status_code == 401
+    assert client.get("/internal/docs", headers=get_auth_header("staff", "secret")).status_code == 200
+    assert client.get("/docs", headers=get_auth_header("staff", "secret")).status_code == 401
+    # Documents without their own credentials use the parent's
+    assert client.get("/v1/docs", headers=get_auth_header("admin", "password123")).status_code == 200
+
+
+def test_documents_cache_separately():
+    app, shield = create_app()
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    etags = {
+        url: client.get(url, headers=headers).headers["etag"]
+        for url in ("/openapi.json", "/v1/openapi.json", "/v2/openapi.json")
+    }
+    assert len(set(etags.values())) == 3
+
+    response = client.get("/v1/openapi.json", headers={**headers, "If-None-Match": etags["/v1/openapi.json"]})
+    assert response.status_code == 304
+
+    assert shield.documents["v1"].static_handler is shield.static_handler
+
+
+def test_document_sessions_are_separate():
+    app = FastAPI()
+    shield = DocShield(app=app, credentials={"admin": "password123"}, session_cookie=True)
+    document = shield.add_document("v1", credentials={"guest": "guest"})
+    client = TestClient(app)
+
+    response = client.get("/v1/docs", headers=get_auth_header("guest", "guest"))
+    assert response.status_code == 200
+    assert f"{document.session_signer.cookie_name}=" in response.headers["set-cookie"]
+    assert client.get("/v1/docs").status_code == 200
+    assert client.get("/docs").status_code == 401
+
+
+def test_add_document_rejects_conflicts():
+    app, shield = create_app()
+
+    with pytest.raises(ValueError):
+        shield.add_document("v1")
+    with pytest.raises(ValueError):
+        shield.add_document("other", docs_url="/docs")
+    with pytest.raises(ValueError):
+        shield.add_document("other", openapi_url="/v1/openapi.json")
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_document_reconfigure_cannot_reinstall(mode):
+    app, shield = create_app(mode)
+    document = shield.documents["v1"]
+    client = TestClient(app)
+
+    with pytest.raises(ValueError, match="reconfigure that instance"):
+        document.reconfigure(mode="routes" if mode != "routes" else "mount")
+    with pytest.raises(ValueError):
+        document.reconfigure(live_reload=True)
+
+    # The parent and the documents keep serving
+    assert client.get("/docs", headers=get_auth_header("admin", "password123")).status_code == 200
+    assert client.get("/v1/openapi.json", headers=get_auth_header("admin", "password123")).status_code == 200
+    assert client.get("/internal/docs", headers=get_auth_header("staff", "secret")).status_code == 200
+
+    # Settings a document owns can still change
+    document.reconfigure(custom_css="body { color: red; }")
+    assert "color: red" in client.get("/v1/docs", headers=get_auth_header("admin", "password123")).text
+    assert "color: red" not in client.get("/docs", headers=get_auth_header("admin", "password123")).text
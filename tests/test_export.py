@@ -0,0 +1,65 @@
+from fastapi import FastAPI
+from fastapi_docshield import DocShield, RapiDocRenderer
+from fastapi_docshield.__main__ import main
+import gzip
+import json
+import re
+
+
+def create_app():
+    """Create an app protected by DocShield."""
+    app = FastAPI(title="Export Test")
+
+    @app.get("/items")
+    def read_items():
+        return []
+
+    DocShield(
+        app=app,
+        credentials={"admin": "password123"},
+        renderers={"/rapidoc": RapiDocRenderer()},
+        custom_css=".swagger-ui { color: red; }",
+    )
+    return app
+
+
+def test_export_writes_static_site(tmp_path):
+    """Test that export writes pages, schema and hashed assets with relative URLs"""
+    app = create_app()
+    output = app.state.docshield.export(tmp_path / "site")
+
+    schema_bytes = (output / "openapi.json").read_bytes()
+    assert b'": ' not in schema_bytes and b'", "' not in schema_bytes
+    assert json.loads(schema_bytes)["paths"].keys() == {"/items"}
+    assert gzip.decompress((output / "openapi.json.gz").read_bytes()) == schema_bytes
+
+    for page in ("docs/index.html", "redoc/index.html", "rapidoc/index.html"):
+        html = (output / page).read_text()
+        assert "../openapi.json" in html
+        assert "/docshield/static" not in html
+        for asset in re.findall(r'(?:src|href)="\.\./(assets/[^"]+)"', html):
+            assert (output / asset).exists()
+        assert (output / (page + ".gz")).exists()
+
+    assert ".swagger-ui { color: red; }" in (output / "docs/index.html").read_text()
+    assert re.search(r"assets/swagger-ui-bundle\.[0-9a-f]{12}\.js", (output / "docs/index.html").read_text())
+
+    fonts_css = next((output / "assets").glob("fonts.*.css")).read_text()
+    for font in re.findall(r"url\(([^)]+)\)", fonts_css):
+        assert (output / "assets" / font).exists()
+
+
+def test_export_cli(tmp_path, monkeypatch, capsys):
+    """Test the python -m fastapi_docshield export entry point"""
+    (tmp_path / "export_cli_app.py").write_text(
+        "from fastapi import FastAPI\n"
+        "from fastapi_docshield import DocShield\n"
+        "app = FastAPI()\n"
+        "DocShield(app=app, credentials={'admin': 'password123'})\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    main(["export", "export_cli_app:app", str(tmp_path / "out")])
+    assert "exported" in capsys.readouterr().out
+    assert (tmp_path / "out" / "docs" / "index.html").exists()
+    assert (tmp_path / "out" / "openapi.json").exists()
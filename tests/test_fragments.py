@@ -0,0 +1,120 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, SchemaView
+from fastapi_docshield.fragments import SchemaFragments
+from pydantic import BaseModel
+from typing import List
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+class Address(BaseModel):
+    city: str
+
+
+class Customer(BaseModel):
+    name: str
+    addresses: List[Address]
+
+
+class Invoice(BaseModel):
+    total: float
+
+
+def create_app(**kwargs):
+    app = FastAPI(openapi_tags=[{"name": "customers"}, {"name": "billing"}])
+
+    @app.get("/customers", tags=["customers"], response_model=List[Customer])
+    def list_customers():
+        return []
+
+    @app.get("/invoices/{invoice_id}", tags=["billing"], response_model=Invoice)
+    def get_invoice(invoice_id: int):
+        return {"total": 1.0}
+
+    DocShield(app=app, credentials={"admin": "password123", "partner": "p4ss"}, schema_fragments=True, **kwargs)
+    return app
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_tag_fragment(mode):
+    client = TestClient(create_app(mode=mode))
+    headers = get_auth_header("admin", "password123")
+
+    response = client.get("/openapi.json/tags/customers", headers=headers)
+    assert response.status_code == 200
+    fragment = response.json()
+    assert list(fragment["paths"]) == ["/customers"]
+    assert [tag["name"] for tag in fragment["tags"]] == ["customers"]
+    assert set(fragment["components"]["schemas"]) == {"Customer", "Address"}
+    assert fragment["info"] == client.get("/openapi.json", headers=headers).json()["info"]
+
+    assert client.get("/openapi.json/tags/customers").status_code == 401
+    assert client.get("/openapi.json/tags/unknown", headers=headers).status_code == 404
+    assert client.get("/openapi.json/other/customers", headers=headers).status_code == 404
+
+
+def test_operation_fragment():
+    client = TestClient(create_app())
+    headers = get_auth_header("admin", "password123")
+    schema = client.get("/openapi.json", headers=headers).json()
+    operation_id = schema["paths"]["/invoices/{invoice_id}"]["get"]["operationId"]
+
+    response = client.get(f"/openapi.json/operations/{operation_id}", headers=headers)
+    assert response.status_code == 200
+    fragment = response.json()
+    assert list(fragment["paths"]) == ["/invoices/{invoice_id}"]
+    assert "Invoice" in fragment["components"]["schemas"]
+    assert "Customer" not in fragment["components"]["schemas"]
+
+    # Served from cached bytes
+    etag = response.headers["etag"]
+    cached = client.get(f"/openapi.json/operations/{operation_id}", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_fragments_follow_roles():
+    client = TestClient(create_app(
+        roles={"partner": SchemaView(tags=["customers"])},
+        user_roles={"partner": "partner"},
+    ))
+
+    assert client.get("/openapi.json/tags/billing", headers=get_auth_header("admin", "password123")).status_code == 200
+    assert client.get("/openapi.json/tags/billing", headers=get_auth_header("partner", "p4ss")).status_code == 404
+    assert client.get("/openapi.json/tags/customers", headers=get_auth_header("partner", "p4ss")).status_code == 200
+
+
+def test_fragments_disabled_by_default():
+    app = FastAPI()
+
+    @app.get("/items", tags=["items"])
+    def items():
+        return []
+
+    DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    assert client.get("/openapi.json/tags/items", headers=get_auth_header("admin", "password123")).status_code == 404
+
+
+def test_fragment_includes_used_security_schemes():
+    schema = {
+        "openapi": "3.1.0",
+        "info": {"title": "API", "version": "1"},
+        "paths": {
+            "/a": {"get": {"operationId": "a", "tags": ["a"], "security": [{"key": []}]}},
+            "/b": {"get": {"operationId": "b", "tags": ["b"]}},
+        },
+        "components": {"securitySchemes": {"key": {"type": "apiKey", "in": "header", "name": "X-Key"}}},
+    }
+    fragments = SchemaFragments(schema)
+
+    assert fragments.build("operations", "a")["components"] == schema["components"]
+    assert "components" not in fragments.build("tags", "b")
+    assert fragments.build("tags", "c") is None
@@ -0,0 +1,163 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, SchemaView
+from fastapi_docshield.history import json_patch
+import base64
+import copy
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def apply_patch(document, operations):
+    """Apply add, remove and replace operations of an RFC 6902 patch."""
+    document = copy.deepcopy(document)
+    for operation in operations:
+        if operation["path"] == "":
+            document = operation["value"]
+            continue
+        *parents, last = [
+            token.replace("~1", "/").replace("~0", "~")
+            for token in operation["path"].split("/")[1:]
+        ]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if isinstance(target, list):
+            index = len(target) if last == "-" else int(last)
+            if operation["op"] == "add":
+                target.insert(index, operation["value"])
+            elif operation["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = operation["value"]
+        elif operation["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = operation["value"]
+    return document
+
+
+def create_app(**kwargs):
+    app = FastAPI(title="History API")
+
+    for index in range(30):
+        @app.get(f"/items/{index}", tags=["items"], summary=f"Get item {index}")
+        def get_item():
+            return {}
+
+    shield = DocShield(app=app, credentials={"admin": "password123", "partner": "p4ss"}, **kwargs)
+    return app, shield
+
+
+def test_json_patch():
+    old = {"a": 1, "b": {"c": [1, 2, 3], "d": "x"}, "e~/f": True, "g": [1]}
+    new = {"a": 1, "b": {"c": [1, 5], "d": "y", "h": None}, "e~/f": 1, "g": [1, 2, 3]}
+    operations = json_patch(old, new)
+
+    assert apply_patch(old, operations) == new
+    assert {"op": "remove", "path": "/b/c/2"} in operations
+    assert {"op": "replace", "path": "/e~0~1f", "value": 1} in operations
+    assert json_patch(new, copy.deepcopy(new)) == []
+    assert json_patch(1, [1]) == [{"op": "replace", "path": "", "value": [1]}]
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_schema_patch_since_version(mode):
+    app, shield = create_app(schema_history=4, mode=mode)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    first = client.get("/openapi.json", headers=headers)
+    etag = first.headers["etag"]
+    app.title = "History API v2"
+    shield.invalidate()
+
+    response = client.get("/openapi.json", params={"since": etag}, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json-patch+json"
+    assert response.json() == [{"op": "replace", "path": "/info/title", "value": "History API v2"}]
+    assert len(response.content) < len(first.content)
+
+    current = client.get("/openapi.json", headers=headers)
+    assert response.headers["etag"] == current.headers["etag"]
+    assert apply_patch(first.json(), response.json()) == current.json()
+
+    # The ETag may be sent without its weak prefix and quotes
+    bare = client.get("/openapi.json", params={"since": etag[3:-1]}, headers=headers)
+    assert bare.content == response.content
+
+    # Up-to-date clients get 304 or an empty patch
+    latest = current.headers["etag"]
+    assert client.get(
+        "/openapi.json", params={"since": latest}, headers={**headers, "If-None-Match": latest}
+    ).status_code == 304
+    assert client.get("/openapi.json", params={"since": latest}, headers=headers).json() == []
+
+    assert client.get("/openapi.json", params={"since": etag}).status_code == 401
+
+
+def test_evicted_version_returns_full_schema():
+    app, shield = create_app(schema_history=2)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    etag = client.get("/openapi.json", headers=headers).headers["etag"]
+    for version in range(2):
+        app.title = f"History API {version}"
+        shield.invalidate()
+        client.get("/openapi.json", headers=headers)
+
+    response = client.get("/openapi.json", params={"since": etag}, headers=headers)
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["info"]["title"] == "History API 1"
+    unknown = client.get("/openapi.json", params={"since": "unknown"}, headers=headers)
+    assert unknown.content == response.content
+
+
+def test_route_changes_are_new_versions():
+    app, shield = create_app(schema_history=4)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    first = client.get("/openapi.json", headers=headers)
+
+    @app.get("/late", tags=["late"])
+    def late():
+        return {}
+
+    patch = client.get("/openapi.json", params={"since": first.headers["etag"]}, headers=headers).json()
+    current = client.get("/openapi.json", headers=headers).json()
+    assert {"op": "add", "path": "/paths/~1late", "value": current["paths"]["/late"]} in patch
+    assert apply_patch(first.json(), patch) == current
+
+
+def test_history_per_role():
+    app, shield = create_app(
+        schema_history=4,
+        roles={"partner": SchemaView(paths=["/items/1"])},
+        user_roles={"partner": "partner"},
+    )
+    client = TestClient(app)
+    admin_etag = client.get("/openapi.json", headers=get_auth_header("admin", "password123")).headers["etag"]
+
+    # Another role's version is unknown, so no patch reveals its operations
+    response = client.get("/openapi.json", params={"since": admin_etag}, headers=get_auth_header("partner", "p4ss"))
+    assert response.headers["content-type"] == "application/json"
+    assert list(response.json()["paths"]) == ["/items/1"]
+
+
+def test_history_disabled_by_default():
+    app, shield = create_app()
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    etag = client.get("/openapi.json", headers=headers).headers["etag"]
+
+    response = client.get("/openapi.json", params={"since": etag}, headers=headers)
+    assert response.headers["content-type"] == "application/json"
+    with pytest.raises(ValueError):
+        DocShield(app=FastAPI(), credentials={"admin": "password123"}, schema_history=-1)
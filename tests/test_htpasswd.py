@@ -0,0 +1,110 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, HtpasswdCredentials
+from fastapi_docshield.htpasswd import apr1_hash, parse_htpasswd, verify_htpasswd_hash
+import asyncio
+import base64
+import os
+import time
+
+# Generated with `openssl passwd -apr1 -salt saltsalt password`
+APR1_PASSWORD = "$apr1$saltsalt$yAAkm4libquA.ZWLHbSBq/"
+# Generated with `htpasswd -nbs user password`
+SHA_PASSWORD = "{SHA}W6ph5Mm5Pz8GgiULbPgzG37mj9g="
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def test_apr1_matches_openssl():
+    """Test the apr1 implementation against an openssl-generated hash"""
+    assert apr1_hash("password", "saltsalt") == APR1_PASSWORD
+
+
+def test_verify_htpasswd_formats():
+    """Test SHA, apr1 and bcrypt htpasswd entries"""
+    assert verify_htpasswd_hash("password", APR1_PASSWORD)
+    assert not verify_htpasswd_hash("wrong", APR1_PASSWORD)
+    assert verify_htpasswd_hash("password", SHA_PASSWORD)
+    assert not verify_htpasswd_hash("wrong", SHA_PASSWORD)
+    assert not verify_htpasswd_hash("password", "abJnggxhB/yWI")  # DES crypt is unsupported
+
+    bcrypt = pytest.importorskip("bcrypt")
+    encoded = bcrypt.hashpw(b"password", bcrypt.gensalt()).decode().replace("$2b$", "$2y$")
+    assert verify_htpasswd_hash("password", encoded)
+
+
+def test_malformed_htpasswd_entries_fail_login(tmp_path):
+    """Test that entries with non-ASCII salts or digests are refused rather than erroring"""
+    assert not verify_htpasswd_hash("password", "$apr1$s\u00e4lt$yAAkm4libquA.ZWLHbSBq/")
+    assert not verify_htpasswd_hash("password", "{SHA}W6ph5Mm5Pz8GgiULbPgzG37mj9\u00e4=")
+
+    path = tmp_path / ".htpasswd"
+    path.write_text("broken:$apr1$s\u00e4lt$yAAkm4libquA.ZWLHbSBq/\nadmin:" + SHA_PASSWORD + "\n", encoding="utf-8")
+    app = FastAPI()
+    DocShield(app=app, credentials=HtpasswdCredentials(path))
+    client = TestClient(app)
+
+    assert client.get("/docs", headers=get_auth_header("broken", "password")).status_code == 401
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 200
+
+
+def test_parse_htpasswd():
+    """Test that comments and blank lines are skipped"""
+    entries = parse_htpasswd(f"# docs users\n\nalice:{APR1_PASSWORD}\nbob:{SHA_PASSWORD}\n")
+    assert entries == {"alice": APR1_PASSWORD, "bob": SHA_PASSWORD}
+
+
+def test_htpasswd_protects_docs(tmp_path):
+    """Test that DocShield authenticates against an htpasswd file"""
+    path = tmp_path / "htpasswd"
+    path.write_text(f"alice:{APR1_PASSWORD}\nbob:{SHA_PASSWORD}\n")
+
+    app = FastAPI()
+    DocShield(app=app, credentials=HtpasswdCredentials(path))
+    client = TestClient(app)
+
+    assert client.get("/docs", headers=get_auth_header("alice", "password")).status_code == 200
+    assert client.get("/openapi.json", headers=get_auth_header("bob", "password")).status_code == 200
+    assert client.get("/docs", headers=get_auth_header("alice", "wrong")).status_code == 401
+    assert client.get("/docs", headers=get_auth_header("carol", "password")).status_code == 401
+
+
+def test_htpasswd_reloads_when_file_changes(tmp_path):
+    """Test that a changed file is reloaded in the background"""
+    path = tmp_path / "htpasswd"
+    path.write_text(f"alice:{APR1_PASSWORD}\n")
+    store = HtpasswdCredentials(path, reload_interval=0)
+    assert asyncio.run(store.authenticate("alice", "password"))
+    assert not asyncio.run(store.authenticate("bob", "password"))
+
+    path.write_text(f"bob:{SHA_PASSWORD}\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    # The first lookup after the change schedules the reload
+    store.get_hash("bob")
+    deadline = time.monotonic() + 5
+    while "bob" not in store.credentials and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert asyncio.run(store.authenticate("bob", "password"))
+    assert not asyncio.run(store.authenticate("alice", "password"))
+
+
+def test_htpasswd_checks_mtime_at_most_once_per_interval(tmp_path, monkeypatch):
+    """Test that the file is not stat-ed on every lookup"""
+    path = tmp_path / "htpasswd"
+    path.write_text(f"alice:{APR1_PASSWORD}\n")
+    store = HtpasswdCredentials(path, reload_interval=60)
+
+    stats = []
+    monkeypatch.setattr(store, "_stat_mtime", lambda: stats.append(1))
+    for _ in range(100):
+        store.get_hash("alice")
+    assert stats == []
@@ -0,0 +1,105 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_routes_added_after_install(mode):
+    app = FastAPI()
+
+    @app.get("/early")
+    def early():
+        return {}
+
+    DocShield(app=app, credentials={"admin": "password123"}, mode=mode)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    first = client.get("/openapi.json", headers=headers)
+    assert set(first.json()["paths"]) == {"/early"}
+
+    @app.get("/late")
+    def late():
+        return {}
+
+    router = APIRouter()
+
+    @router.get("/plugin")
+    def plugin():
+        return {}
+
+    app.include_router(router)
+
+    second = client.get("/openapi.json", headers=headers)
+    assert set(second.json()["paths"]) == {"/early", "/late", "/plugin"}
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_late_routes_reach_search_and_fragments():
+    app = FastAPI()
+
+    @app.get("/orders", tags=["orders"])
+    def orders():
+        return []
+
+    DocShield(app=app, credentials={"admin": "password123"}, schema_search=True, schema_fragments=True)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    assert client.get("/openapi.json/search", params={"q": "invoices"}, headers=headers).json()["results"] == []
+    assert client.get("/openapi.json/tags/invoices", headers=headers).status_code == 404
+
+    @app.get("/invoices", tags=["invoices"])
+    def invoices():
+        return []
+
+    # Without fetching /openapi.json in between
+    results = client.get("/openapi.json/search", params={"q": "invoices"}, headers=headers).json()["results"]
+    assert [result["path"] for result in results] == ["/invoices"]
+    assert client.get("/openapi.json/tags/invoices", headers=headers).status_code == 200
+
+
+def test_schema_cached_while_routes_unchanged():
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        return []
+
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    client.get("/openapi.json", headers=headers)
+    content = shield._schema_cache[None]
+
+    client.get("/openapi.json", headers=headers)
+    assert shield._schema_cache[None] is content
+
+
+def test_invalidate():
+    app = FastAPI(title="Before")
+
+    @app.get("/items")
+    def items():
+        return []
+
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    assert client.get("/openapi.json", headers=headers).json()["info"]["title"] == "Before"
+    assert "Before - Swagger UI" in client.get("/docs", headers=headers).text
+
+    # Changes that leave the route table alone need an explicit invalidate()
+    app.title = "After"
+    assert client.get("/openapi.json", headers=headers).json()["info"]["title"] == "Before"
+
+    shield.invalidate()
+    assert client.get("/openapi.json", headers=headers).json()["info"]["title"] == "After"
+    assert "After - Swagger UI" in client.get("/docs", headers=headers).text
@@ -0,0 +1,91 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, IPFilter
+from fastapi_docshield.ipfilter import PrefixTrie, parse_address
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def test_prefix_trie_longest_match():
+    """Test the trie returns the value of the most specific network"""
+    trie = PrefixTrie()
+    trie.insert("10.0.0.0/8", "wide")
+    trie.insert("10.1.0.0/16", "narrow")
+    trie.insert("2001:db8::/32", "v6")
+    trie.insert("0.0.0.0/0", "any")
+
+    assert len(trie) == 4
+    assert trie.lookup(parse_address("10.1.2.3")) == "narrow"
+    assert trie.lookup(parse_address("10.2.2.3")) == "wide"
+    assert trie.lookup(parse_address("192.168.1.1")) == "any"
+    assert trie.lookup(parse_address("2001:db8::1")) == "v6"
+    assert trie.lookup(parse_address("2001:db9::1")) is None
+    # IPv4-mapped IPv6 addresses match IPv4 networks
+    assert trie.lookup(parse_address("::ffff:10.1.0.1")) == "narrow"
+
+
+def test_ip_filter_rules():
+    """Test allow/deny precedence and the default decision"""
+    ip_filter = IPFilter(allow=["10.0.0.0/8", "2001:db8::/32"], deny=["10.9.0.0/16", "10.0.0.1"])
+    assert ip_filter.is_allowed("10.1.1.1")
+    assert ip_filter.is_allowed("2001:db8::5")
+    assert not ip_filter.is_allowed("10.9.1.1")
+    assert not ip_filter.is_allowed("10.0.0.1")
+    assert not ip_filter.is_allowed("192.168.1.1")
+    assert not ip_filter.is_allowed("not-an-ip")
+    assert not ip_filter.is_allowed(None)
+
+    deny_only = IPFilter(deny=["192.168.0.0/16"])
+    assert deny_only.is_allowed("8.8.8.8")
+    assert not deny_only.is_allowed("192.168.3.4")
+
+
+def test_forwarded_for_from_trusted_proxies_only():
+    """Test X-Forwarded-For is honoured only when sent by trusted proxies"""
+    ip_filter = IPFilter(trusted_proxies=["172.16.0.0/12"])
+    # Untrusted peer: header ignored
+    assert ip_filter.client_address("203.0.113.9", "10.0.0.1") == "203.0.113.9"
+    # Trusted peer: rightmost untrusted hop wins, spoofed entries are ignored
+    assert ip_filter.client_address("172.16.0.2", "1.2.3.4, 198.51.100.7, 172.16.0.3") == "198.51.100.7"
+    assert ip_filter.client_address("172.16.0.2", None) == "172.16.0.2"
+
+
+def test_docshield_ip_filter_runs_before_auth_and_static():
+    """Test refused clients get 403 on docs and static routes without any auth work"""
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root():
+        return {"Hello": "World"}
+
+    shield = DocShield(
+        app=app,
+        credentials={"admin": "password"},
+        ip_filter=IPFilter(allow=["10.0.0.0/8"], trusted_proxies=["172.16.0.1"]),
+    )
+    verified = []
+    verify = shield._verify_credentials
+    shield._verify_credentials = lambda credentials: verified.append(credentials) or verify(credentials)
+    headers = get_auth_header("admin", "password")
+
+    outside = TestClient(app, client=("192.168.1.1", 50000))
+    assert outside.get("/docs", headers=headers).status_code == 403
+    assert outside.get("/openapi.json").status_code == 403
+    assert outside.get("/docshield/static/swagger-ui.css").status_code == 403
+    assert not verified
+    # Other routes are unaffected
+    assert outside.get("/").status_code == 200
+
+    inside = TestClient(app, client=("10.1.2.3", 50000))
+    assert inside.get("/docs", headers=headers).status_code == 200
+    assert inside.get("/docshield/static/swagger-ui.css").status_code == 200
+
+    proxy = TestClient(app, client=("172.16.0.1", 50000))
+    assert proxy.get("/docs", headers={**headers, "X-Forwarded-For": "10.1.2.3"}).status_code == 200
+    assert proxy.get("/docs", headers={**headers, "X-Forwarded-For": "192.168.1.1"}).status_code == 403
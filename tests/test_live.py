@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, SchemaView
+from fastapi_docshield.live import SchemaBroadcaster
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app(**kwargs):
+    app = FastAPI(title="Live API")
+
+    @app.get("/items", tags=["items"])
+    def items():
+        return []
+
+    shield = DocShield(app=app, credentials={"admin": "password123", "partner": "p4ss"}, live_reload=True, **kwargs)
+    return app, shield
+
+
+class EventClient:
+    """Reads an event stream by calling the ASGI app directly, as TestClient buffers whole responses."""
+
+    def __init__(self, app, username="admin", password="password123"):
+        self.app = app
+        self.headers = [
+            (name.lower().encode(), value.encode())
+            for name, value in get_auth_header(username, password).items()
+        ]
+        self.messages = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.task = None
+
+    async def __aenter__(self):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/openapi.json/events",
+            "raw_path": b"/openapi.json/events",
+            "root_path": "",
+            "query_string": b"",
+            "headers": self.headers,
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "state": {},
+        }
+        self.task = asyncio.ensure_future(self.app(scope, self.receive, self.messages.put))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.disconnected.set()
+        await asyncio.wait_for(self.task, 1)
+
+    async def receive(self):
+        if not hasattr(self, "_requested"):
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def start(self):
+        return await asyncio.wait_for(self.messages.get(), 1)
+
+    async def event(self):
+        """Return the data of the next event, skipping keep-alive comments."""
+        while True:
+            message = await asyncio.wait_for(self.messages.get(), 2)
+            body = message.get("body", b"").decode()
+            if body.startswith("event: schema"):
+                return body.split("data: ", 1)[1].strip()
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_event_stream_announces_changes(mode):
+    app, shield = create_app(mode=mode)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    first_etag = client.get("/openapi.json", headers=headers).headers["etag"]
+
+    async def scenario():
+        async with EventClient(app) as events:
+            start = await events.start()
+            assert start["status"] == 200
+            assert (b"content-type", b"text/event-stream; charset=utf-8") in start["headers"]
+            assert await events.event() == first_etag
+            assert shield._broadcaster.subscribers == 1
+
+            app.title = "Live API v2"
+            shield.invalidate()
+            return await events.event()
+
+    new_etag = asyncio.run(scenario())
+    assert new_etag == client.get("/openapi.json", headers=headers).headers["etag"] != first_etag
+    # Closed streams unsubscribe
+    assert shield._broadcaster.subscribers == 0
+
+
+def test_event_stream_detects_new_routes():
+    app, shield = create_app()
+    shield._broadcaster.poll_interval = 0.01
+
+    async def scenario():
+        async with EventClient(app) as events:
+            await events.start()
+            first_etag = await events.event()
+
+            @app.get("/late")
+            def late():
+                return {}
+
+            assert await events.event() != first_etag
+
+    asyncio.run(scenario())
+
+
+def test_event_stream_follows_roles():
+    app, shield = create_app(
+        roles={"partner": SchemaView(tags=["items"])},
+        user_roles={"partner": "partner"},
+    )
+    partner_etag = TestClient(app).get("/openapi.json", headers=get_auth_header("partner", "p4ss")).headers["etag"]
+
+    async def scenario():
+        async with EventClient(app, "partner", "p4ss") as events:
+            await events.start()
+            return await events.event()
+
+    assert asyncio.run(scenario()) == partner_etag
+
+
+def test_broadcaster_fans_out():
+    polls = []
+    broadcaster = SchemaBroadcaster(lambda: polls.append(1), poll_interval=0.01)
+
+    async def subscriber(seen):
+        changes = broadcaster.changes()
+        async for changed in changes:
+            seen.append(changed)
+            if len(seen) == 2:
+                break
+        await changes.aclose()
+
+    async def scenario():
+        seen = [[] for _ in range(200)]
+        tasks = [asyncio.ensure_future(subscriber(entries)) for entries in seen]
+        await asyncio.sleep(0.05)
+        assert broadcaster.subscribers == 200
+        broadcaster.notify()
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        return seen
+
+    seen = asyncio.run(scenario())
+    assert all(entries == [True, True] for entries in seen)
+    assert broadcaster.subscribers == 0
+    # One shared poller however many subscribers
+    assert 0 < len(polls) < 20
+
+
+def test_live_reload_pages():
+    app, shield = create_app()
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    assert client.get("/openapi.json/events").status_code == 401
+    docs = client.get("/docs", headers=headers).text
+    assert 'new EventSource("/openapi.json/events"' in docs
+    assert "specActions.updateSpec" in docs
+    assert "Redoc.init(JSON.parse(text)" in client.get("/redoc", headers=headers).text
+
+    plain = FastAPI()
+    DocShield(app=plain, credentials={"admin": "password123"})
+    plain_client = TestClient(plain)
+    assert "EventSource" not in plain_client.get("/docs", headers=headers).text
+    assert plain_client.get("/openapi.json/events", headers=headers).status_code == 404
@@ -0,0 +1,167 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield
+from fastapi_docshield.mounts import merge_schemas
+from pydantic import BaseModel
+import asyncio
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+class Shared(BaseModel):
+    id: int
+
+
+def create_sub_app(name):
+    sub_app = FastAPI(openapi_tags=[{"name": name}])
+
+    class Item(BaseModel):
+        value: str
+
+    Item.__name__ = "Item"
+
+    @sub_app.get("/items", tags=[name], response_model=Item)
+    def list_items():
+        return {"value": name}
+
+    @sub_app.get("/shared", response_model=Shared)
+    def shared():
+        return {"id": 1}
+
+    return sub_app
+
+
+def create_app():
+    app = FastAPI()
+
+    class Item(BaseModel):
+        name: str
+
+    @app.get("/items", response_model=Item)
+    def list_items():
+        return {"name": "root"}
+
+    billing = create_sub_app("billing")
+    billing.mount("/reports", create_sub_app("reports"))
+    app.mount("/billing", billing)
+    app.mount("/shipping", create_sub_app("shipping"))
+    shield = DocShield(app=app, credentials={"admin": "password123"}, include_mounts=True)
+    return app, shield
+
+
+def test_mounted_apps_are_merged():
+    app, _ = create_app()
+    client = TestClient(app)
+
+    schema = client.get("/openapi.json", headers=get_auth_header("admin", "password123")).json()
+    assert set(schema["paths"]) == {
+        "/items",
+        "/billing/items",
+        "/billing/shared",
+        "/billing/reports/items",
+        "/billing/reports/shared",
+        "/shipping/items",
+        "/shipping/shared",
+    }
+    assert [tag["name"] for tag in schema["tags"]] == ["billing", "reports", "shipping"]
+
+    schemas = schema["components"]["schemas"]
+    assert "name" in schemas["Item"]["properties"]
+    assert "value" in schemas["billing_Item"]["properties"]
+    assert "value" in schemas["shipping_Item"]["properties"]
+    assert "Shared" in schemas and "billing_Shared" not in schemas
+
+    response = schema["paths"]["/shipping/items"]["get"]["responses"]["200"]
+    assert response["content"]["application/json"]["schema"]["$ref"] == "#/components/schemas/shipping_Item"
+
+    operation_ids = [
+        operation["operationId"] for path_item in schema["paths"].values() for operation in path_item.values()
+    ]
+    assert len(operation_ids) == len(set(operation_ids))
+
+
+def test_mounts_ignored_by_default():
+    app = FastAPI()
+    app.mount("/billing", create_sub_app("billing"))
+    DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+
+    schema = client.get("/openapi.json", headers=get_auth_header("admin", "password123")).json()
+    assert schema["paths"] == {}
+
+
+def test_invalidate_mount():
+    app, shield = create_app()
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    etag = client.get("/openapi.json", headers=headers).headers["etag"]
+
+    shipping = next(route.app for route in app.routes if getattr(route, "path", None) == "/shipping")
+    billing = next(route.app for route in app.routes if getattr(route, "path", None) == "/billing")
+    billing_schema = billing.openapi()
+
+    @shipping.get("/rates")
+    def rates():
+        return []
+
+    # Cached until invalidated
+    assert client.get("/openapi.json", headers=headers).headers["etag"] == etag
+
+    shield.invalidate_mount("/shipping")
+    response = client.get("/openapi.json", headers=headers)
+    assert response.headers["etag"] != etag
+    assert "/shipping/rates" in response.json()["paths"]
+    # Other sub-applications are not regenerated
+    assert billing.openapi() is billing_schema
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_mounted_schemas_generated_off_event_loop(mode):
+    """Test schemas are generated in a worker thread, and cached content is served inline"""
+    app = FastAPI()
+    sub_app = create_sub_app("billing")
+    app.mount("/billing", sub_app)
+    DocShield(app=app, credentials={"admin": "password123"}, include_mounts=True, mode=mode)
+
+    on_event_loop = []
+    generate = sub_app.openapi
+
+    def openapi():
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return generate()
+
+    sub_app.openapi = openapi
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    assert "/billing/items" in client.get("/openapi.json", headers=headers).json()["paths"]
+    assert client.get("/openapi.json", headers=headers).status_code == 200
+    assert on_event_loop == [False]
+
+
+def test_merge_renames_security_schemes():
+    parent = {
+        "paths": {},
+        "components": {"securitySchemes": {"key": {"type": "apiKey", "in": "header", "name": "X-Key"}}},
+    }
+    sub_schema = {
+        "paths": {"/items": {"get": {"operationId": "items"}}},
+        "components": {"securitySchemes": {"key": {"type": "http", "scheme": "basic"}}},
+        "security": [{"key": []}],
+    }
+
+    merged = merge_schemas(parent, [("/sub", sub_schema)])
+    assert merged["paths"]["/sub/items"]["get"]["security"] == [{"sub_key": []}]
+    assert merged["components"]["securitySchemes"]["sub_key"] == {"type": "http", "scheme": "basic"}
+    assert parent["paths"] == {}
@@ -0,0 +1,112 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, RateLimiter
+from fastapi_docshield.ratelimit import TokenBuckets
+import base64
+import time
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app(**kwargs):
+    app = FastAPI()
+
+    @app.get("/")
+    def read_root():
+        return {"Hello": "World"}
+
+    DocShield(app=app, credentials={"admin": "password"}, **kwargs)
+    return app
+
+
+def test_token_buckets_refill_and_eviction():
+    """Test tokens refill over the period and memory stays bounded"""
+    buckets = TokenBuckets(capacity=2, period=0.2, max_keys=3)
+    assert buckets.acquire("a") == 0
+    assert buckets.acquire("a") == 0
+    assert 0 < buckets.acquire("a") <= 0.1
+    time.sleep(0.11)
+    assert buckets.acquire("a") == 0
+
+    for key in "bcde":
+        buckets.acquire(key)
+    assert len(buckets) == 3
+    # "a" was evicted and starts with a full bucket again
+    assert buckets.retry_after("a") == 0
+
+
+def test_rate_limit_per_client():
+    """Test excess requests from one address get 429 with Retry-After"""
+    app = create_app(rate_limit=RateLimiter(per_ip=3, period=60))
+    client = TestClient(app)
+
+    for _ in range(3):
+        assert client.get("/openapi.json", headers=get_auth_header("admin", "password")).status_code == 200
+    response = client.get("/openapi.json", headers=get_auth_header("admin", "password"))
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "20"
+
+    # Non-documentation routes are not throttled
+    assert client.get("/").status_code == 200
+
+
+def test_rate_limit_per_username_before_verification():
+    """Test a username with too many failures is rejected without checking credentials"""
+    app = create_app(rate_limit=RateLimiter(per_ip=100, per_username=2, period=60))
+    shield = app.state.docshield
+    client = TestClient(app)
+
+    for _ in range(2):
+        assert client.get("/docs", headers=get_auth_header("admin", "wrong")).status_code == 401
+
+    checked = []
+    verify = shield._verify_credentials
+    shield._verify_credentials = lambda credentials: checked.append(credentials) or verify(credentials)
+
+    assert client.get("/docs", headers=get_auth_header("admin", "password")).status_code == 429
+    assert not checked
+    # Other usernames are unaffected
+    assert client.get("/docs", headers=get_auth_header("guest", "wrong")).status_code == 401
+    assert len(checked) == 1
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_rate_limit_keys_match_across_modes(mode):
+    """Test a per-route dict selects the same limiters in every serving mode"""
+    app = create_app(
+        mode=mode,
+        schema_fragments=True,
+        rate_limit={
+            "/openapi.json": RateLimiter(per_ip=1, period=60),
+            "/openapi.json/{subpath:path}": RateLimiter(per_ip=2, period=60),
+        },
+    )
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password")
+
+    assert client.get("/openapi.json", headers=headers).status_code == 200
+    assert client.get("/openapi.json", headers=headers).status_code == 429
+    # Fragments share one limiter, whichever fragment is requested
+    assert client.get("/openapi.json/operations/read_root__get", headers=headers).status_code == 200
+    assert client.get("/openapi.json/tags/unknown", headers=headers).status_code == 404
+    assert client.get("/openapi.json/operations/read_root__get", headers=headers).status_code == 429
+    for _ in range(3):
+        assert client.get("/docs", headers=headers).status_code == 200
+
+
+def test_rate_limit_per_route():
+    """Test a dict configures limiters for individual routes"""
+    app = create_app(rate_limit={"/openapi.json": RateLimiter(per_ip=1, period=60)})
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password")
+
+    assert client.get("/openapi.json", headers=headers).status_code == 200
+    assert client.get("/openapi.json", headers=headers).status_code == 429
+    for _ in range(3):
+        assert client.get("/docs", headers=headers).status_code == 200
@@ -0,0 +1,181 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app():
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        return []
+
+    return app
+
+
+def route_paths(app):
+    return [getattr(route, "path", None) for route in app.router.routes]
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_uninstall(mode):
+    app = create_app()
+    routes = list(app.router.routes)
+    shield = DocShield(app=app, credentials={"admin": "password123"}, mode=mode)
+    shield.add_document("v1", prefixes=["/items"])
+    client = TestClient(app)
+    assert client.get("/docs", headers=get_auth_header("admin", "password123")).status_code == 200
+
+    shield.uninstall()
+    assert [route for route in app.router.routes if route not in routes] == []
+    assert not hasattr(app.state, "docshield")
+    for path in ("/docs", "/v1/docs", "/openapi.json", "/docshield/static/swagger-ui.css"):
+        assert client.get(path, headers=get_auth_header("admin", "password123")).status_code == 404
+    assert client.get("/items").status_code == 200
+
+
+def test_second_install_replaces_first():
+    app = create_app()
+    DocShield(app=app, credentials={"admin": "password123"})
+    DocShield(app=app, credentials={"other": "secret"}, docs_url="/documentation")
+
+    paths = route_paths(app)
+    assert len(paths) == len(set(paths))
+    assert "/docs" not in paths
+    client = TestClient(app)
+    assert client.get("/documentation", headers=get_auth_header("other", "secret")).status_code == 200
+    assert client.get("/documentation", headers=get_auth_header("admin", "password123")).status_code == 401
+
+
+def test_reconfigure_moves_routes_in_place():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    routes = list(app.router.routes)
+    schema = client.get("/openapi.json", headers=headers)
+
+    shield.reconfigure(docs_url="/swagger", openapi_url="/api/schema.json")
+    # Same route objects, same order
+    assert all(a is b for a, b in zip(app.router.routes, routes)) and len(app.router.routes) == len(routes)
+
+    assert client.get("/docs", headers=headers).status_code == 404
+    response = client.get("/swagger", headers=headers)
+    assert response.status_code == 200
+    assert "/api/schema.json" in response.text
+    # The schema itself is not rebuilt
+    assert client.get("/api/schema.json", headers=headers).headers["etag"] == schema.headers["etag"]
+
+
+@pytest.mark.parametrize("mode", ["middleware", "mount"])
+def test_reconfigure_urls_in_asgi_modes(mode):
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"}, mode=mode)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    shield.reconfigure(redoc_url="/reference")
+    assert client.get("/redoc", headers=headers).status_code == 404
+    assert client.get("/reference", headers=headers).status_code == 200
+
+
+def test_reconfigure_drops_only_affected_caches():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    client.get("/docs", headers=headers)
+    client.get("/openapi.json", headers=headers)
+    schema = shield._schema_cache[None]
+
+    shield.reconfigure(custom_css="body { color: red; }")
+    assert shield._page_cache == {}
+    assert shield._schema_cache[None] is schema
+    assert "color: red" in client.get("/docs", headers=headers).text
+
+    page = shield._page_cache["/docs"]
+    shield.reconfigure(credentials={"other": "secret"})
+    assert shield._page_cache["/docs"] is page
+    assert shield._schema_cache[None] is schema
+    assert client.get("/docs", headers=headers).status_code == 401
+    assert client.get("/docs", headers=get_auth_header("other", "secret")).status_code == 200
+
+
+def test_reconfigure_drops_replaced_custom_assets():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"}, max_inline_custom_size=10)
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+
+    for colour in ["red", "green", "blue"]:
+        shield.reconfigure(custom_css=f"body {{ color: {colour}; }}", custom_js=f"console.log('{colour}');")
+    assert len(shield.static_handler.content_assets) == 2
+    assert client.get(shield.custom_css_url, headers=headers).text == "body { color: blue; }"
+
+    shield.reconfigure(custom_css=None, custom_js=None)
+    assert shield.static_handler.content_assets == {}
+
+
+def test_reconfigure_reinstalls_for_mode():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+    shield.reconfigure(mode="mount")
+
+    assert app.state.docshield is shield
+    assert "/docs" not in route_paths(app)
+    client = TestClient(app)
+    assert client.get("/docs", headers=get_auth_header("admin", "password123")).status_code == 200
+
+
+def test_reconfigure_middleware_mode_after_start():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"}, mode="middleware")
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    assert client.get("/docs", headers=headers).status_code == 200
+
+    # The running middleware is reused rather than added again
+    shield.reconfigure(schema_search=True)
+    assert app.state.docshield is shield
+    assert client.get("/docs", headers=headers).status_code == 200
+    assert client.get("/openapi.json/search", params={"q": "items"}, headers=headers).status_code == 200
+
+    other = DocShield(app=app, credentials={"other": "secret"}, mode="middleware")
+    assert app.state.docshield is other
+    assert client.get("/docs", headers=headers).status_code == 401
+    assert client.get("/docs", headers=get_auth_header("other", "secret")).status_code == 200
+    assert client.get("/items").status_code == 200
+
+
+def test_switch_to_middleware_mode_after_start_fails_cleanly():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    headers = get_auth_header("admin", "password123")
+    assert client.get("/docs", headers=headers).status_code == 200
+
+    with pytest.raises(RuntimeError):
+        shield.reconfigure(mode="middleware")
+    # Nothing was uninstalled
+    assert app.state.docshield is shield
+    assert client.get("/docs", headers=headers).status_code == 200
+    assert client.get("/openapi.json", headers=headers).status_code == 200
+
+
+def test_reconfigure_rejects_invalid_settings():
+    app = create_app()
+    shield = DocShield(app=app, credentials={"admin": "password123"})
+
+    with pytest.raises(TypeError):
+        shield.reconfigure(colour="blue")
+    with pytest.raises(ValueError):
+        shield.reconfigure(credentials=None)
@@ -0,0 +1,79 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, DocRenderer, ElementsRenderer, RapiDocRenderer, ScalarRenderer
+import base64
+import pytest
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app(**kwargs):
+    """Create an app protected by DocShield with all alternative renderers."""
+    app = FastAPI(title="Renderers")
+    DocShield(
+        app=app,
+        credentials={"admin": "password123"},
+        renderers={
+            "/rapidoc": RapiDocRenderer({"theme": "dark", "allow-try": False}),
+            "/elements": ElementsRenderer(),
+            "/scalar": ScalarRenderer({"hideModels": True}),
+        },
+        **kwargs
+    )
+    return app
+
+
+def test_renderer_routes_protected():
+    """Test that renderer pages require authentication"""
+    client = TestClient(create_app())
+    for path in ("/rapidoc", "/elements", "/scalar"):
+        response = client.get(path)
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Basic"
+
+
+def test_rapidoc_served_from_local_assets():
+    """Test that RapiDoc loads its bundled asset and passes options through"""
+    client = TestClient(create_app())
+    response = client.get("/rapidoc", headers=get_auth_header("admin", "password123"))
+    assert response.status_code == 200
+    assert 'src="/docshield/static/rapidoc/rapidoc-min.js"' in response.text
+    assert 'spec-url="/openapi.json"' in response.text
+    assert 'theme="dark"' in response.text
+    assert 'allow-try="false"' in response.text
+
+    response = client.get("/docshield/static/rapidoc/rapidoc-min.js")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert client.get("/docshield/static/rapidoc/other.js").status_code == 404
+
+
+def test_renderers_without_local_files_use_cdn():
+    """Test that renderers fall back to CDN URLs when assets are not bundled"""
+    client = TestClient(create_app(use_cdn_fallback=False))
+    headers = get_auth_header("admin", "password123")
+
+    response = client.get("/rapidoc", headers=headers)
+    assert "cdn.jsdelivr.net/npm/rapidoc" in response.text
+
+    response = client.get("/elements", headers=headers)
+    assert "@stoplight/elements" in response.text
+    assert 'apiDescriptionUrl="/openapi.json"' in response.text
+
+    response = client.get("/scalar", headers=headers)
+    assert "@scalar/api-reference@1" in response.text
+    assert "hideModels" in response.text
+
+
+def test_renderer_must_implement_render():
+    """Test that a renderer without render() fails when it is created"""
+    class Incomplete(DocRenderer):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,107 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, SchemaView
+from fastapi_docshield.search import SearchIndex, tokenize
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def create_app(**kwargs):
+    app = FastAPI()
+
+    @app.get("/customers", tags=["customers"], summary="List customers", operation_id="listCustomers")
+    def list_customers(region: str = ""):
+        return []
+
+    @app.get("/customers/{customer_id}/invoices", tags=["billing"], operation_id="get_customer_invoices")
+    def get_customer_invoices(customer_id: int):
+        """Invoices issued to a customer."""
+        return []
+
+    @app.post("/orders", tags=["orders"], summary="Create order")
+    def create_order():
+        return {}
+
+    DocShield(app=app, credentials={"admin": "password123", "partner": "p4ss"}, **kwargs)
+    return app
+
+
+def test_tokenize():
+    assert tokenize("getUserByID") == ["get", "user", "by", "id"]
+    assert tokenize("/users/{user_id}/v2") == ["users", "user", "id", "v", "2"]
+
+
+def test_search_index_ranking():
+    client = TestClient(create_app())
+    schema = client.get("/openapi.json", headers=get_auth_header("admin", "password123")).json()
+    index = SearchIndex(schema)
+
+    results = index.search("customer invoices")
+    assert [result["operationId"] for result in results] == ["get_customer_invoices"]
+
+    # Operations matching in more fields rank higher
+    results = index.search("customers")
+    assert [result["path"] for result in results] == ["/customers", "/customers/{customer_id}/invoices"]
+    assert results[0]["score"] > results[1]["score"]
+
+    # Words are matched by prefix at a lower score
+    prefix_results = index.search("customer")
+    assert {result["path"] for result in prefix_results} == {result["path"] for result in results}
+    assert len(index.search("cust")) == 2
+
+    assert [result["method"] for result in index.search("region")] == ["GET"]
+    assert index.search("create")[0]["path"] == "/orders"
+    assert index.search("customers orders") == []
+    assert index.search("  ") == []
+    assert len(index.search("customers", limit=1)) == 1
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_search_endpoint(mode):
+    client = TestClient(create_app(schema_search=True, mode=mode))
+    headers = get_auth_header("admin", "password123")
+
+    response = client.get("/openapi.json/search", params={"q": "invoices"}, headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == "invoices"
+    assert [result["operationId"] for result in data["results"]] == ["get_customer_invoices"]
+
+    assert client.get("/openapi.json/search", params={"q": "invoices"}).status_code == 401
+    assert client.get("/openapi.json/search", params={"q": "x", "limit": "many"}, headers=headers).status_code == 400
+
+
+def test_search_follows_roles():
+    client = TestClient(create_app(
+        schema_search=True,
+        roles={"partner": SchemaView(tags=["customers"])},
+        user_roles={"partner": "partner"},
+    ))
+
+    response = client.get("/openapi.json/search", params={"q": "customer"}, headers=get_auth_header("partner", "p4ss"))
+    assert [result["path"] for result in response.json()["results"]] == ["/customers"]
+
+
+def test_search_box():
+    client = TestClient(create_app(search_box=True))
+    headers = get_auth_header("admin", "password123")
+
+    docs = client.get("/docs", headers=headers).text
+    assert 'id="docshield-search"' in docs
+    assert '"/openapi.json/search"' in docs
+    assert "layoutActions" in docs
+    redoc = client.get("/redoc", headers=headers).text
+    assert "'operation/'" in redoc
+    # search_box enables the endpoint
+    assert client.get("/openapi.json/search", params={"q": "orders"}, headers=headers).status_code == 200
+
+    plain = TestClient(create_app())
+    assert "docshield-search" not in plain.get("/docs", headers=headers).text
+    assert plain.get("/openapi.json/search", params={"q": "orders"}, headers=headers).status_code == 404
@@ -0,0 +1,130 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield
+from fastapi_docshield.session import SessionSigner
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+def test_signer_round_trip_and_tampering():
+    """Test that tokens verify, expire and reject tampering"""
+    signer = SessionSigner("secret", max_age=60)
+    token = signer.issue("admin")
+    assert signer.verify(token) == "admin"
+    assert signer.verify(token[:-2] + "xx") is None
+    assert signer.verify("garbage") is None
+    assert signer.verify(None) is None
+    assert SessionSigner("other-secret").verify(token) is None
+
+    expired = SessionSigner("secret", max_age=-1).issue("admin")
+    assert signer.verify(expired) is None
+
+
+def test_session_cookie_skips_credential_check():
+    """Test that a login issues a cookie that authenticates later requests"""
+    app = FastAPI()
+    shield = DocShield(
+        app=app, credentials={"admin": "password123"}, session_cookie=True, session_secret="s3cret"
+    )
+    client = TestClient(app)
+
+    response = client.get("/docs", headers=get_auth_header("admin", "password123"))
+    assert response.status_code == 200
+    set_cookie = response.headers["set-cookie"]
+    assert "docshield_session=" in set_cookie
+    assert "HttpOnly" in set_cookie
+
+    # The cookie alone is enough
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert "set-cookie" not in response.headers
+
+    client.cookies.clear()
+    assert client.get("/openapi.json").status_code == 401
+
+
+def test_session_ends_when_credential_changes():
+    """Test that a session is bound to the credential it was issued for"""
+    app = FastAPI()
+    shield = DocShield(app=app, credentials={"admin": "password123"}, session_cookie=True)
+    client = TestClient(app)
+    client.get("/docs", headers=get_auth_header("admin", "password123"))
+    assert client.get("/openapi.json").status_code == 200
+
+    shield.credentials["admin"] = "changed"
+    assert client.get("/openapi.json").status_code == 401
+
+    shield.credentials["admin"] = "password123"
+    assert client.get("/openapi.json").status_code == 200
+    del shield.credentials["admin"]
+    assert client.get("/openapi.json").status_code == 401
+
+    signer = SessionSigner("secret")
+    token = signer.issue("admin", "hash-1")
+    assert signer.verify(token, {"admin": "hash-1"}.get) == "admin"
+    assert signer.verify(token, {"admin": "hash-2"}.get) is None
+
+
+def test_session_cookie_scoped_to_docs_paths():
+    """Test that the cookie is set only for the documentation URLs"""
+    app = FastAPI()
+
+    @app.get("/items")
+    def items(request: Request):
+        return dict(request.cookies)
+
+    DocShield(
+        app=app,
+        credentials={"admin": "password123"},
+        session_cookie=True,
+        schema_search=True,
+        protect_static=True,
+    )
+    client = TestClient(app)
+    response = client.get("/docs", headers=get_auth_header("admin", "password123"))
+    paths = {
+        part.strip()[len("Path="):]
+        for header in response.headers.get_list("set-cookie")
+        for part in header.split(";")
+        if part.strip().startswith("Path=")
+    }
+    # /openapi.json/search is covered by the /openapi.json cookie
+    assert paths == {"/docs", "/redoc", "/openapi.json", "/docshield/static"}
+
+    assert client.get("/openapi.json/search?q=items").status_code == 200
+    assert client.get("/docshield/static/swagger-ui.css").status_code == 200
+    assert client.get("/items").json() == {}
+
+
+def test_protect_static_assets():
+    """Test that protect_static requires a session or credentials for assets"""
+    app = FastAPI()
+    DocShield(
+        app=app, credentials={"admin": "password123"}, session_cookie=True, protect_static=True
+    )
+    client = TestClient(app)
+
+    response = client.get("/docshield/static/swagger-ui.css")
+    assert response.status_code == 401
+    response = client.get("/docshield/static/fonts/fonts.css")
+    assert response.status_code == 401
+
+    client.get("/docs", headers=get_auth_header("admin", "password123"))
+    response = client.get("/docshield/static/swagger-ui.css")
+    assert response.status_code == 200
+    assert response.headers["cache-control"].startswith("private")
+
+
+def test_static_assets_public_by_default():
+    """Test that static assets stay public without protect_static"""
+    app = FastAPI()
+    DocShield(app=app, credentials={"admin": "password123"}, session_cookie=True)
+    response = TestClient(app).get("/docshield/static/swagger-ui.css")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=3600"
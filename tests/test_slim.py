@@ -0,0 +1,172 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, SchemaView
+from fastapi_docshield.slim import slim_schema, wants_lite
+from pydantic import BaseModel, Field
+from typing import List
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+class Product(BaseModel):
+    """A product in the catalogue, described at length for human readers."""
+
+    name: str = Field(description="Display name", examples=["Widget"])
+    description: str = Field(default="", description="Marketing copy")
+
+
+def create_app(**kwargs):
+    app = FastAPI()
+
+    @app.get("/products", tags=["products"], response_model=List[Product])
+    def list_products():
+        """Lists every product, with a long explanation of paging and filtering."""
+        return []
+
+    @app.post("/products", tags=["products"], response_model=Product)
+    def create_product(product: Product):
+        """Creates a product."""
+        return product
+
+    DocShield(app=app, credentials={"admin": "password123", "partner": "p4ss"}, lite_schema=True, **kwargs)
+    return app
+
+
+def test_slim_schema_strips_annotations():
+    schema = {
+        "openapi": "3.1.0",
+        "info": {"title": "API", "version": "1", "description": "Long text"},
+        "paths": {
+            "/a": {
+                "get": {
+                    "description": "Operation text",
+                    "parameters": [{"name": "q", "in": "query", "description": "Query", "schema": {"type": "string"}}],
+                    "responses": {"200": {"description": "OK", "content": {"application/json": {"example": {"a": 1}}}}},
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Item": {
+                    "type": "object",
+                    "description": "An item",
+                    "properties": {"description": {"type": "string", "description": "Item text"}},
+                }
+            }
+        },
+    }
+    slim = slim_schema(schema)
+
+    assert "description" not in slim["info"]
+    operation = slim["paths"]["/a"]["get"]
+    assert "description" not in operation
+    assert "description" not in operation["parameters"][0]
+    # Response descriptions are required by OpenAPI
+    assert operation["responses"]["200"] == {"description": "OK", "content": {"application/json": {}}}
+    # A property called "description" is kept, its own description is not
+    assert slim["components"]["schemas"]["Item"] == {
+        "type": "object",
+        "properties": {"description": {"type": "string"}},
+    }
+    # The input is not modified
+    assert schema["info"]["description"] == "Long text"
+
+
+def test_slim_schema_hoists_repeated_inline_schemas():
+    inline = {
+        "type": "object",
+        "title": "Point",
+        "properties": {"x": {"type": "number"}, "y": {"type": "number"}},
+    }
+    named = {"type": "array", "items": {"type": "string", "maxLength": 64}, "title": "Names", "maxItems": 100}
+    schema = {
+        "openapi": "3.1.0",
+        "info": {"title": "API", "version": "1"},
+        "paths": {
+            "/a": {"get": {"responses": {"200": {"description": "OK", "content": {
+                "application/json": {"schema": inline}}}}}},
+            "/b": {"get": {"responses": {"200": {"description": "OK", "content": {
+                "application/json": {"schema": {"type": "array", "items": inline}}}}}}},
+            "/c": {"get": {"responses": {"200": {"description": "OK", "content": {
+                "application/json": {"schema": named}}}}}},
+        },
+        "components": {"schemas": {"Names": named}},
+    }
+    slim = slim_schema(schema)
+
+    def response_schema(path):
+        return slim["paths"][path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+
+    assert response_schema("/a") == {"$ref": "#/components/schemas/Point"}
+    assert response_schema("/b")["items"] == {"$ref": "#/components/schemas/Point"}
+    assert slim["components"]["schemas"]["Point"] == inline
+    # Inline copies of a named schema refer to it
+    assert response_schema("/c") == {"$ref": "#/components/schemas/Names"}
+    assert slim["components"]["schemas"]["Names"] == named
+
+
+def test_wants_lite():
+    assert wants_lite("1", None)
+    assert wants_lite("", None)
+    assert not wants_lite("false", 'application/json; profile="lite"')
+    assert wants_lite(None, 'text/html, application/json; profile="lite"')
+    assert wants_lite(None, "application/json;profile=lite")
+    assert not wants_lite(None, "application/json")
+    assert not wants_lite(None, None)
+
+
+@pytest.mark.parametrize("mode", ["routes", "middleware", "mount"])
+def test_lite_schema_endpoint(mode):
+    client = TestClient(create_app(mode=mode))
+    headers = get_auth_header("admin", "password123")
+
+    full = client.get("/openapi.json", headers=headers)
+    lite = client.get("/openapi.json", params={"lite": "1"}, headers=headers)
+    assert full.status_code == lite.status_code == 200
+    assert len(lite.content) < len(full.content)
+    assert lite.headers["etag"] != full.headers["etag"]
+    assert lite.headers["vary"] == full.headers["vary"] == "Accept, Accept-Encoding"
+
+    schema = lite.json()
+    assert "description" not in schema["paths"]["/products"]["get"]
+    assert set(schema["components"]["schemas"]["Product"]["properties"]) == {"name", "description"}
+    assert "Marketing copy" in full.text
+
+    by_accept = client.get("/openapi.json", headers={**headers, "Accept": 'application/json; profile="lite"'})
+    assert by_accept.content == lite.content
+
+    cached = client.get("/openapi.json?lite=1", headers={**headers, "If-None-Match": lite.headers["etag"]})
+    assert cached.status_code == 304
+    assert client.get("/openapi.json", params={"lite": "1"}).status_code == 401
+
+
+def test_lite_schema_follows_roles():
+    client = TestClient(create_app(
+        roles={"partner": SchemaView(operations=["list_products_products_get"])},
+        user_roles={"partner": "partner"},
+    ))
+
+    schema = client.get("/openapi.json?lite=1", headers=get_auth_header("partner", "p4ss")).json()
+    assert list(schema["paths"]["/products"]) == ["get"]
+
+
+def test_lite_schema_disabled_by_default():
+    app = FastAPI()
+
+    @app.get("/items")
+    def items():
+        """Item listing."""
+        return []
+
+    DocShield(app=app, credentials={"admin": "password123"})
+    client = TestClient(app)
+    response = client.get("/openapi.json?lite=1", headers=get_auth_header("admin", "password123"))
+    assert response.json()["paths"]["/items"]["get"]["description"] == "Item listing."
+    assert response.headers["vary"] == "Accept-Encoding"
@@ -0,0 +1,152 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_docshield import DocShield, SchemaView
+from pydantic import BaseModel
+from typing import List
+import base64
+
+
+def get_auth_header(username, password):
+    """Create HTTP Basic Auth header for testing."""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return {"Authorization": f"Basic {encoded}"}
+
+
+class Address(BaseModel):
+    city: str
+
+
+class Customer(BaseModel):
+    name: str
+    addresses: List[Address]
+
+
+class Invoice(BaseModel):
+    total: float
+
+
+def create_app(**kwargs):
+    app = FastAPI(openapi_tags=[{"name": "public"}, {"name": "internal"}])
+
+    @app.get("/public/customers", tags=["public"], response_model=List[Customer])
+    def list_customers():
+        return []
+
+    @app.get("/internal/invoices", tags=["internal"], response_model=Invoice)
+    def get_invoice():
+        return {"total": 1.0}
+
+    @app.post("/internal/reindex", tags=["internal"], operation_id="reindex")
+    def reindex():
+        return {}
+
+    DocShield(
+        app=app,
+        credentials={"partner": "p", "engineer": "e", "ops": "o"},
+        roles={
+            "partner": SchemaView(tags=["public"]),
+            "ops": SchemaView(paths=["/public/*"], operations=["reindex"]),
+        },
+        user_roles={"partner": "partner", "ops": "ops"},
+        **kwargs,
+    )
+    return app
+
+
+def test_schema_view_filters_and_prunes():
+    """Test a view keeps matching operations, their tags and referenced components"""
+    schema = create_app().openapi()
+
+    view = SchemaView(tags=["public"]).apply(schema)
+    assert list(view["paths"]) == ["/public/customers"]
+    assert [tag["name"] for tag in view["tags"]] == ["public"]
+    # Address is only reachable through Customer
+    assert set(view["components"]["schemas"]) == {"Address", "Customer"}
+    assert "Invoice" in schema["components"]["schemas"]
+
+    everything = SchemaView().apply(schema)
+    assert everything["paths"] == schema["paths"]
+
+
+def test_role_specific_schemas():
+    """Test each role gets its own filtered schema and ETag"""
+    client = TestClient(create_app())
+
+    partner = client.get("/openapi.json", headers=get_auth_header("partner", "p"))
+    engineer = client.get("/openapi.json", headers=get_auth_header("engineer", "e"))
+    ops = client.get("/openapi.json", headers=get_auth_header("ops", "o"))
+
+    assert list(partner.json()["paths"]) == ["/public/customers"]
+    assert set(engineer.json()["paths"]) == {"/public/customers", "/internal/invoices", "/internal/reindex"}
+    assert set(ops.json()["paths"]) == {"/public/customers", "/internal/reindex"}
+    assert "Invoice" not in partner.json()["components"]["schemas"]
+    assert len({partner.headers["etag"], engineer.headers["etag"], ops.headers["etag"]}) == 3
+
+    # The partner's ETag does not validate the engineer's view
+    response = client.get(
+        "/openapi.json",
+        headers={**get_auth_header("engineer", "e"), "If-None-Match": partner.headers["etag"]},
+    )
+    assert response.status_code == 200
+    response = client.get(
+        "/openapi.json",
+        headers={**get_auth_header("partner", "p"), "If-None-Match": partner.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("mode", ["middleware", "mount"])
+def test_role_schemas_in_asgi_modes(mode):
+    """Test role filtering also applies without per-URL routes"""
+    client = TestClient(create_app(mode=mode))
+    partner = client.get("/openapi.json", headers=get_auth_header("partner", "p"))
+    assert list(partner.json()["paths"]) == ["/public/customers"]
+
+
+def test_schema_view_filters_webhooks():
+    """Test webhooks follow the view's rules and their components are pruned"""
+    app = FastAPI()
+
+    @app.get("/public/customers", tags=["public"], response_model=List[Customer])
+    def list_customers():
+        return []
+
+    @app.webhooks.post("customer-created", tags=["public"])
+    def customer_created(body: Customer):
+        """Sent when a customer signs up."""
+
+    @app.webhooks.post("invoice-paid", tags=["internal"])
+    def invoice_paid(body: Invoice):
+        """Sent when an invoice is paid."""
+
+    schema = app.openapi()
+    assert set(schema["webhooks"]) == {"customer-created", "invoice-paid"}
+
+    view = SchemaView(tags=["public"]).apply(schema)
+    assert list(view["webhooks"]) == ["customer-created"]
+    assert "Invoice" not in view["components"]["schemas"]
+    assert "Customer" in view["components"]["schemas"]
+
+    hidden = SchemaView(operations=["list_customers_public_customers_get"]).apply(schema)
+    assert "webhooks" not in hidden
+    assert "Invoice" not in hidden["components"]["schemas"]
+
+
+def test_default_role_for_users_without_role():
+    """Test users missing from user_roles get default_role instead of the full schema"""
+    client = TestClient(create_app(default_role="partner"))
+
+    engineer = client.get("/openapi.json", headers=get_auth_header("engineer", "e"))
+    assert list(engineer.json()["paths"]) == ["/public/customers"]
+    ops = client.get("/openapi.json", headers=get_auth_header("ops", "o"))
+    assert "/internal/reindex" in ops.json()["paths"]
+
+
+def test_undefined_role_rejected():
+    """Test user_roles must reference defined roles"""
+    with pytest.raises(ValueError):
+        DocShield(app=FastAPI(), credentials={"a": "b"}, user_roles={"a": "missing"})
+    with pytest.raises(ValueError):
+        DocShield(app=FastAPI(), credentials={"a": "b"}, default_role="missing")